@@ -1,24 +1,58 @@
 """Customer service orchestration agents, catalog agent, and pre-purchase agent."""
 
-from intent_engine.agents.catalog_agent import (
-    CatalogAgentDeps,
-    CatalogAgentOutput,
-    get_catalog_agent,
-    get_catalog_provider_from_settings,
-)
-from intent_engine.agents.models import (
-    AgentAction,
-    AgentResponse,
-    ConversationContext,
-    CustomerMessage,
-)
-from intent_engine.agents.orchestrator import CustomerServiceAgent
-from intent_engine.agents.pre_purchase_agent import (
-    PrePurchaseDeps,
-    PrePurchaseOutput,
-    get_pre_purchase_agent,
-)
-from intent_engine.agents.router import LifecycleRouter
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from intent_engine.agents.catalog_agent import (
+        CatalogAgentDeps,
+        CatalogAgentOutput,
+        close_catalog_providers,
+        get_catalog_agent,
+        get_catalog_provider_from_settings,
+        get_default_catalog_agent,
+    )
+    from intent_engine.agents.models import (
+        AgentAction,
+        AgentResponse,
+        ConversationContext,
+        CustomerMessage,
+    )
+    from intent_engine.agents.orchestrator import CustomerServiceAgent
+    from intent_engine.agents.pre_purchase_agent import (
+        PrePurchaseDeps,
+        PrePurchaseOutput,
+        get_pre_purchase_agent,
+    )
+    from intent_engine.agents.router import LifecycleRouter
+
+# Lazy imports: the orchestrator pulls in the engine (and spaCy), so importing a
+# light submodule such as agents.response_generator must not load it eagerly
+_EXPORTS = {
+    "AgentAction": "intent_engine.agents.models",
+    "AgentResponse": "intent_engine.agents.models",
+    "CatalogAgentDeps": "intent_engine.agents.catalog_agent",
+    "CatalogAgentOutput": "intent_engine.agents.catalog_agent",
+    "ConversationContext": "intent_engine.agents.models",
+    "CustomerMessage": "intent_engine.agents.models",
+    "CustomerServiceAgent": "intent_engine.agents.orchestrator",
+    "LifecycleRouter": "intent_engine.agents.router",
+    "PrePurchaseDeps": "intent_engine.agents.pre_purchase_agent",
+    "PrePurchaseOutput": "intent_engine.agents.pre_purchase_agent",
+    "close_catalog_providers": "intent_engine.agents.catalog_agent",
+    "get_catalog_agent": "intent_engine.agents.catalog_agent",
+    "get_catalog_provider_from_settings": "intent_engine.agents.catalog_agent",
+    "get_default_catalog_agent": "intent_engine.agents.catalog_agent",
+    "get_pre_purchase_agent": "intent_engine.agents.pre_purchase_agent",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name), name)
+
 
 __all__ = [
     "AgentAction",
@@ -31,7 +65,9 @@ __all__ = [
     "LifecycleRouter",
     "PrePurchaseDeps",
     "PrePurchaseOutput",
+    "close_catalog_providers",
     "get_catalog_agent",
     "get_catalog_provider_from_settings",
+    "get_default_catalog_agent",
     "get_pre_purchase_agent",
 ]
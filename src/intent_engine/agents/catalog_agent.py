@@ -1,18 +1,20 @@
 """Product catalog agent: tools over CatalogProvider for search and product details."""
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.settings import ModelSettings
 
+from intent_engine.config import Settings, get_settings
+from intent_engine.integrations.adobe_commerce.catalog import (
+    AdobeCommerceOptimizerCatalogProvider,
+)
 from intent_engine.integrations.base import CatalogProvider
+from intent_engine.integrations.shopify.catalog import ShopifyCatalogProvider
 from intent_engine.models.catalog import CatalogProduct, InventoryInfo
 
-if TYPE_CHECKING:
-    from intent_engine.config import Settings
-
 
 @dataclass
 class CatalogAgentDeps:
@@ -145,6 +147,18 @@ def get_catalog_agent(
     return agent
 
 
+# Singleton agent instance
+_catalog_agent: Agent[CatalogAgentDeps, CatalogAgentOutput] | None = None
+
+
+def get_default_catalog_agent() -> Agent[CatalogAgentDeps, CatalogAgentOutput]:
+    """Get or create the default catalog agent."""
+    global _catalog_agent
+    if _catalog_agent is None:
+        _catalog_agent = get_catalog_agent()
+    return _catalog_agent
+
+
 def _product_to_dict(p: CatalogProduct) -> dict[str, Any]:
     """Convert CatalogProduct to a JSON-serializable dict for tool return."""
     return {
@@ -163,9 +177,16 @@ def _product_to_dict(p: CatalogProduct) -> dict[str, Any]:
     }
 
 
-def get_catalog_provider_from_settings(settings: "Settings | None" = None) -> CatalogProvider | None:
+# Providers own HTTP clients, so one instance is shared per distinct configuration
+_catalog_providers: dict[tuple[str, ...], CatalogProvider] = {}
+
+
+def get_catalog_provider_from_settings(settings: Settings | None = None) -> CatalogProvider | None:
     """
-    Build a CatalogProvider from application settings.
+    Get a CatalogProvider for application settings.
+
+    Providers are cached per configuration, so repeated calls with the same
+    credentials reuse one instance (and its connection pool).
 
     Returns:
         ShopifyCatalogProvider if Shopify credentials are set;
@@ -173,27 +194,52 @@ def get_catalog_provider_from_settings(settings: "Settings | None" = None) -> Ca
         else None.
     """
     if settings is None:
-        from intent_engine.config import get_settings
         settings = get_settings()
     if settings.shopify_store_domain and settings.shopify_access_token:
-        from intent_engine.integrations.shopify import ShopifyCatalogProvider
-        return ShopifyCatalogProvider(
-            store_domain=settings.shopify_store_domain,
-            access_token=settings.shopify_access_token,
+        key: tuple[str, ...] = (
+            "shopify",
+            settings.shopify_store_domain,
+            settings.shopify_access_token,
         )
+        provider = _catalog_providers.get(key)
+        if provider is None:
+            provider = ShopifyCatalogProvider(
+                store_domain=settings.shopify_store_domain,
+                access_token=settings.shopify_access_token,
+            )
+            _catalog_providers[key] = provider
+        return provider
     if (
         settings.adobe_commerce_optimizer_tenant_id
         and settings.adobe_commerce_optimizer_catalog_view_id
     ):
-        from intent_engine.integrations.adobe_commerce.catalog import (
-            AdobeCommerceOptimizerCatalogProvider,
-        )
-        return AdobeCommerceOptimizerCatalogProvider(
-            tenant_id=settings.adobe_commerce_optimizer_tenant_id,
-            catalog_view_id=settings.adobe_commerce_optimizer_catalog_view_id,
-            locale=settings.adobe_commerce_optimizer_locale,
-            region=settings.adobe_commerce_optimizer_region,
-            environment=settings.adobe_commerce_optimizer_environment,
-            price_book_id=settings.adobe_commerce_optimizer_price_book_id or None,
+        key = (
+            "adobe_commerce",
+            settings.adobe_commerce_optimizer_tenant_id,
+            settings.adobe_commerce_optimizer_catalog_view_id,
+            settings.adobe_commerce_optimizer_locale,
+            settings.adobe_commerce_optimizer_region,
+            settings.adobe_commerce_optimizer_environment,
+            settings.adobe_commerce_optimizer_price_book_id,
         )
+        provider = _catalog_providers.get(key)
+        if provider is None:
+            provider = AdobeCommerceOptimizerCatalogProvider(
+                tenant_id=settings.adobe_commerce_optimizer_tenant_id,
+                catalog_view_id=settings.adobe_commerce_optimizer_catalog_view_id,
+                locale=settings.adobe_commerce_optimizer_locale,
+                region=settings.adobe_commerce_optimizer_region,
+                environment=settings.adobe_commerce_optimizer_environment,
+                price_book_id=settings.adobe_commerce_optimizer_price_book_id or None,
+            )
+            _catalog_providers[key] = provider
+        return provider
     return None
+
+
+async def close_catalog_providers() -> None:
+    """Close all cached catalog providers and clear the cache."""
+    providers = list(_catalog_providers.values())
+    _catalog_providers.clear()
+    for provider in providers:
+        await provider.close()
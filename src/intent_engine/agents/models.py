@@ -70,6 +70,11 @@ class CustomerMessage(BaseModel):
     order_ids: list[str] = Field(default_factory=list, description="Known order IDs for context")
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
+    @property
+    def normalized_text(self) -> str:
+        """Lowercased text with whitespace collapsed, always derived from the current text."""
+        return " ".join(self.text.lower().split())
+
     model_config = {
         "json_schema_extra": {
             "examples": [
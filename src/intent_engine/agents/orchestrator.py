@@ -1,5 +1,6 @@
 """Customer service orchestration agent."""
 
+import asyncio
 import logging
 import time
 from typing import Any
@@ -355,35 +356,55 @@ class CustomerServiceAgent:
         customer_email: str | None,
         platform: str | None,
     ) -> tuple[OrderContext | None, CustomerProfile | None]:
-        """Fetch order and customer context from platform."""
+        """Fetch order and customer context from platform.
+
+        The two lookups are independent, so they run concurrently and the
+        latency is the slower of the two round trips rather than their sum.
+        """
         connector = self.get_connector(platform)
         if not connector:
             return None, None
 
-        order_context = None
-        customer_context = None
-
-        # Fetch order context
-        if order_ids:
-            order_id = order_ids[0]  # Use first order ID
-            try:
-                if hasattr(connector, "get_order_context_by_number"):
-                    order_context = await connector.get_order_context_by_number(order_id)
-                if not order_context and hasattr(connector, "get_order_context"):
-                    order_context = await connector.get_order_context(order_id)
-            except Exception as e:
-                logger.warning(f"Failed to fetch order context: {e}")
-
-        # Fetch customer context
-        if customer_email:
-            try:
-                if hasattr(connector, "get_customer_by_email"):
-                    customer_context = await connector.get_customer_by_email(customer_email)
-            except Exception as e:
-                logger.warning(f"Failed to fetch customer context: {e}")
-
+        order_context, customer_context = await asyncio.gather(
+            self._fetch_order_context(connector, order_ids),
+            self._fetch_customer_context(connector, customer_email),
+        )
         return order_context, customer_context
 
+    async def _fetch_order_context(
+        self,
+        connector: PlatformConnector,
+        order_ids: list[str],
+    ) -> OrderContext | None:
+        """Fetch order context for the first known order ID."""
+        if not order_ids:
+            return None
+        order_id = order_ids[0]  # Use first order ID
+        order_context = None
+        try:
+            if hasattr(connector, "get_order_context_by_number"):
+                order_context = await connector.get_order_context_by_number(order_id)
+            if not order_context and hasattr(connector, "get_order_context"):
+                order_context = await connector.get_order_context(order_id)
+        except Exception as e:
+            logger.warning(f"Failed to fetch order context: {e}")
+        return order_context
+
+    async def _fetch_customer_context(
+        self,
+        connector: PlatformConnector,
+        customer_email: str | None,
+    ) -> CustomerProfile | None:
+        """Fetch the customer profile by email."""
+        if not customer_email:
+            return None
+        try:
+            if hasattr(connector, "get_customer_by_email"):
+                return await connector.get_customer_by_email(customer_email)
+        except Exception as e:
+            logger.warning(f"Failed to fetch customer context: {e}")
+        return None
+
     def _determine_actions(
         self,
         intent_result: dict[str, Any],
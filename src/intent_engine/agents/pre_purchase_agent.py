@@ -9,7 +9,7 @@ from pydantic_ai.settings import ModelSettings
 
 from intent_engine.agents.catalog_agent import (
     CatalogAgentDeps,
-    get_catalog_agent,
+    get_default_catalog_agent,
 )
 from intent_engine.engine import IntentEngine
 from intent_engine.models.request import InputChannel, IntentRequest
@@ -117,7 +117,7 @@ def get_pre_purchase_agent(
                 "reply_snippet": "Product catalog is not available right now. Please try again later or contact support.",
                 "total_found": 0,
             }
-        catalog_agent = get_catalog_agent()
+        catalog_agent = get_default_catalog_agent()
         deps = CatalogAgentDeps(catalog=catalog_provider)
         result = await catalog_agent.run(message, deps=deps, usage=ctx.usage)
         out = result.output
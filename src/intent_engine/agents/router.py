@@ -2,6 +2,8 @@
 
 import logging
 import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from intent_engine.agents.catalog_agent import get_catalog_provider_from_settings
@@ -13,7 +15,7 @@ from intent_engine.models.request import InputChannel, IntentRequest
 logger = logging.getLogger(__name__)
 
 # Intent categories that are handled by the pre-purchase agent
-PRE_PURCHASE_CATEGORIES = frozenset({"PRODUCT_INQUIRY", "DISCOVERY"})
+PRE_PURCHASE_CATEGORIES: frozenset[str] = frozenset({"PRODUCT_INQUIRY", "DISCOVERY"})
 
 
 class LifecycleRouter:
@@ -22,19 +24,60 @@ class LifecycleRouter:
 
     Classifies intent first; if primary intent is PRODUCT_INQUIRY or DISCOVERY,
     delegates to PrePurchaseAgent. Otherwise uses CustomerServiceAgent (post-purchase).
+
+    The routing category is cached per normalized message text (LRU with TTL),
+    so repeated messages such as "Where is my order?" skip intent resolution.
     """
 
+    DEFAULT_ROUTE_CACHE_SIZE = 1024
+    DEFAULT_ROUTE_CACHE_TTL = 300  # 5 minutes
+
     def __init__(
         self,
         intent_engine: IntentEngine,
         customer_service_agent: Any,  # CustomerServiceAgent
         catalog_provider: Any = None,  # CatalogProvider | None
+        route_cache_size: int = DEFAULT_ROUTE_CACHE_SIZE,
+        route_cache_ttl: float = DEFAULT_ROUTE_CACHE_TTL,
     ) -> None:
         self.intent_engine = intent_engine
         self.customer_service_agent = customer_service_agent
         self._catalog_provider = catalog_provider
         self._pre_purchase_agent = get_pre_purchase_agent()
         self._pre_purchase_deps: PrePurchaseDeps | None = None
+        self.route_cache_size = route_cache_size
+        self.route_cache_ttl = route_cache_ttl
+        # normalized text -> (primary category, expires_at)
+        self._route_cache: OrderedDict[str, tuple[str | None, float]] = OrderedDict()
+        # category -> handler; anything not listed goes to the post-purchase agent
+        self._handlers: dict[str, Callable[[CustomerMessage, float], Awaitable[AgentResponse]]] = {
+            category: self._handle_pre_purchase for category in PRE_PURCHASE_CATEGORIES
+        }
+
+    def _get_cached_category(self, key: str) -> tuple[bool, str | None]:
+        """Look up a cached routing category. Returns (hit, category)."""
+        entry = self._route_cache.get(key)
+        if entry is None:
+            return False, None
+        category, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._route_cache[key]
+            return False, None
+        self._route_cache.move_to_end(key)
+        return True, category
+
+    def _cache_category(self, key: str, category: str | None) -> None:
+        """Store a routing category, evicting the least recently used entry."""
+        if self.route_cache_size <= 0:
+            return
+        self._route_cache[key] = (category, time.monotonic() + self.route_cache_ttl)
+        self._route_cache.move_to_end(key)
+        while len(self._route_cache) > self.route_cache_size:
+            self._route_cache.popitem(last=False)
+
+    def clear_route_cache(self) -> None:
+        """Drop all cached routing decisions (e.g. after the intent catalog changes)."""
+        self._route_cache.clear()
 
     def _get_pre_purchase_deps(self) -> PrePurchaseDeps:
         if self._pre_purchase_deps is None:
@@ -57,27 +100,33 @@ class LifecycleRouter:
         start_time = time.time()
         if self.intent_engine is None:
             return await self._run_post_purchase(message, start_time)
-        request = IntentRequest(
-            request_id=message.message_id,
-            tenant_id="router",
-            channel=InputChannel(message.channel) if message.channel in ("chat", "email", "voice") else InputChannel.CHAT,
-            raw_text=message.text,
-            customer_id=message.customer_id,
-            order_ids=message.order_ids,
-        )
-        result = await self.intent_engine.resolve(request)
-        primary = result.resolved_intents[0] if result.resolved_intents else None
-        category = primary.category if primary else None
-
-        if category in PRE_PURCHASE_CATEGORIES:
-            try:
-                response = await self._run_pre_purchase(message)
-                response.processing_time_ms = int((time.time() - start_time) * 1000)
-                return response
-            except Exception as e:
-                logger.warning("Pre-purchase agent failed, falling back to customer service: %s", e)
-                # Fall through to post-purchase agent
+        cache_key = message.normalized_text
+        hit, category = self._get_cached_category(cache_key)
+        if not hit:
+            request = IntentRequest(
+                request_id=message.message_id,
+                tenant_id="router",
+                channel=InputChannel(message.channel) if message.channel in ("chat", "email", "voice") else InputChannel.CHAT,
+                raw_text=message.text,
+                customer_id=message.customer_id,
+                order_ids=message.order_ids,
+            )
+            result = await self.intent_engine.resolve(request)
+            primary = result.resolved_intents[0] if result.resolved_intents else None
+            category = primary.category if primary else None
+            self._cache_category(cache_key, category)
+
+        handler = self._handlers.get(category, self._run_post_purchase) if category else self._run_post_purchase
+        return await handler(message, start_time)
 
+    async def _handle_pre_purchase(self, message: CustomerMessage, start_time: float) -> AgentResponse:
+        """Run the pre-purchase agent, falling back to customer service on failure."""
+        try:
+            response = await self._run_pre_purchase(message)
+            response.processing_time_ms = int((time.time() - start_time) * 1000)
+            return response
+        except Exception as e:
+            logger.warning("Pre-purchase agent failed, falling back to customer service: %s", e)
         return await self._run_post_purchase(message, start_time)
 
     async def _run_pre_purchase(self, message: CustomerMessage) -> AgentResponse:
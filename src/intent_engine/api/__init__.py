@@ -1,5 +1,19 @@
 """FastAPI application module."""
 
-from intent_engine.api.server import app
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from intent_engine.api.server import app
+
+# Lazy import: the server pulls in the engine (and spaCy), so importing a light
+# submodule such as api.websocket or api.ws_models must not build the app
+
+
+def __getattr__(name: str) -> Any:
+    if name == "app":
+        return import_module("intent_engine.api.server").app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["app"]
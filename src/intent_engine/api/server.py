@@ -8,6 +8,7 @@ import redis.asyncio as redis
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from intent_engine.agents.catalog_agent import close_catalog_providers
 from intent_engine.api.a2a_routes import a2a_router
 from intent_engine.api.agent_routes import router as agent_router
 from intent_engine.api.middleware import RequestLoggingMiddleware, SecurityHeadersMiddleware
@@ -222,6 +223,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         await _engine.shutdown()
         logger.info("Intent Engine shutdown complete")
 
+    # Close cached catalog providers (HTTP connection pools)
+    await close_catalog_providers()
+
     # Close Redis
     if _redis_client:
         await _redis_client.aclose()
@@ -46,10 +46,13 @@ class ConnectionManager:
     def __init__(self) -> None:
         # Active connections: tenant_id -> {connection_id -> WebSocket}
         self._connections: dict[str, dict[str, WebSocket]] = {}
-        # Connection info: connection_id -> TenantConfig
-        self._tenants: dict[str, TenantConfig] = {}
+        # Hot per-connection fields: connection_id -> (tenant_id, WebSocket), so a
+        # send resolves its socket with one probe and never touches TenantConfig
+        self._routes: dict[str, tuple[str, WebSocket]] = {}
         # Job subscriptions: job_id -> {connection_id}
         self._job_subscriptions: dict[str, set[str]] = {}
+        # Reverse index: connection_id -> {job_id}, so disconnect skips unrelated jobs
+        self._connection_jobs: dict[str, set[str]] = {}
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
 
@@ -90,7 +93,7 @@ class ConnectionManager:
             # Generate connection ID and store
             connection_id = str(uuid.uuid4())
             self._connections[tenant_id][connection_id] = websocket
-            self._tenants[connection_id] = tenant
+            self._routes[connection_id] = (tenant_id, websocket)
 
             # Record metrics
             record_websocket_connection(tenant_id, delta=1)
@@ -110,19 +113,17 @@ class ConnectionManager:
             connection_id: The connection ID.
         """
         async with self._lock:
-            tenant = self._tenants.pop(connection_id, None)
-            if tenant:
-                tenant_id = tenant.tenant_id
+            route = self._routes.pop(connection_id, None)
+            if route:
+                tenant_id = route[0]
                 if tenant_id in self._connections:
                     self._connections[tenant_id].pop(connection_id, None)
                     if not self._connections[tenant_id]:
                         del self._connections[tenant_id]
 
-                # Remove from all job subscriptions
-                for job_id in list(self._job_subscriptions.keys()):
-                    self._job_subscriptions[job_id].discard(connection_id)
-                    if not self._job_subscriptions[job_id]:
-                        del self._job_subscriptions[job_id]
+                # Remove from the job subscriptions this connection holds
+                for job_id in self._connection_jobs.pop(connection_id, ()):
+                    self._discard_subscription(connection_id, job_id)
 
                 # Record metrics
                 record_websocket_connection(tenant_id, delta=-1)
@@ -135,15 +136,26 @@ class ConnectionManager:
             if job_id not in self._job_subscriptions:
                 self._job_subscriptions[job_id] = set()
             self._job_subscriptions[job_id].add(connection_id)
+            self._connection_jobs.setdefault(connection_id, set()).add(job_id)
             logger.debug(f"Connection {connection_id} subscribed to job {job_id}")
 
     async def unsubscribe_from_job(self, connection_id: str, job_id: str) -> None:
         """Unsubscribe a connection from job updates."""
         async with self._lock:
-            if job_id in self._job_subscriptions:
-                self._job_subscriptions[job_id].discard(connection_id)
-                if not self._job_subscriptions[job_id]:
-                    del self._job_subscriptions[job_id]
+            jobs = self._connection_jobs.get(connection_id)
+            if jobs is not None:
+                jobs.discard(job_id)
+                if not jobs:
+                    del self._connection_jobs[connection_id]
+            self._discard_subscription(connection_id, job_id)
+
+    def _discard_subscription(self, connection_id: str, job_id: str) -> None:
+        """Drop one job subscription, removing the job entry once it has no subscribers."""
+        subscribers = self._job_subscriptions.get(job_id)
+        if subscribers is not None:
+            subscribers.discard(connection_id)
+            if not subscribers:
+                del self._job_subscriptions[job_id]
 
     async def send_to_connection(
         self,
@@ -160,23 +172,22 @@ class ConnectionManager:
         Returns:
             True if sent successfully, False otherwise.
         """
-        tenant = self._tenants.get(connection_id)
-        if not tenant:
+        return await self._send_raw(connection_id, message.model_dump_json(), message.type.value)
+
+    async def _send_raw(self, connection_id: str, payload: str, message_type: str) -> bool:
+        """Send an already-serialized message, so fan-out paths encode it only once."""
+        route = self._routes.get(connection_id)
+        if not route:
             return False
 
-        tenant_id = tenant.tenant_id
-        connections = self._connections.get(tenant_id, {})
-        websocket = connections.get(connection_id)
-
-        if websocket:
-            try:
-                await websocket.send_text(message.model_dump_json())
-                record_websocket_message(tenant_id, "outbound", message.type.value)
-                return True
-            except Exception as e:
-                logger.warning(f"Failed to send to {connection_id}: {e}")
-                return False
-        return False
+        tenant_id, websocket = route
+        try:
+            await websocket.send_text(payload)
+            record_websocket_message(tenant_id, "outbound", message_type)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to send to {connection_id}: {e}")
+            return False
 
     async def broadcast_to_tenant(
         self,
@@ -194,14 +205,23 @@ class ConnectionManager:
             Number of connections that received the message.
         """
         connections = self._connections.get(tenant_id, {})
-        sent = 0
+        if not connections:
+            return 0
+
+        payload = message.model_dump_json()
+        targets = list(connections.items())
 
-        for connection_id, websocket in list(connections.items()):
-            try:
-                await websocket.send_text(message.model_dump_json())
+        # Send concurrently so one slow client doesn't delay the rest
+        results = await asyncio.gather(
+            *(websocket.send_text(payload) for _, websocket in targets),
+            return_exceptions=True,
+        )
+        sent = 0
+        for (connection_id, _), result in zip(targets, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to broadcast to {connection_id}: {result}")
+            else:
                 sent += 1
-            except Exception as e:
-                logger.warning(f"Failed to broadcast to {connection_id}: {e}")
 
         if sent > 0:
             record_websocket_message(tenant_id, "outbound", message.type.value)
@@ -241,12 +261,15 @@ class ConnectionManager:
             ).model_dump(),
         )
 
-        sent = 0
-        for connection_id in list(subscribers):
-            if await self.send_to_connection(connection_id, ws_message):
-                sent += 1
-
-        return sent
+        payload = ws_message.model_dump_json()
+        message_type = ws_message.type.value
+        results = await asyncio.gather(
+            *(
+                self._send_raw(connection_id, payload, message_type)
+                for connection_id in list(subscribers)
+            )
+        )
+        return sum(results)
 
     def get_connection_count(self, tenant_id: str | None = None) -> int:
         """Get current connection count."""
@@ -296,7 +319,7 @@ class StreamingReasoningCallback:
             request_id=self.request_id,
             payload=ReasoningStepPayload(
                 step_name=step.value,
-                description=STEP_DESCRIPTIONS.get(step, step.value),
+                description=STEP_DESCRIPTIONS[step],
                 duration_ms=duration_ms,
                 data=data or {},
             ).model_dump(),
@@ -1,7 +1,9 @@
 """WebSocket message models."""
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -110,7 +112,7 @@ class ReasoningStep(str, Enum):
 
 
 # Step descriptions for UI
-STEP_DESCRIPTIONS = {
+_STEP_DESCRIPTIONS: dict[ReasoningStep, str] = {
     ReasoningStep.ENTITY_EXTRACTION: "Extracting entities (orders, products, dates)...",
     ReasoningStep.SENTIMENT_ANALYSIS: "Analyzing customer sentiment...",
     ReasoningStep.EMBEDDING_GENERATION: "Generating semantic embeddings...",
@@ -123,3 +125,10 @@ STEP_DESCRIPTIONS = {
     ReasoningStep.REASONING_PATH: "Using reasoning path for complex resolution",
     ReasoningStep.COMPLETE: "Resolution complete",
 }
+
+# Fail at import rather than at stream time if a new step lacks a description
+_missing_steps = set(ReasoningStep) - _STEP_DESCRIPTIONS.keys()
+if _missing_steps:
+    raise RuntimeError(f"STEP_DESCRIPTIONS missing: {sorted(_missing_steps)}")
+
+STEP_DESCRIPTIONS: Mapping[ReasoningStep, str] = MappingProxyType(_STEP_DESCRIPTIONS)
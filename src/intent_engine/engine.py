@@ -8,7 +8,7 @@ from intent_engine.config import Settings, get_settings
 from intent_engine.extractors.embedding import EmbeddingExtractor
 from intent_engine.extractors.entity_extractor import EntityExtractor
 from intent_engine.extractors.sentiment import SentimentAnalyzer, get_sentiment_analyzer
-from intent_engine.matchers.compound_detector import CompoundDetector
+from intent_engine.matchers.compound_detector import CompoundDetector, get_compound_detector
 from intent_engine.matchers.similarity import IntentMatcher, MatchDecision
 from intent_engine.models.context import EnrichedContext
 from intent_engine.models.intent import ResolvedIntent
@@ -95,7 +95,7 @@ class IntentEngine:
                 ambiguity_gap_threshold=self.settings.ambiguity_gap_threshold,
                 low_confidence_threshold=self.settings.low_confidence_threshold,
             )
-            compound_detector = CompoundDetector(
+            compound_detector = get_compound_detector(
                 compound_threshold=self.settings.compound_detection_threshold
             )
 
@@ -513,7 +513,7 @@ class IntentEngine:
         final_intents = decomposition.intents
         conflict_clarification_question = None
         if len(decomposition.intents) > 1 and self.components.conflict_resolver:
-            conflict_result = await self.components.conflict_resolver.resolve(
+            conflict_result = self.components.conflict_resolver.resolve_sync(
                 intents=decomposition.intents,
                 entities=extraction_result.entities,
                 context=enriched_context,
@@ -1,5 +1,7 @@
 """Semantic embedding generation using sentence-transformers."""
 
+from collections import OrderedDict
+
 import numpy as np
 from numpy.typing import NDArray
 from sentence_transformers import SentenceTransformer
@@ -13,16 +15,32 @@ class EmbeddingExtractor:
     which produces 384-dimensional embeddings optimized for semantic similarity.
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
+    DEFAULT_CACHE_SIZE = 4096
+
+    # Output sizes of common models, so embedding_dim need not load the weights
+    KNOWN_DIMENSIONS: dict[str, int] = {
+        "all-MiniLM-L6-v2": 384,
+        "all-MiniLM-L12-v2": 384,
+        "all-mpnet-base-v2": 768,
+    }
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
         """
         Initialize the embedding extractor.
 
         Args:
             model_name: Name of the sentence-transformers model to use.
                        Default is all-MiniLM-L6-v2 (384 dims, fast).
+            cache_size: Max single-text embeddings kept in the LRU cache (0 disables).
         """
         self._model: SentenceTransformer | None = None
         self._model_name = model_name
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, NDArray[np.float32]] = OrderedDict()
 
     @property
     def model(self) -> SentenceTransformer:
@@ -33,7 +51,10 @@ class EmbeddingExtractor:
 
     @property
     def embedding_dim(self) -> int:
-        """Get the dimensionality of the embeddings."""
+        """Get the dimensionality of the embeddings (without loading known models)."""
+        known = self.KNOWN_DIMENSIONS.get(self._model_name)
+        if known is not None and self._model is None:
+            return known
         return self.model.get_sentence_embedding_dimension()
 
     def embed(self, text: str) -> list[float]:
@@ -46,12 +67,40 @@ class EmbeddingExtractor:
         Returns:
             A list of floats representing the embedding vector.
         """
-        embedding: NDArray[np.float32] = self.model.encode(
+        return self.embed_normalized(text).tolist()
+
+    def embed_normalized(self, text: str) -> NDArray[np.float32]:
+        """
+        Generate an L2-normalized embedding for a single text as an array.
+
+        The returned array is shared with the cache, so it is read-only; copy it
+        before modifying.
+
+        Args:
+            text: The text to embed.
+
+        Returns:
+            Float32 unit vector of length embedding_dim.
+        """
+        embedding = self._cache.get(text)
+        if embedding is not None:
+            self._cache.move_to_end(text)
+            return embedding
+        embedding = self.model.encode(
             text,
             convert_to_numpy=True,
             normalize_embeddings=True,  # L2 normalize for cosine similarity
         )
-        return embedding.tolist()
+        embedding.setflags(write=False)
+        if self.cache_size > 0:
+            self._cache[text] = embedding
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return embedding
+
+    def clear_cache(self) -> None:
+        """Drop all cached single-text embeddings."""
+        self._cache.clear()
 
     def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """
@@ -63,15 +112,36 @@ class EmbeddingExtractor:
         Returns:
             List of embedding vectors.
         """
+        return self.embed_batch_np(texts).tolist()
+
+    def embed_batch_np(self, texts: list[str], batch_size: int = 32) -> NDArray[np.float32]:
+        """
+        Generate embeddings for a batch of texts as a single array.
+
+        All texts go through one ``encode`` call so the model runs padded
+        batches instead of one forward pass per text.
+
+        Args:
+            texts: List of texts to embed.
+            batch_size: Number of texts per forward pass.
+
+        Returns:
+            Float32 array of shape (len(texts), embedding_dim).
+        """
         embeddings: NDArray[np.float32] = self.model.encode(
             texts,
+            batch_size=batch_size,
             convert_to_numpy=True,
             normalize_embeddings=True,
             show_progress_bar=len(texts) > 100,
         )
-        return embeddings.tolist()
+        return embeddings
 
-    def similarity(self, embedding1: list[float], embedding2: list[float]) -> float:
+    def similarity(
+        self,
+        embedding1: list[float] | NDArray[np.float32],
+        embedding2: list[float] | NDArray[np.float32],
+    ) -> float:
         """
         Compute cosine similarity between two embeddings.
 
@@ -84,6 +154,6 @@ class EmbeddingExtractor:
         Returns:
             Cosine similarity score between 0 and 1.
         """
-        vec1 = np.array(embedding1)
-        vec2 = np.array(embedding2)
+        vec1 = np.asarray(embedding1, dtype=np.float32)
+        vec2 = np.asarray(embedding2, dtype=np.float32)
         return float(np.dot(vec1, vec2))
@@ -1,10 +1,9 @@
-"""Entity extraction using regex patterns and spaCy NER."""
+"""Entity extraction using regex patterns and (optionally) spaCy NER."""
 
 import re
+from typing import TYPE_CHECKING
 
 import dateparser
-import spacy
-from spacy.language import Language
 
 from intent_engine.models.entity import (
     DamageSeverity,
@@ -14,6 +13,9 @@ from intent_engine.models.entity import (
     ExtractionResult,
 )
 
+if TYPE_CHECKING:
+    from spacy.language import Language
+
 
 class EntityExtractor:
     """
@@ -167,15 +169,45 @@ class EntityExtractor:
         re.compile(r"\b(Microsoft|Google|Amazon|Nintendo|PlayStation|Xbox)\b", re.I),
     ]
 
-    def __init__(self, spacy_model: str = "en_core_web_sm") -> None:
-        """Initialize the entity extractor with a spaCy model."""
+    # Single-pass forms of the carrier and brand lists: one scan instead of one per pattern
+    _CARRIER_RE = re.compile(
+        "|".join(f"(?P<c{i}>{p.pattern})" for i, (p, _) in enumerate(CARRIER_PATTERNS)), re.I
+    )
+    _CARRIER_NAMES: dict[str | None, str] = {
+        f"c{i}": name for i, (_, name) in enumerate(CARRIER_PATTERNS)
+    }
+    _BRAND_RE = re.compile("|".join(f"(?:{p.pattern})" for p in BRAND_PATTERNS), re.I)
+
+    # spaCy NER label -> entity type
+    SPACY_LABEL_MAP: dict[str, EntityType] = {
+        "PERSON": EntityType.PERSON_NAME,
+        "GPE": EntityType.ADDRESS,  # Geopolitical entity (cities, countries)
+        "LOC": EntityType.ADDRESS,
+        "MONEY": EntityType.MONEY_AMOUNT,
+        "CARDINAL": EntityType.QUANTITY,
+        "PRODUCT": EntityType.PRODUCT_NAME,
+        "ORG": EntityType.PRODUCT_NAME,  # Sometimes product/brand names
+    }
+
+    def __init__(self, spacy_model: str = "en_core_web_sm", patterns_only: bool = False) -> None:
+        """
+        Initialize the entity extractor with a spaCy model.
+
+        Args:
+            spacy_model: Name of the spaCy model used for NER.
+            patterns_only: Skip spaCy NER entirely and extract only pattern-based
+                entities. spaCy is never imported or loaded in this mode.
+        """
         self._nlp: Language | None = None
         self._spacy_model = spacy_model
+        self.patterns_only = patterns_only
 
     @property
-    def nlp(self) -> Language:
+    def nlp(self) -> "Language":
         """Lazy-load spaCy model."""
         if self._nlp is None:
+            import spacy
+
             self._nlp = spacy.load(self._spacy_model)
         return self._nlp
 
@@ -195,7 +227,8 @@ class EntityExtractor:
         entities.extend(self._extract_regex_entities(text))
 
         # Extract using spaCy NER
-        entities.extend(self._extract_spacy_entities(text))
+        if not self.patterns_only:
+            entities.extend(self._extract_spacy_entities(text))
 
         # Extract dates and deadlines
         entities.extend(self._extract_dates(text))
@@ -241,21 +274,12 @@ class EntityExtractor:
         entities: list[ExtractedEntity] = []
         doc = self.nlp(text)
 
-        entity_mapping: dict[str, EntityType] = {
-            "PERSON": EntityType.PERSON_NAME,
-            "GPE": EntityType.ADDRESS,  # Geopolitical entity (cities, countries)
-            "LOC": EntityType.ADDRESS,
-            "MONEY": EntityType.MONEY_AMOUNT,
-            "CARDINAL": EntityType.QUANTITY,
-            "PRODUCT": EntityType.PRODUCT_NAME,
-            "ORG": EntityType.PRODUCT_NAME,  # Sometimes product/brand names
-        }
-
         for ent in doc.ents:
-            if ent.label_ in entity_mapping:
+            entity_type = self.SPACY_LABEL_MAP.get(ent.label_)
+            if entity_type is not None:
                 entities.append(
                     ExtractedEntity(
-                        entity_type=entity_mapping[ent.label_],
+                        entity_type=entity_type,
                         value=ent.text,
                         raw_span=ent.text,
                         start_pos=ent.start_char,
@@ -367,18 +391,17 @@ class EntityExtractor:
         """Extract shipping carrier names from text."""
         entities: list[ExtractedEntity] = []
 
-        for pattern, carrier_name in self.CARRIER_PATTERNS:
-            for match in pattern.finditer(text):
-                entities.append(
-                    ExtractedEntity(
-                        entity_type=EntityType.CARRIER,
-                        value=carrier_name,
-                        raw_span=match.group(0),
-                        start_pos=match.start(),
-                        end_pos=match.end(),
-                        confidence=0.95,
-                    )
+        for match in self._CARRIER_RE.finditer(text):
+            entities.append(
+                ExtractedEntity(
+                    entity_type=EntityType.CARRIER,
+                    value=self._CARRIER_NAMES[match.lastgroup],
+                    raw_span=match.group(0),
+                    start_pos=match.start(),
+                    end_pos=match.end(),
+                    confidence=0.95,
                 )
+            )
 
         return entities
 
@@ -386,22 +409,21 @@ class EntityExtractor:
         """Extract brand names from text."""
         entities: list[ExtractedEntity] = []
 
-        for pattern in self.BRAND_PATTERNS:
-            for match in pattern.finditer(text):
-                entities.append(
-                    ExtractedEntity(
-                        entity_type=EntityType.BRAND_NAME,
-                        value=match.group(0),
-                        raw_span=match.group(0),
-                        start_pos=match.start(),
-                        end_pos=match.end(),
-                        confidence=0.90,
-                    )
+        for match in self._BRAND_RE.finditer(text):
+            entities.append(
+                ExtractedEntity(
+                    entity_type=EntityType.BRAND_NAME,
+                    value=match.group(0),
+                    raw_span=match.group(0),
+                    start_pos=match.start(),
+                    end_pos=match.end(),
+                    confidence=0.90,
                 )
+            )
 
         return entities
 
     def extract_order_ids(self, text: str) -> list[str]:
         """Convenience method to extract just order IDs."""
         result = self.extract(text)
-        return [e.value for e in result.entities if e.entity_type == EntityType.ORDER_ID]
+        return [e.value for e in result.entities_by_type.get(EntityType.ORDER_ID, ())]
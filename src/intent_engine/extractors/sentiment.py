@@ -2,12 +2,52 @@
 
 import logging
 import re
+import string
+from array import array
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Deletion tables for counting ASCII letters in C via bytes.translate
+_ASCII_LETTERS = string.ascii_letters.encode("ascii")
+_ASCII_UPPERCASE = string.ascii_uppercase.encode("ascii")
 
-@dataclass
+_REGEX_META = frozenset("\\.^$*+?{}[]()|")
+
+
+def _required_literal(pattern: str) -> str:
+    """
+    Lowercased literal text that every match of a lexicon pattern must contain.
+
+    Takes the plain characters after a leading ``\\b`` (e.g. "urgent" for
+    ``\\burgent(ly)?\\b``). Returns "" when there is none or when a top-level
+    alternation means matches need not share it; "" is a substring of every text.
+    """
+    depth = 0
+    escaped = False
+    for ch in pattern:
+        if escaped:
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            return ""
+
+    body = pattern.removeprefix(r"\b")
+    end = 0
+    while end < len(body) and body[end] not in _REGEX_META:
+        end += 1
+    if end < len(body) and body[end] in "?*{":
+        end -= 1  # A quantifier may make the last character optional
+    return body[:end].lower()
+
+
+@dataclass(slots=True)
 class SentimentResult:
     """Result of sentiment analysis."""
 
@@ -155,6 +195,42 @@ class SentimentAnalyzer:
         ],
     }
 
+    # Compiled once per class as (regex, required literal, weight, signal); the re module's
+    # cache is never hit. On ASCII text a missing literal rules a pattern out with a C-level
+    # substring check, far cheaper than an IGNORECASE search (non-ASCII text can case-fold,
+    # e.g. "ſ" matches "s", so it always runs the regex)
+    _URGENCY_RES = tuple(
+        (re.compile(p, re.IGNORECASE), _required_literal(p), w, f"urgency:{p[:20]}")
+        for p, w in URGENCY_PATTERNS
+    )
+    _FRUSTRATION_RES = tuple(
+        (re.compile(p, re.IGNORECASE), _required_literal(p), w) for p, w in FRUSTRATION_PATTERNS
+    )
+    _ESCALATION_RES = tuple(
+        (re.compile(p, re.IGNORECASE), _required_literal(p), w, f"escalation:{p[:25]}")
+        for p, w in ESCALATION_PATTERNS
+    )
+    _BOOSTER_RES = tuple(re.compile(p) for p in NEGATIVE_BOOSTERS[:-1])  # Skip caps check
+    _POSITIVE_RES = tuple(
+        (re.compile(p, re.IGNORECASE), _required_literal(p), w) for p, w in POSITIVE_PATTERNS
+    )
+    _SARCASM_RES = tuple(
+        (re.compile(p, re.IGNORECASE), _required_literal(p), w, f"sarcasm_pattern:{p[:25]}")
+        for p, w in SARCASM_PATTERNS
+    )
+
+    # One alternation per lexicon: a single scan rules out the common no-hit case before the
+    # per-pattern loop, which still runs on a hit since patterns overlap and all are scored
+    _URGENCY_ANY = re.compile("|".join(f"(?:{p})" for p, _ in URGENCY_PATTERNS), re.IGNORECASE)
+    _FRUSTRATION_ANY = re.compile(
+        "|".join(f"(?:{p})" for p, _ in FRUSTRATION_PATTERNS), re.IGNORECASE
+    )
+    _ESCALATION_ANY = re.compile(
+        "|".join(f"(?:{p})" for p, _ in ESCALATION_PATTERNS), re.IGNORECASE
+    )
+    _POSITIVE_ANY = re.compile("|".join(f"(?:{p})" for p, _ in POSITIVE_PATTERNS), re.IGNORECASE)
+    _SARCASM_ANY = re.compile("|".join(f"(?:{p})" for p, _ in SARCASM_PATTERNS), re.IGNORECASE)
+
     PRIORITY_THRESHOLD = 0.7  # Route to priority queue above this
 
     def __init__(self, use_transformer: bool = True, device: str | None = None) -> None:
@@ -206,8 +282,20 @@ class SentimentAnalyzer:
         Returns:
             SentimentResult with all scores and signals.
         """
+        if not text or text.isspace():
+            # Nothing any detector can match
+            return SentimentResult(
+                sentiment_score=0.0,
+                urgency_score=0.0,
+                frustration_score=0.0,
+                priority_flag=False,
+                signals=[],
+            )
+
         self._load_model()
 
+        # Lowercase once for every lexicon detector; only the transformer and caps see raw text
+        text_lower = text.lower()
         signals: list[str] = []
 
         # 1. Get base sentiment from transformer or rules
@@ -216,22 +304,22 @@ class SentimentAnalyzer:
             if sentiment_score < 0:
                 signals.append(f"negative_sentiment:{sentiment_score:.2f}")
         else:
-            sentiment_score = self._get_rule_based_sentiment(text)
+            sentiment_score = self._get_rule_based_sentiment(text_lower)
 
         # 2. Detect urgency
-        urgency_score, urgency_signals = self._detect_urgency(text)
+        urgency_score, urgency_signals = self._detect_urgency(text_lower)
         signals.extend(urgency_signals)
 
         # 3. Detect frustration
-        frustration_score, frustration_signals = self._detect_frustration(text)
+        frustration_score, frustration_signals = self._detect_frustration(text_lower)
         signals.extend(frustration_signals)
 
         # 4. Check for escalation indicators
-        escalation_score, escalation_signals = self._detect_escalation(text)
+        escalation_score, escalation_signals = self._detect_escalation(text_lower)
         signals.extend(escalation_signals)
 
         # 4.5. Check for sarcasm (can flip positive sentiment to negative)
-        sarcasm_score, sarcasm_signals = self._detect_sarcasm(text)
+        sarcasm_score, sarcasm_signals = self._detect_sarcasm(text_lower)
         signals.extend(sarcasm_signals)
 
         # If sarcasm detected, flip positive sentiment to negative
@@ -248,14 +336,13 @@ class SentimentAnalyzer:
             frustration_boost = abs(sentiment_score) * 0.2
             frustration_score = min(1.0, frustration_score + frustration_boost)
 
-        # 7. Check for caps lock (indicates strong emotion)
-        caps_ratio = self._caps_ratio(text)
-        if caps_ratio > 0.3 and len(text) > 20:
+        # 7. Check for caps lock (indicates strong emotion); short texts never qualify
+        if len(text) > 20 and self._caps_ratio(text) > 0.3:
             frustration_score = min(1.0, frustration_score + 0.2)
             signals.append("excessive_caps")
 
         # 8. Adjust for positive indicators
-        positive_adjustment = self._detect_positive(text)
+        positive_adjustment = self._detect_positive(text_lower)
         frustration_score = max(0.0, frustration_score + positive_adjustment)
 
         # 9. Determine priority flag
@@ -291,9 +378,10 @@ class SentimentAnalyzer:
             logger.warning(f"Transformer inference failed: {e}")
             return 0.0
 
-    def _get_rule_based_sentiment(self, text: str) -> float:
-        """Rule-based sentiment fallback."""
-        text_lower = text.lower()
+    def _get_rule_based_sentiment(self, text_lower: str) -> float:
+        """Rule-based sentiment fallback over lowercased text."""
+        if not text_lower or text_lower.isspace():
+            return 0.0
 
         negative_count = 0
         positive_count = 0
@@ -350,35 +438,44 @@ class SentimentAnalyzer:
 
         return (positive_count - negative_count) / total
 
-    def _detect_urgency(self, text: str) -> tuple[float, list[str]]:
-        """Detect urgency indicators."""
-        text_lower = text.lower()
-        max_score = 0.0
-        signals: list[str] = []
-
-        for pattern, score in self.URGENCY_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                max_score = max(max_score, score)
-                signals.append(f"urgency:{pattern[:20]}")
-
-        return max_score, signals
-
-    def _detect_frustration(self, text: str) -> tuple[float, list[str]]:
-        """Detect frustration indicators."""
-        text_lower = text.lower()
-        scores: list[float] = []
-        signals: list[str] = []
-
-        for pattern, score in self.FRUSTRATION_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                scores.append(score)
-                # Extract matched text for signal
-                match = re.search(pattern, text_lower, re.IGNORECASE)
-                if match:
-                    signals.append(f"frustration:{match.group()[:30]}")
+    @staticmethod
+    def _match_lexicon(
+        lexicon: tuple[tuple[re.Pattern[str], str, float, str], ...], text_lower: str
+    ) -> tuple[float, list[str]]:
+        """Max weight and signals of the lexicon entries matching lowercased text."""
+        is_ascii = text_lower.isascii()
+        hits = [
+            (score, signal)
+            for regex, literal, score, signal in lexicon
+            if (literal in text_lower or not is_ascii) and regex.search(text_lower)
+        ]
+        if not hits:
+            return 0.0, []
+        return max(score for score, _ in hits), [signal for _, signal in hits]
+
+    def _detect_urgency(self, text_lower: str) -> tuple[float, list[str]]:
+        """Detect urgency indicators in lowercased text."""
+        if not self._URGENCY_ANY.search(text_lower):
+            return 0.0, []
+        return self._match_lexicon(self._URGENCY_RES, text_lower)
+
+    def _detect_frustration(self, text_lower: str) -> tuple[float, list[str]]:
+        """Detect frustration indicators in lowercased text."""
+        if not self._FRUSTRATION_ANY.search(text_lower):
+            return 0.0, []
+
+        is_ascii = text_lower.isascii()
+        hits = [
+            (score, match)
+            for regex, literal, score in self._FRUSTRATION_RES
+            if (literal in text_lower or not is_ascii) and (match := regex.search(text_lower))
+        ]
+        if not hits:
+            return 0.0, []
 
-        if not scores:
-            return 0.0, signals
+        scores = [score for score, _ in hits]
+        # Matched text for signal
+        signals = [f"frustration:{match.group()[:30]}" for _, match in hits]
 
         # Use weighted combination: max score + average of others
         max_score = max(scores)
@@ -390,8 +487,8 @@ class SentimentAnalyzer:
 
         # Apply boosters
         booster_count = 0
-        for booster in self.NEGATIVE_BOOSTERS[:-1]:  # Skip caps check
-            if re.search(booster, text_lower):
+        for booster in self._BOOSTER_RES:
+            if booster.search(text_lower):
                 booster_count += 1
 
         if booster_count > 0:
@@ -399,26 +496,23 @@ class SentimentAnalyzer:
 
         return min(1.0, combined), signals
 
-    def _detect_escalation(self, text: str) -> tuple[float, list[str]]:
-        """Detect escalation indicators."""
-        text_lower = text.lower()
-        max_score = 0.0
-        signals: list[str] = []
-
-        for pattern, score in self.ESCALATION_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                max_score = max(max_score, score)
-                signals.append(f"escalation:{pattern[:25]}")
+    def _detect_escalation(self, text_lower: str) -> tuple[float, list[str]]:
+        """Detect escalation indicators in lowercased text."""
+        if not self._ESCALATION_ANY.search(text_lower):
+            return 0.0, []
+        return self._match_lexicon(self._ESCALATION_RES, text_lower)
 
-        return max_score, signals
-
-    def _detect_positive(self, text: str) -> float:
-        """Detect positive indicators that reduce frustration."""
-        text_lower = text.lower()
+    def _detect_positive(self, text_lower: str) -> float:
+        """Detect positive indicators that reduce frustration in lowercased text."""
         total_adjustment = 0.0
-
-        for pattern, adjustment in self.POSITIVE_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
+        if not self._POSITIVE_ANY.search(text_lower):
+            return total_adjustment
+
+        is_ascii = text_lower.isascii()
+        for regex, literal, adjustment in self._POSITIVE_RES:
+            if is_ascii and literal not in text_lower:
+                continue
+            if regex.search(text_lower):
                 total_adjustment += adjustment
 
         return max(-0.4, total_adjustment)  # Cap the reduction
@@ -428,6 +522,13 @@ class SentimentAnalyzer:
         if not text:
             return 0.0
 
+        if text.isascii():
+            raw = text.encode("ascii")
+            alpha_count = len(raw) - len(raw.translate(None, _ASCII_LETTERS))
+            if not alpha_count:
+                return 0.0
+            return (len(raw) - len(raw.translate(None, _ASCII_UPPERCASE))) / alpha_count
+
         alpha_chars = [c for c in text if c.isalpha()]
         if not alpha_chars:
             return 0.0
@@ -435,7 +536,7 @@ class SentimentAnalyzer:
         upper_count = sum(1 for c in alpha_chars if c.isupper())
         return upper_count / len(alpha_chars)
 
-    def _detect_sarcasm(self, text: str) -> tuple[float, list[str]]:
+    def _detect_sarcasm(self, text_lower: str) -> tuple[float, list[str]]:
         """
         Detect sarcasm in text.
 
@@ -444,20 +545,17 @@ class SentimentAnalyzer:
         2. Contradiction detection (positive word + negative context)
 
         Args:
-            text: The customer message to analyze.
+            text_lower: The customer message, lowercased.
 
         Returns:
             Tuple of (sarcasm score, list of sarcasm signals).
         """
-        text_lower = text.lower()
         max_score = 0.0
         signals: list[str] = []
 
         # Check direct sarcasm patterns
-        for pattern, score in self.SARCASM_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                max_score = max(max_score, score)
-                signals.append(f"sarcasm_pattern:{pattern[:25]}")
+        if self._SARCASM_ANY.search(text_lower):
+            max_score, signals = self._match_lexicon(self._SARCASM_RES, text_lower)
 
         # Check for contradiction (positive word near negative context)
         has_positive = any(word in text_lower for word in self.CONTRADICTION_WORDS["positive"])
@@ -482,7 +580,7 @@ class SentimentAnalyzer:
         return max_score, signals
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationSentiment:
     """Aggregated sentiment across a conversation."""
 
@@ -517,7 +615,12 @@ class ConversationSentimentTracker:
     def __init__(self, analyzer: "SentimentAnalyzer | None" = None) -> None:
         """Initialize the tracker."""
         self.analyzer = analyzer or get_sentiment_analyzer()
-        self._history: list[SentimentResult] = []
+        # Per-message history kept as packed doubles plus running aggregates, not result
+        # objects, so long threads stay small and get_conversation_sentiment() never rescans
+        self._frustration_scores = array("d")
+        self._frustration_prefix = array("d", [0.0])  # prefix[i] = sum of the first i scores
+        self._peak_frustration = 0.0
+        self._escalation_seen = False
 
     def add_message(self, text: str) -> SentimentResult:
         """
@@ -530,9 +633,34 @@ class ConversationSentimentTracker:
             SentimentResult for this message.
         """
         result = self.analyzer.analyze(text)
-        self._history.append(result)
+        self._record(result)
         return result
 
+    def add_messages(self, texts: Iterable[str]) -> list[SentimentResult]:
+        """
+        Analyze several messages in order, e.g. when replaying a ticket's history.
+
+        Args:
+            texts: The customer messages, oldest first.
+
+        Returns:
+            SentimentResult for each message.
+        """
+        analyze = self.analyzer.analyze
+        results = [analyze(text) for text in texts]
+        for result in results:
+            self._record(result)
+        return results
+
+    def _record(self, result: SentimentResult) -> None:
+        """Append a result to the history and update the running aggregates."""
+        score = result.frustration_score
+        self._frustration_scores.append(score)
+        self._frustration_prefix.append(self._frustration_prefix[-1] + score)
+        self._peak_frustration = max(self._peak_frustration, score)
+        if not self._escalation_seen:
+            self._escalation_seen = any("escalation:" in s for s in result.signals)
+
     def get_conversation_sentiment(self) -> ConversationSentiment:
         """
         Get aggregated sentiment for the conversation.
@@ -540,7 +668,8 @@ class ConversationSentimentTracker:
         Returns:
             ConversationSentiment with trajectory and aggregation.
         """
-        if not self._history:
+        count = len(self._frustration_scores)
+        if not count:
             return ConversationSentiment(
                 message_count=0,
                 average_frustration=0.0,
@@ -550,16 +679,13 @@ class ConversationSentimentTracker:
                 sentiment_history=[],
             )
 
-        frustration_scores = [r.frustration_score for r in self._history]
+        prefix = self._frustration_prefix
 
         # Calculate trajectory
-        if len(frustration_scores) >= 3:
-            first_half = sum(frustration_scores[: len(frustration_scores) // 2]) / (
-                len(frustration_scores) // 2
-            )
-            second_half = sum(frustration_scores[len(frustration_scores) // 2 :]) / (
-                len(frustration_scores) - len(frustration_scores) // 2
-            )
+        if count >= 3:
+            half = count // 2
+            first_half = prefix[half] / half
+            second_half = (prefix[count] - prefix[half]) / (count - half)
 
             if second_half > first_half + 0.1:
                 trajectory = "rising"
@@ -570,16 +696,14 @@ class ConversationSentimentTracker:
         else:
             trajectory = "constant"
 
-        # Check for escalation patterns in any message
-        escalation_detected = any("escalation:" in s for r in self._history for s in r.signals)
-
         return ConversationSentiment(
-            message_count=len(self._history),
-            average_frustration=sum(frustration_scores) / len(frustration_scores),
-            peak_frustration=max(frustration_scores),
+            message_count=count,
+            average_frustration=prefix[count] / count,
+            peak_frustration=self._peak_frustration,
             frustration_trajectory=trajectory,
-            escalation_pattern=escalation_detected,
-            sentiment_history=frustration_scores,
+            # Escalation patterns in any message
+            escalation_pattern=self._escalation_seen,
+            sentiment_history=self._frustration_scores.tolist(),
         )
 
     def detect_escalation_pattern(self, text: str) -> tuple[bool, list[str]]:
@@ -604,7 +728,10 @@ class ConversationSentimentTracker:
 
     def reset(self) -> None:
         """Reset the conversation history."""
-        self._history = []
+        self._frustration_scores = array("d")
+        self._frustration_prefix = array("d", [0.0])
+        self._peak_frustration = 0.0
+        self._escalation_seen = False
 
 
 # Singleton instance for easy access
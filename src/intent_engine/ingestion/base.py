@@ -1,10 +1,14 @@
 """Base channel adapter interface."""
 
+import re
 from abc import ABC, abstractmethod
 from typing import Any
 
 from intent_engine.models.request import IntentRequest
 
+# ORD-/ORDER- prefixed IDs (group 1) or Shopify-style #1234 (group 2), in one scan
+_ORDER_ID_RE = re.compile(r"#?\b(ORD(?:ER)?[-_]?\d{4,10})\b|#(\d{4,10})\b", re.IGNORECASE)
+
 
 class ChannelAdapter(ABC):
     """
@@ -52,17 +56,6 @@ class ChannelAdapter(ABC):
 
         Can be overridden by subclasses for channel-specific patterns.
         """
-        import re
-
-        patterns = [
-            r"#?\b(ORD[-_]?\d{4,10})\b",
-            r"#?\b(ORDER[-_]?\d{4,10})\b",
-            r"#(\d{4,10})\b",
-        ]
-
-        order_ids: list[str] = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            order_ids.extend(matches)
-
-        return list(set(order_ids))
+        order_ids = (prefixed or bare for prefixed, bare in _ORDER_ID_RE.findall(text))
+        # dict.fromkeys dedupes while keeping first-seen order
+        return list(dict.fromkeys(order_ids))
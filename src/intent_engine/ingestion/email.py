@@ -5,14 +5,42 @@ import re
 import uuid
 from datetime import datetime, timezone
 from email.message import EmailMessage
-from email.utils import parseaddr, parsedate_to_datetime
+from email.parser import Parser
+from email.policy import default as default_policy
+from html.parser import HTMLParser
 from typing import Any
 
-from bs4 import BeautifulSoup
-
 from intent_engine.ingestion.base import ChannelAdapter
 from intent_engine.models.request import Attachment, InputChannel, IntentRequest
 
+# Shared str parser (input is already decoded text, so raw non-ASCII headers stay intact);
+# the default policy yields structured address/date headers
+_MIME_PARSER = Parser(policy=default_policy)
+
+
+class _HTMLTextExtractor(HTMLParser):
+    """Collect text nodes in a single streaming pass, skipping non-content elements."""
+
+    # Elements whose text content is never part of the message
+    SKIP_TAGS = frozenset({"script", "style", "head"})
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.chunks: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self.chunks.append(data)
+
 
 class EmailAdapter(ChannelAdapter):
     """
@@ -45,6 +73,9 @@ class EmailAdapter(ChannelAdapter):
     }
     """
 
+    # Fields that must be present and non-empty for structured (non-MIME) input
+    REQUIRED_STRUCTURED_FIELDS = ("body", "from_email", "tenant_id")
+
     # Common signature delimiters
     SIGNATURE_PATTERNS = [
         r"^--\s*$",  # Standard "--" delimiter
@@ -74,6 +105,15 @@ class EmailAdapter(ChannelAdapter):
         r"^\|",  # Pipe-quoted lines
     ]
 
+    # Each pattern list compiled once into a single alternation, so a line is
+    # tested in one regex pass instead of one re.match per pattern
+    _SIGNATURE_START_RE = re.compile(
+        "|".join(f"(?:{p})" for p in SIGNATURE_PATTERNS), re.IGNORECASE
+    )
+    _QUOTE_START_RE = re.compile("|".join(f"(?:{p})" for p in QUOTE_PATTERNS), re.IGNORECASE)
+    _EXCESS_BLANK_LINES_RE = re.compile(r"\n{3,}")
+    _SUBJECT_PREFIX_RE = re.compile(r"^(Re|Fwd|Fw):\s*", re.IGNORECASE)
+
     @property
     def channel_name(self) -> str:
         return "email"
@@ -82,14 +122,10 @@ class EmailAdapter(ChannelAdapter):
         """Validate email input structure."""
         # Either raw_email or body+from_email required
         if "raw_email" in raw_input:
-            return isinstance(raw_input["raw_email"], str) and len(raw_input["raw_email"]) > 0
-
-        required_fields = ["body", "from_email", "tenant_id"]
-        for field in required_fields:
-            if field not in raw_input or not raw_input[field]:
-                return False
+            raw_email = raw_input["raw_email"]
+            return isinstance(raw_email, str) and raw_email != ""
 
-        return True
+        return all(raw_input.get(field) for field in self.REQUIRED_STRUCTURED_FIELDS)
 
     async def normalize(self, raw_input: dict[str, Any]) -> IntentRequest:
         """
@@ -182,19 +218,17 @@ class EmailAdapter(ChannelAdapter):
 
     def _parse_mime_email(self, raw_email: str) -> dict[str, Any]:
         """Parse a raw MIME email string."""
-        msg = email.message_from_string(raw_email)
+        msg = _MIME_PARSER.parsestr(raw_email)
 
-        # Extract headers
-        from_addr = parseaddr(msg.get("From", ""))
-        to_addr = parseaddr(msg.get("To", ""))
+        # Extract headers (address headers are already tokenized by the policy)
+        from_name, from_email = self._first_address(msg["From"])
+        _, to_email = self._first_address(msg["To"])
 
         # Parse timestamp
         timestamp = datetime.now(timezone.utc)
-        if date_str := msg.get("Date"):
-            try:
-                timestamp = parsedate_to_datetime(date_str)
-            except (ValueError, TypeError):
-                pass
+        date_header = msg["Date"]
+        if date_header is not None and getattr(date_header, "datetime", None):
+            timestamp = date_header.datetime
 
         # Extract body
         body = self._extract_body_from_mime(msg)
@@ -204,22 +238,35 @@ class EmailAdapter(ChannelAdapter):
 
         # Parse references header
         references: list[str] = []
-        if ref_header := msg.get("References"):
-            references = [r.strip() for r in ref_header.split() if r.strip()]
+        if ref_header := msg["References"]:
+            references = str(ref_header).split()
 
         return {
-            "subject": msg.get("Subject", ""),
+            "subject": str(msg["Subject"] or ""),
             "body": body,
-            "from_email": from_addr[1],
-            "from_name": from_addr[0],
-            "to_email": to_addr[1],
-            "message_id": msg.get("Message-ID"),
-            "in_reply_to": msg.get("In-Reply-To"),
+            "from_email": from_email,
+            "from_name": from_name,
+            "to_email": to_email,
+            "message_id": self._header_str(msg["Message-ID"]),
+            "in_reply_to": self._header_str(msg["In-Reply-To"]),
             "references": references,
             "timestamp": timestamp,
             "attachments": attachments,
         }
 
+    @staticmethod
+    def _first_address(header: Any) -> tuple[str, str]:
+        """Return (display_name, addr_spec) of the first address in a parsed header."""
+        addresses = getattr(header, "addresses", ())
+        if not addresses:
+            return "", ""
+        return addresses[0].display_name, addresses[0].addr_spec
+
+    @staticmethod
+    def _header_str(header: Any) -> str | None:
+        """Convert a parsed header object to a plain string."""
+        return str(header) if header is not None else None
+
     def _extract_body_from_mime(self, msg: EmailMessage | email.message.Message) -> str:
         """Extract text body from MIME message, preferring plain text."""
         body_parts: list[str] = []
@@ -294,15 +341,13 @@ class EmailAdapter(ChannelAdapter):
         return attachments
 
     def _html_to_text(self, html: str) -> str:
-        """Convert HTML to plain text using BeautifulSoup."""
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Remove script and style elements
-        for element in soup(["script", "style", "head", "meta", "link"]):
-            element.decompose()
+        """Convert HTML to plain text without building a document tree."""
+        parser = _HTMLTextExtractor()
+        parser.feed(html)
+        parser.close()
 
         # Get text with some formatting preservation
-        text = soup.get_text(separator="\n")
+        text = "\n".join(parser.chunks)
 
         # Clean up excessive whitespace
         lines = (line.strip() for line in text.splitlines())
@@ -339,39 +384,16 @@ class EmailAdapter(ChannelAdapter):
 
         Removes quoted replies and previous messages in the thread.
         """
+        # Everything from the first quote boundary on is earlier thread content
         lines = body.split("\n")
-        result_lines: list[str] = []
-        in_quote = False
-
-        for line in lines:
-            stripped = line.strip()
-
-            # Check if this line starts a quote block
-            if self._is_quote_start(stripped):
-                in_quote = True
-                continue
-
-            # Check if this is a quoted line
-            if stripped.startswith(">") or stripped.startswith("|"):
-                in_quote = True
-                continue
-
-            # Reset quote state if we see non-quote content after empty line
-            if in_quote and not stripped:
-                # Could be end of quote, but wait for more content
-                continue
-
-            if not in_quote:
-                result_lines.append(line)
-
-        return "\n".join(result_lines)
+        for i, line in enumerate(lines):
+            if self._is_quote_start(line.strip()):
+                return "\n".join(lines[:i])
+        return body
 
     def _is_quote_start(self, line: str) -> bool:
         """Check if a line indicates the start of quoted content."""
-        for pattern in self.QUOTE_PATTERNS:
-            if re.match(pattern, line, re.IGNORECASE):
-                return True
-        return False
+        return self._QUOTE_START_RE.match(line) is not None
 
     def _strip_signature(self, text: str) -> str:
         """Remove email signature from text."""
@@ -381,12 +403,8 @@ class EmailAdapter(ChannelAdapter):
 
         # Find where signature starts by checking patterns
         for i, line in enumerate(lines):
-            stripped = line.strip()
-            for pattern in self.SIGNATURE_PATTERNS:
-                if re.match(pattern, stripped, re.IGNORECASE):
-                    signature_start = i
-                    break
-            if signature_start < len(lines):
+            if self._SIGNATURE_START_RE.match(line.strip()):
+                signature_start = i
                 break
 
         # Keep lines before signature
@@ -404,7 +422,7 @@ class EmailAdapter(ChannelAdapter):
         text = text.replace("\r\n", "\n").replace("\r", "\n")
 
         # Remove excessive blank lines (more than 2 in a row)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = self._EXCESS_BLANK_LINES_RE.sub("\n\n", text)
 
         # Strip leading/trailing whitespace
         text = text.strip()
@@ -420,7 +438,7 @@ class EmailAdapter(ChannelAdapter):
         subject_clean = subject.strip()
 
         # Remove common subject prefixes
-        subject_clean = re.sub(r"^(Re|Fwd|Fw):\s*", "", subject_clean, flags=re.IGNORECASE)
+        subject_clean = self._SUBJECT_PREFIX_RE.sub("", subject_clean)
         subject_clean = subject_clean.strip()
 
         if not subject_clean:
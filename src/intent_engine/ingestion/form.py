@@ -2,6 +2,7 @@
 
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 from intent_engine.ingestion.base import ChannelAdapter
@@ -214,21 +215,23 @@ class FormAdapter(ChannelAdapter):
         classified: dict[str, str] = {}
 
         for field_name, value in fields.items():
-            if not value:
-                continue
+            if value:
+                classified[self._classified_key(field_name)] = str(value).strip()
 
-            # Normalize field name for matching
-            normalized = field_name.lower().replace("-", "_").replace(" ", "_")
+        return classified
 
-            # Look up in mapping
-            if normalized in self.FIELD_MAPPINGS:
-                field_type = self.FIELD_MAPPINGS[normalized]
-                classified[field_type] = str(value).strip()
-            else:
-                # Store unmapped fields as-is
-                classified[f"raw_{normalized}"] = str(value).strip()
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _classified_key(cls, field_name: str) -> str:
+        """
+        Map a raw form field name to its classified key.
 
-        return classified
+        Names are normalized (lowercase, ``-``/space to ``_``) and looked up in
+        FIELD_MAPPINGS; unmapped names become ``raw_<normalized>``. Cached because
+        forms reuse a small set of field names; values are never cached.
+        """
+        normalized = field_name.lower().replace("-", "_").replace(" ", "_")
+        return cls.FIELD_MAPPINGS.get(normalized, f"raw_{normalized}")
 
     def _build_raw_text(self, classified: dict[str, str], original_fields: dict[str, Any]) -> str:
         """Build the raw_text from classified fields."""
@@ -303,9 +306,3 @@ class FormAdapter(ChannelAdapter):
                 hints[entity_type] = value
 
         return hints
-
-    def extract_order_ids(self, text: str) -> list[str]:
-        """Extract order IDs from text with additional form-specific patterns."""
-        # Use base class patterns
-        order_ids = super().extract_order_ids(text)
-        return list(set(order_ids))
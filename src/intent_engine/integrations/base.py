@@ -273,6 +273,10 @@ class CatalogProvider(ABC):
         """
         ...
 
+    async def close(self) -> None:
+        """Release any held resources (e.g. HTTP clients). Default is a no-op."""
+        return None
+
     async def get_categories(self) -> list[CatalogCategory]:
         """
         List available categories/collections for discovery.
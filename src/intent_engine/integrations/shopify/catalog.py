@@ -22,6 +22,11 @@ class ShopifyCatalogProvider(CatalogProvider):
 
     API_VERSION = "2024-01"
 
+    # Only request the product fields _parse_product reads; trims payload size and decode time
+    PRODUCT_FIELDS = (
+        "id,title,body_html,product_type,vendor,variants,image,images,created_at,updated_at"
+    )
+
     def __init__(self, store_domain: str, access_token: str) -> None:
         self.store_domain = store_domain.rstrip("/")
         self.access_token = access_token
@@ -66,6 +71,9 @@ class ShopifyCatalogProvider(CatalogProvider):
     def _parse_product(self, p: dict[str, Any]) -> CatalogProduct:
         """Map Shopify product JSON to CatalogProduct."""
         variants = p.get("variants") or []
+        images = p.get("images") or []
+        body_html = p.get("body_html")
+        product_type = p.get("product_type") or None
         first = variants[0] if variants else {}
         total_qty = sum(int(v.get("inventory_quantity", 0)) for v in variants)
         price_str = first.get("price", "0")
@@ -78,21 +86,22 @@ class ShopifyCatalogProvider(CatalogProvider):
         image = None
         if p.get("image"):
             image = p["image"].get("src")
-        elif variants and variants[0].get("image_id"):
-            for img in p.get("images") or []:
-                if str(img.get("id")) == str(variants[0].get("image_id")):
+        elif first.get("image_id"):
+            image_id = str(first["image_id"])
+            for img in images:
+                if str(img.get("id")) == image_id:
                     image = img.get("src")
                     break
-        if not image and (p.get("images") or []):
-            image = p["images"][0].get("src")
+        if not image and images:
+            image = images[0].get("src")
 
         return CatalogProduct(
             product_id=str(p.get("id", "")),
             name=p.get("title", ""),
-            description=p.get("body_html"),
-            description_plain=(p.get("body_html") or "")[:500].replace("\n", " ").strip() or None,
-            category=p.get("product_type") or None,
-            categories=[c for c in [p.get("product_type")] if c],
+            description=body_html,
+            description_plain=(body_html or "")[:500].replace("\n", " ").strip() or None,
+            category=product_type,
+            categories=[product_type] if product_type else [],
             vendor=p.get("vendor"),
             sku=first.get("sku") if first else None,
             variant_ids=[str(v.get("id", "")) for v in variants if v.get("id")],
@@ -125,7 +134,7 @@ class ShopifyCatalogProvider(CatalogProvider):
         category: str | None = None,
         limit: int = 20,
     ) -> list[CatalogProduct]:
-        params: dict[str, Any] = {"limit": min(limit, 250)}
+        params: dict[str, Any] = {"limit": min(limit, 250), "fields": self.PRODUCT_FIELDS}
         if query.strip():
             params["title"] = query.strip()
         if category:
@@ -144,21 +153,27 @@ class ShopifyCatalogProvider(CatalogProvider):
         if product_id:
             # Numeric ID; strip gid if present
             pid = product_id.split("/")[-1] if "/" in product_id else product_id
-            data = await self._request("GET", f"/products/{pid}.json")
+            data = await self._request(
+                "GET",
+                f"/products/{pid}.json",
+                params={"fields": self.PRODUCT_FIELDS},
+            )
             if data and "product" in data:
                 return self._parse_product(data["product"])
             return None
         if sku:
+            # Scan one listing with the full field set and parse the match directly
             data = await self._request(
                 "GET",
                 "/products.json",
-                params={"limit": 250},
+                params={"limit": 250, "fields": self.PRODUCT_FIELDS},
             )
             if not data or "products" not in data:
                 return None
+            wanted = sku.strip()
             for p in data["products"]:
                 for v in p.get("variants") or []:
-                    if (v.get("sku") or "").strip() == sku.strip():
+                    if (v.get("sku") or "").strip() == wanted:
                         return self._parse_product(p)
             return None
         return None
@@ -183,7 +198,11 @@ class ShopifyCatalogProvider(CatalogProvider):
     async def get_categories(self) -> list[CatalogCategory]:
         # Shopify REST: product_type is a string on product, not a first-class collection.
         # Fetch products and collect unique product_type values.
-        data = await self._request("GET", "/products.json", params={"limit": 250})
+        data = await self._request(
+            "GET",
+            "/products.json",
+            params={"limit": 250, "fields": "product_type"},
+        )
         if not data or "products" not in data:
             return []
         seen: set[str] = set()
@@ -326,7 +326,7 @@ class ShopifyConnector(PlatformConnector):
             returns_90d=0,
             preferred_contact="email",
             language=customer_data.get("locale", "en")[:2] if customer_data.get("locale") else "en",
-            is_vip=tier == CustomerTier.VIP,
+            is_vip=tier is CustomerTier.VIP,
             is_at_risk=customer_data.get("state") == "disabled",
         )
 
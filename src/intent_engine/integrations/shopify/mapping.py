@@ -1,64 +1,83 @@
 """Status and datetime mapping for Shopify orders."""
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from intent_engine.integrations.base import FulfillmentStatus, OrderStatus
 
+# Shopify splits order state across financial_status, fulfillment_status and each
+# fulfillment's shipment_status; map_order_status checks them in this order of precedence
+
+# Refund states override fulfillment progress
+SHOPIFY_REFUND_STATUS_MAP: dict[str, OrderStatus] = {
+    "refunded": OrderStatus.REFUNDED,
+    "partially_refunded": OrderStatus.PARTIALLY_REFUNDED,
+}
+
+# Carrier progress of a fulfilled order; other values (or none) mean SHIPPED
+SHOPIFY_SHIPMENT_STATUS_MAP: dict[str, OrderStatus] = {
+    "delivered": OrderStatus.DELIVERED,
+    "out_for_delivery": OrderStatus.OUT_FOR_DELIVERY,
+    "in_transit": OrderStatus.IN_TRANSIT,
+}
+
+# Order-level fulfillment_status; null (nothing shipped) and anything else is UNFULFILLED
+SHOPIFY_FULFILLMENT_STATUS_MAP: dict[str, FulfillmentStatus] = {
+    "fulfilled": FulfillmentStatus.FULFILLED,
+    "partial": FulfillmentStatus.PARTIAL,
+}
+
+# Payment state of an order with nothing fulfilled yet; anything else is PROCESSING
+SHOPIFY_PAYMENT_STATUS_MAP: dict[str, OrderStatus] = {
+    "paid": OrderStatus.CONFIRMED,
+    "pending": OrderStatus.PENDING,
+}
+
 
 def map_order_status(order_data: dict[str, Any]) -> OrderStatus:
     """Map Shopify order status to OrderStatus enum."""
-    financial_status = order_data.get("financial_status", "")
-    fulfillment_status = order_data.get("fulfillment_status")
-    cancelled_at = order_data.get("cancelled_at")
-
-    if cancelled_at:
+    if order_data.get("cancelled_at"):
         return OrderStatus.CANCELLED
 
-    if financial_status == "refunded":
-        return OrderStatus.REFUNDED
-
-    if financial_status == "partially_refunded":
-        return OrderStatus.PARTIALLY_REFUNDED
+    financial_status = order_data.get("financial_status", "")
+    refund_status = SHOPIFY_REFUND_STATUS_MAP.get(financial_status)
+    if refund_status is not None:
+        return refund_status
 
+    fulfillment_status = order_data.get("fulfillment_status")
     if fulfillment_status == "fulfilled":
+        # First fulfillment with a known shipment status wins
         for f in order_data.get("fulfillments", []):
-            shipment_status = f.get("shipment_status")
-            if shipment_status == "delivered":
-                return OrderStatus.DELIVERED
-            if shipment_status == "out_for_delivery":
-                return OrderStatus.OUT_FOR_DELIVERY
-            if shipment_status == "in_transit":
-                return OrderStatus.IN_TRANSIT
+            shipment_status = SHOPIFY_SHIPMENT_STATUS_MAP.get(f.get("shipment_status"))
+            if shipment_status is not None:
+                return shipment_status
         return OrderStatus.SHIPPED
 
     if fulfillment_status == "partial":
         return OrderStatus.PROCESSING
 
-    if financial_status == "paid":
-        return OrderStatus.CONFIRMED
-
-    if financial_status == "pending":
-        return OrderStatus.PENDING
-
-    return OrderStatus.PROCESSING
+    return SHOPIFY_PAYMENT_STATUS_MAP.get(financial_status, OrderStatus.PROCESSING)
 
 
 def map_fulfillment_status(order_data: dict[str, Any]) -> FulfillmentStatus:
     """Map Shopify fulfillment status."""
-    status = order_data.get("fulfillment_status")
-    if status == "fulfilled":
-        return FulfillmentStatus.FULFILLED
-    if status == "partial":
-        return FulfillmentStatus.PARTIAL
-    return FulfillmentStatus.UNFULFILLED
+    return SHOPIFY_FULFILLMENT_STATUS_MAP.get(
+        order_data.get("fulfillment_status"), FulfillmentStatus.UNFULFILLED
+    )
 
 
+@lru_cache(maxsize=1024)
 def parse_datetime(dt_str: str | None) -> datetime | None:
-    """Parse Shopify datetime string (ISO 8601)."""
+    """
+    Parse Shopify datetime string (ISO 8601).
+
+    fromisoformat accepts a trailing "Z" natively (Python 3.11+). Cached because an
+    order repeats its timestamps (created/updated/fulfilled) and datetimes are immutable.
+    """
     if not dt_str:
         return None
     try:
-        return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+        return datetime.fromisoformat(dt_str)
     except ValueError:
         return None
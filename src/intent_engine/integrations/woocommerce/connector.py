@@ -1,5 +1,6 @@
 """WooCommerce REST API connector (read-only) with customer profile support."""
 
+import base64
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -18,6 +19,7 @@ from intent_engine.integrations.woocommerce.mapping import (
     get_tracking_url,
     map_fulfillment_status,
     map_order_status,
+    parse_datetime,
 )
 from intent_engine.models.context import (
     CustomerProfile,
@@ -61,6 +63,11 @@ class WooCommerceConnector(PlatformConnector):
         self.consumer_secret = consumer_secret
         self.return_window_days = return_window_days
         self._client: httpx.AsyncClient | None = None
+        self._base_url = f"{self.store_url}/wp-json/{self.API_VERSION}"
+        # WooCommerce uses Basic Auth with consumer key/secret; encode it once and send it
+        # as a default header rather than running httpx's auth flow on every request
+        credentials = base64.b64encode(f"{consumer_key}:{consumer_secret}".encode()).decode()
+        self._auth_header = f"Basic {credentials}"
 
     @property
     def platform_name(self) -> str:
@@ -68,16 +75,15 @@ class WooCommerceConnector(PlatformConnector):
 
     @property
     def base_url(self) -> str:
-        return f"{self.store_url}/wp-json/{self.API_VERSION}"
+        return self._base_url
 
     @property
     def client(self) -> httpx.AsyncClient:
         if self._client is None:
-            # WooCommerce uses Basic Auth with consumer key/secret
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
-                auth=(self.consumer_key, self.consumer_secret),
                 headers={
+                    "Authorization": self._auth_header,
                     "Content-Type": "application/json",
                 },
                 timeout=30.0,
@@ -215,32 +221,46 @@ class WooCommerceConnector(PlatformConnector):
 
         return self._extract_tracking(order)
 
-    def _extract_tracking(self, order_data: dict) -> list[TrackingInfo]:
-        """Extract tracking info from order meta_data."""
-        tracking_list: list[TrackingInfo] = []
-
+    @staticmethod
+    def _meta_index(order_data: dict) -> dict[str, Any]:
+        """Index order meta_data values by key in one pass (first entry per key wins)."""
+        index: dict[str, Any] = {}
         for meta in order_data.get("meta_data", []):
-            # WooCommerce Shipment Tracking plugin stores data here
-            if meta.get("key") == "_wc_shipment_tracking_items":
-                items = meta.get("value", [])
-                if isinstance(items, list):
-                    for item in items:
-                        carrier = get_carrier_name(item.get("tracking_provider", ""))
-                        tracking_number = item.get("tracking_number", "")
-
-                        if tracking_number:
-                            tracking_url = item.get("tracking_link") or get_tracking_url(
-                                item.get("tracking_provider", ""),
-                                tracking_number,
-                            )
-                            tracking_list.append(
-                                TrackingInfo(
-                                    carrier=carrier,
-                                    tracking_number=tracking_number,
-                                    tracking_url=tracking_url,
-                                    status=item.get("status"),
-                                )
-                            )
+            index.setdefault(meta.get("key"), meta.get("value"))
+        return index
+
+    def _extract_tracking(
+        self,
+        order_data: dict,
+        meta_index: dict[str, Any] | None = None,
+    ) -> list[TrackingInfo]:
+        """Extract tracking info from order meta_data (or a prebuilt meta index)."""
+        if meta_index is None:
+            meta_index = self._meta_index(order_data)
+
+        # WooCommerce Shipment Tracking plugin stores data here
+        items = meta_index.get("_wc_shipment_tracking_items")
+        if not isinstance(items, list):
+            return []
+
+        tracking_list: list[TrackingInfo] = []
+        for item in items:
+            carrier = get_carrier_name(item.get("tracking_provider", ""))
+            tracking_number = item.get("tracking_number", "")
+
+            if tracking_number:
+                tracking_url = item.get("tracking_link") or get_tracking_url(
+                    item.get("tracking_provider", ""),
+                    tracking_number,
+                )
+                tracking_list.append(
+                    TrackingInfo(
+                        carrier=carrier,
+                        tracking_number=tracking_number,
+                        tracking_url=tracking_url,
+                        status=item.get("status"),
+                    )
+                )
 
         return tracking_list
 
@@ -285,8 +305,11 @@ class WooCommerceConnector(PlatformConnector):
                     phone=order_data.get("billing", {}).get("phone"),
                 )
 
+        # Index meta_data once; tracking and order number read from it
+        meta_index = self._meta_index(order_data)
+
         # Extract tracking from meta_data
-        tracking = self._extract_tracking(order_data)
+        tracking = self._extract_tracking(order_data, meta_index)
         has_tracking = len(tracking) > 0
 
         # Parse timestamps
@@ -317,9 +340,9 @@ class WooCommerceConnector(PlatformConnector):
         # Order number (may be customized by plugins)
         order_number = str(order_data.get("number", order_data.get("id", "")))
         # Check for custom order number in meta
-        for meta in order_data.get("meta_data", []):
-            if meta.get("key") in ("_order_number", "order_number"):
-                order_number = str(meta.get("value", order_number))
+        for key in ("_order_number", "order_number"):
+            if (custom_number := meta_index.get(key)) is not None:
+                order_number = str(custom_number)
                 break
 
         return OrderInfo(
@@ -352,17 +375,7 @@ class WooCommerceConnector(PlatformConnector):
 
     def _parse_datetime(self, dt_str: str | None) -> datetime | None:
         """Parse WooCommerce datetime string."""
-        if not dt_str:
-            return None
-        try:
-            # WooCommerce uses ISO 8601 format
-            dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
-            # Ensure timezone-aware (assume UTC if naive)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=UTC)
-            return dt
-        except ValueError:
-            return None
+        return parse_datetime(dt_str)
 
     # =========================================================================
     # Customer Profile and Context Enrichment Methods
@@ -441,7 +454,7 @@ class WooCommerceConnector(PlatformConnector):
             returns_90d=0,
             preferred_contact="email",
             language="en",
-            is_vip=tier == CustomerTier.VIP,
+            is_vip=tier is CustomerTier.VIP,
             is_at_risk=customer_data.get("is_paying_customer", True) is False and orders_count > 0,
         )
 
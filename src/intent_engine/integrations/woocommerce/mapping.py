@@ -1,4 +1,7 @@
-"""Status mapping for WooCommerce orders."""
+"""Status and datetime mapping for WooCommerce orders."""
+
+from datetime import UTC, datetime
+from functools import lru_cache
 
 from intent_engine.integrations.base import FulfillmentStatus, OrderStatus
 
@@ -33,6 +36,23 @@ WOOCOMMERCE_STATUS_MAP: dict[str, OrderStatus] = {
     "wc-checkout-draft": OrderStatus.PENDING,
 }
 
+# Shipment tracking status for completed orders that have tracking
+WOOCOMMERCE_SHIPMENT_STATUS_MAP: dict[str, OrderStatus] = {
+    "delivered": OrderStatus.DELIVERED,
+    "complete": OrderStatus.DELIVERED,
+    "out_for_delivery": OrderStatus.OUT_FOR_DELIVERY,
+    "out for delivery": OrderStatus.OUT_FOR_DELIVERY,
+    "in_transit": OrderStatus.IN_TRANSIT,
+    "in transit": OrderStatus.IN_TRANSIT,
+}
+
+# Order statuses that imply fulfillment; everything else is unfulfilled
+# (processing with tracking is special-cased as partial)
+WOOCOMMERCE_FULFILLMENT_STATUS_MAP: dict[str, FulfillmentStatus] = {
+    "completed": FulfillmentStatus.FULFILLED,
+    "refunded": FulfillmentStatus.FULFILLED,
+}
+
 # Common carrier codes in WooCommerce Shipment Tracking plugin
 CARRIER_MAP: dict[str, str] = {
     "ups": "UPS",
@@ -63,6 +83,12 @@ TRACKING_URL_TEMPLATES: dict[str, str] = {
     "australia_post": "https://auspost.com.au/mypost/track/#/details/{tracking_number}",
 }
 
+# Templates pre-split around the placeholder so URL building skips str.format parsing
+_TRACKING_URL_PARTS: dict[str, tuple[str, str]] = {
+    code: template.partition("{tracking_number}")[::2]
+    for code, template in TRACKING_URL_TEMPLATES.items()
+}
+
 
 def map_order_status(
     wc_status: str,
@@ -81,33 +107,17 @@ def map_order_status(
         Mapped OrderStatus enum value.
     """
     # Normalize status (remove wc- prefix if present)
-    normalized = wc_status.lower().strip()
-    if normalized.startswith("wc-"):
-        normalized = normalized[3:]
+    normalized = wc_status.lower().strip().removeprefix("wc-")
 
     # Check for shipped orders (completed with tracking)
     if normalized == "completed" and has_tracking:
         # If we have shipment status, map it
         if shipment_status:
-            status_lower = shipment_status.lower()
-            if status_lower in ("delivered", "complete"):
-                return OrderStatus.DELIVERED
-            elif status_lower in ("out_for_delivery", "out for delivery"):
-                return OrderStatus.OUT_FOR_DELIVERY
-            elif status_lower in ("in_transit", "in transit"):
-                return OrderStatus.IN_TRANSIT
+            return WOOCOMMERCE_SHIPMENT_STATUS_MAP.get(shipment_status.lower(), OrderStatus.SHIPPED)
         return OrderStatus.SHIPPED
 
-    # Look up in map
-    if normalized in WOOCOMMERCE_STATUS_MAP:
-        return WOOCOMMERCE_STATUS_MAP[normalized]
-
-    # Check with wc- prefix
-    if f"wc-{normalized}" in WOOCOMMERCE_STATUS_MAP:
-        return WOOCOMMERCE_STATUS_MAP[f"wc-{normalized}"]
-
     # Default to processing for unknown statuses
-    return OrderStatus.PROCESSING
+    return WOOCOMMERCE_STATUS_MAP.get(normalized, OrderStatus.PROCESSING)
 
 
 def map_fulfillment_status(wc_status: str, has_tracking: bool = False) -> FulfillmentStatus:
@@ -124,22 +134,13 @@ def map_fulfillment_status(wc_status: str, has_tracking: bool = False) -> Fulfil
     Returns:
         Mapped FulfillmentStatus enum value.
     """
-    normalized = wc_status.lower().strip()
-    if normalized.startswith("wc-"):
-        normalized = normalized[3:]
+    normalized = wc_status.lower().strip().removeprefix("wc-")
 
-    if normalized in ("completed", "refunded"):
-        return FulfillmentStatus.FULFILLED
-    elif normalized == "processing" and has_tracking:
+    if normalized == "processing" and has_tracking:
         return FulfillmentStatus.PARTIAL
-    elif normalized in ("pending", "on-hold", "failed", "cancelled"):
-        return FulfillmentStatus.UNFULFILLED
-
-    # If processing without tracking, still unfulfilled
-    if normalized == "processing":
-        return FulfillmentStatus.UNFULFILLED
 
-    return FulfillmentStatus.UNFULFILLED
+    # Processing without tracking, and any unknown status, is still unfulfilled
+    return WOOCOMMERCE_FULFILLMENT_STATUS_MAP.get(normalized, FulfillmentStatus.UNFULFILLED)
 
 
 def get_carrier_name(carrier_code: str) -> str:
@@ -167,8 +168,28 @@ def get_tracking_url(carrier_code: str, tracking_number: str) -> str | None:
     Returns:
         Tracking URL if template exists, None otherwise.
     """
-    code_lower = carrier_code.lower().strip()
-    template = TRACKING_URL_TEMPLATES.get(code_lower)
-    if template:
-        return template.format(tracking_number=tracking_number)
+    parts = _TRACKING_URL_PARTS.get(carrier_code.lower().strip())
+    if parts:
+        return f"{parts[0]}{tracking_number}{parts[1]}"
     return None
+
+
+@lru_cache(maxsize=1024)
+def parse_datetime(dt_str: str | None) -> datetime | None:
+    """
+    Parse WooCommerce datetime string (ISO 8601), assuming UTC when naive.
+
+    fromisoformat is C-implemented and accepts a trailing "Z" (Python 3.11+). Cached
+    because an order's created/modified/completed stamps often coincide and datetimes
+    are immutable.
+    """
+    if not dt_str:
+        return None
+    try:
+        dt = datetime.fromisoformat(dt_str)
+    except ValueError:
+        return None
+    # Ensure timezone-aware (assume UTC if naive)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt
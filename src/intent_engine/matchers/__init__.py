@@ -1,6 +1,6 @@
 """Intent matching layer - fast path classification."""
 
-from intent_engine.matchers.compound_detector import CompoundDetector
+from intent_engine.matchers.compound_detector import CompoundDetector, get_compound_detector
 from intent_engine.matchers.similarity import IntentMatcher, MatchDecision
 
-__all__ = ["CompoundDetector", "IntentMatcher", "MatchDecision"]
+__all__ = ["CompoundDetector", "IntentMatcher", "MatchDecision", "get_compound_detector"]
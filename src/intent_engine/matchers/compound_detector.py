@@ -2,16 +2,12 @@
 
 import re
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
 
 import spacy
 from spacy.language import Language
 
 from intent_engine.models.response import MatchResult
 
-if TYPE_CHECKING:
-    pass
-
 
 @dataclass
 class CompoundSignal:
@@ -63,6 +59,19 @@ class CompoundDetector:
         r"\b(check|find|get|send|ship|deliver)\b",
     ]
 
+    # Compiled once at class load and shared by every instance
+    _CONJUNCTION_RES = tuple(re.compile(p, re.IGNORECASE) for p in COMPOUND_CONJUNCTIONS)
+    _ACTION_RES = tuple(re.compile(p, re.IGNORECASE) for p in ACTION_VERBS)
+    # Single-pass prefilter: most messages contain no conjunction at all
+    _ANY_CONJUNCTION_RE = re.compile(
+        "|".join(f"(?:{p})" for p in COMPOUND_CONJUNCTIONS), re.IGNORECASE
+    )
+
+    # Messages up to this many words with no inner sentence boundary are treated as a
+    # single segment without running spaCy
+    SHORT_MESSAGE_MAX_WORDS = 8
+    _INNER_BOUNDARY_RE = re.compile(r"[.!?;\n]\s*\S")
+
     # Signal type weights for weighted confidence calculation
     SIGNAL_WEIGHTS = {
         "conjunction": 0.5,
@@ -84,10 +93,8 @@ class CompoundDetector:
             spacy_model: spaCy model for sentence segmentation.
         """
         self.compound_threshold = compound_threshold
-        self._conjunction_patterns = [
-            re.compile(p, re.IGNORECASE) for p in self.COMPOUND_CONJUNCTIONS
-        ]
-        self._action_patterns = [re.compile(p, re.IGNORECASE) for p in self.ACTION_VERBS]
+        self._conjunction_patterns = self._CONJUNCTION_RES
+        self._action_patterns = self._ACTION_RES
         self._nlp: Language | None = None
         self._spacy_model = spacy_model
 
@@ -120,7 +127,11 @@ class CompoundDetector:
         signals.extend(conjunction_signals)
 
         # Check for multiple sentences with different actions
-        sentences = self._segment_sentences(text)
+        if self._is_single_segment(text):
+            stripped = text.strip()
+            sentences = [stripped] if len(stripped) > 3 else []
+        else:
+            sentences = self._segment_sentences(text)
         sentence_signals = self._detect_multi_action_sentences(sentences)
         signals.extend(sentence_signals)
 
@@ -152,6 +163,9 @@ class CompoundDetector:
         """Detect compound conjunctions in text."""
         signals: list[CompoundSignal] = []
 
+        if not self._ANY_CONJUNCTION_RE.search(text):
+            return signals
+
         for pattern in self._conjunction_patterns:
             if pattern.search(text):
                 signals.append(
@@ -164,6 +178,13 @@ class CompoundDetector:
 
         return signals
 
+    def _is_single_segment(self, text: str) -> bool:
+        """Cheap check for short messages that cannot hold more than one sentence."""
+        stripped = text.strip()
+        if len(stripped.split()) > self.SHORT_MESSAGE_MAX_WORDS:
+            return False
+        return not self._INNER_BOUNDARY_RE.search(stripped)
+
     def _segment_sentences(self, text: str) -> list[str]:
         """Split text into sentence segments using spaCy.
 
@@ -189,9 +210,9 @@ class CompoundDetector:
 
         for sentence in sentences:
             actions: set[str] = set()
+            lowered = sentence.lower()
             for pattern in self._action_patterns:
-                matches = pattern.findall(sentence.lower())
-                actions.update(matches)
+                actions.update(pattern.findall(lowered))
             if actions:
                 actions_per_sentence.append(actions)
 
@@ -258,5 +279,18 @@ class CompoundDetector:
             # Just return the top match
             return [top_matches[0].intent_code] if top_matches else []
 
-        # For compound, return top matches with decent similarity
-        return [m.intent_code for m in top_matches[:3] if m.similarity >= 0.50]
+        # For compound, return distinct intents from top matches with decent similarity
+        # (several catalog examples of one intent can appear in the top matches)
+        return list(dict.fromkeys(m.intent_code for m in top_matches[:3] if m.similarity >= 0.50))
+
+
+# Singleton instance (holds the lazily loaded spaCy pipeline)
+_default_detector: CompoundDetector | None = None
+
+
+def get_compound_detector(compound_threshold: float = 0.60) -> CompoundDetector:
+    """Get or create the shared compound detector for the given threshold."""
+    global _default_detector
+    if _default_detector is None or _default_detector.compound_threshold != compound_threshold:
+        _default_detector = CompoundDetector(compound_threshold=compound_threshold)
+    return _default_detector
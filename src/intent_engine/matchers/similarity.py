@@ -3,6 +3,9 @@
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+from numpy.typing import NDArray
+
 from intent_engine.extractors.embedding import EmbeddingExtractor
 from intent_engine.models.entity import EntityType, ExtractedEntity
 from intent_engine.models.intent import IntentConfidence, ResolvedIntent
@@ -103,7 +106,7 @@ class IntentMatcher:
     async def match(
         self,
         text: str,
-        embedding: list[float] | None = None,
+        embedding: list[float] | NDArray[np.float32] | None = None,
         top_k: int = 5,
     ) -> MatchingResult:
         """
@@ -119,7 +122,7 @@ class IntentMatcher:
         """
         # Generate embedding if not provided
         if embedding is None:
-            embedding = self.embedding_extractor.embed(text)
+            embedding = self.embedding_extractor.embed_normalized(text)
 
         # Search for similar intents
         matches = await self.vector_store.similarity_search(
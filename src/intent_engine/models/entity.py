@@ -1,6 +1,7 @@
 """Entity extraction models."""
 
 from enum import Enum
+from functools import cached_property
 
 from pydantic import BaseModel, Field
 
@@ -64,7 +65,9 @@ class ExtractedEntity(BaseModel):
     end_pos: int
     confidence: float = Field(ge=0.0, le=1.0)
 
+    # Frozen: instances are shared across pipeline stages and never mutated
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -76,7 +79,7 @@ class ExtractedEntity(BaseModel):
                     "confidence": 0.99,
                 }
             ]
-        }
+        },
     }
 
 
@@ -99,3 +102,17 @@ class ExtractionResult(BaseModel):
         default_factory=list,
         description="Semantic embedding vector (384 dims for MiniLM)",
     )
+
+    @cached_property
+    def entities_by_type(self) -> dict[EntityType, tuple[ExtractedEntity, ...]]:
+        """
+        Entities grouped by type, built in one pass on first access.
+
+        ``entities_by_type.get(t, ())`` is equivalent to filtering ``entities`` on
+        ``entity_type == t``, in the same order. The grouping is not refreshed if
+        ``entities`` is reassigned afterwards.
+        """
+        grouped: dict[EntityType, list[ExtractedEntity]] = {}
+        for entity in self.entities:
+            grouped.setdefault(entity.entity_type, []).append(entity)
+        return {entity_type: tuple(group) for entity_type, group in grouped.items()}
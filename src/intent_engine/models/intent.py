@@ -1,8 +1,9 @@
 """Intent classification models."""
 
+import sys
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class IntentCategory(str, Enum):
@@ -180,6 +181,12 @@ class ResolvedIntent(BaseModel):
         description="Text spans or signals that support this classification",
     )
 
+    @field_validator("category", "intent", mode="after")
+    @classmethod
+    def intern_code(cls, v: str) -> str:
+        """Intern category/intent names; the vocabulary is small and compared constantly."""
+        return sys.intern(v)
+
     @classmethod
     def from_core_intent(
         cls,
@@ -208,7 +215,9 @@ class ResolvedIntent(BaseModel):
         """Get the full intent code (CATEGORY.INTENT)."""
         return f"{self.category}.{self.intent}"
 
+    # Frozen: instances are shared across pipeline stages and never mutated
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -219,5 +228,5 @@ class ResolvedIntent(BaseModel):
                     "evidence": ["where is my order"],
                 }
             ]
-        }
+        },
     }
@@ -12,6 +12,12 @@ from intent_engine.models.entity import ExtractedEntity
 from intent_engine.models.intent import ResolvedIntent
 from intent_engine.models.response import Constraint
 
+# Fixed reasoning-trace lines, shared instead of rebuilt per call
+STEP_HEADER = "Step 9: Conflict resolution"
+SINGLE_INTENT_REASON = "Single intent - no conflict possible"
+DIFFERENT_ITEMS_REASON = "Intents apply to different items - no conflict"
+NEEDS_CLARIFICATION_REASON = "No clear resolution - requesting clarification"
+
 
 class ConflictResolver:
     """
@@ -48,6 +54,29 @@ class ConflictResolver:
         ),
     }
 
+    # Unordered lookup table built once from EXCLUSIVE_PAIRS: one dict probe per pair
+    _EXCLUSIVE_BY_PAIR: dict[frozenset[str], str] = {
+        frozenset(pair): desc for pair, desc in EXCLUSIVE_PAIRS.items()
+    }
+
+    # Pairs that logically cannot coexist (classified as CONTRADICTORY_POLICY)
+    CONTRADICTORY_PAIRS: frozenset[frozenset[str]] = frozenset(
+        {
+            frozenset({"ORDER_MODIFY.CANCEL_ORDER", "ORDER_MODIFY.EXPEDITE"}),
+            frozenset({"ORDER_MODIFY.CANCEL_ORDER", "ORDER_MODIFY.CHANGE_ADDRESS"}),
+            frozenset({"ORDER_MODIFY.CANCEL_ORDER", "ORDER_MODIFY.CHANGE_ITEMS"}),
+            frozenset({"ORDER_MODIFY.EXPEDITE", "ORDER_MODIFY.DELAY_SHIPMENT"}),
+        }
+    )
+
+    # Pairs never approved together, even for VIP/at-risk customers
+    TIER_BLOCKED_PAIRS: frozenset[frozenset[str]] = frozenset(
+        {
+            frozenset({"ORDER_MODIFY.CANCEL_ORDER", "ORDER_MODIFY.EXPEDITE"}),
+            frozenset({"ORDER_MODIFY.EXPEDITE", "ORDER_MODIFY.DELAY_SHIPMENT"}),
+        }
+    )
+
     # Non-conflicting pairs (informational - these are complementary)
     COMPLEMENTARY_PAIRS: set[tuple[str, str]] = {
         ("ORDER_STATUS.WISMO", "ORDER_STATUS.DELIVERY_ESTIMATE"),
@@ -74,6 +103,21 @@ class ConflictResolver:
         "expedite": ["faster", "rush", "expedite", "urgent", "asap"],
     }
 
+    # Explicit preference phrasings; group 1 captures the action word
+    PREFERENCE_PATTERNS: list[str] = [
+        r"(?:i\s+)?prefer\s+(?:to\s+)?(\w+)",
+        r"(?:i\s+)?(?:want|would like)\s+(?:to\s+)?(?:a\s+)?(\w+)\s+(?:not|instead)",
+        r"(?:just|only)\s+(?:want\s+(?:to\s+)?)?(?:a\s+)?(\w+)",
+        r"(\w+)\s+not\s+(?:a\s+)?(?:refund|return|exchange)",
+    ]
+
+    # Compiled once at class load rather than on every resolve
+    _PREFERENCE_RES = tuple(re.compile(p) for p in PREFERENCE_PATTERNS)
+    _NEGATION_RE = re.compile(
+        r"(refund|return|exchange|cancel|expedite)[^,]*,?\s*not\s+"
+        r"(refund|return|exchange|cancel|expedite)"
+    )
+
     async def resolve(
         self,
         intents: list[ResolvedIntent],
@@ -83,10 +127,34 @@ class ConflictResolver:
         text: str = "",
         customer_tier: str | None = None,
         frustration_score: float = 0.0,
+    ) -> ConflictResolutionOutput:
+        """Async wrapper around resolve_sync (resolution does no I/O)."""
+        return self.resolve_sync(
+            intents=intents,
+            entities=entities,
+            context=context,
+            constraints=constraints,
+            text=text,
+            customer_tier=customer_tier,
+            frustration_score=frustration_score,
+        )
+
+    def resolve_sync(
+        self,
+        intents: list[ResolvedIntent],
+        entities: list[ExtractedEntity],
+        context: EnrichedContext | None = None,
+        constraints: list[Constraint] | None = None,
+        text: str = "",
+        customer_tier: str | None = None,
+        frustration_score: float = 0.0,
     ) -> ConflictResolutionOutput:
         """
         Resolve conflicts between intents.
 
+        Pure rule evaluation with no I/O, so pipeline callers can invoke it
+        directly instead of awaiting a coroutine.
+
         Args:
             intents: List of resolved intents from decomposition.
             entities: Extracted entities from the message.
@@ -99,16 +167,16 @@ class ConflictResolver:
         Returns:
             ConflictResolutionOutput with resolved intents and reasoning.
         """
-        reasoning: list[str] = ["Step 9: Conflict resolution"]
-
+        # Fast path: nothing to compare with fewer than two intents
         if len(intents) < 2:
-            reasoning.append("Single intent - no conflict possible")
             return ConflictResolutionOutput(
                 resolved_intents=intents,
                 has_conflict=False,
-                reasoning=reasoning,
+                reasoning=[STEP_HEADER, SINGLE_INTENT_REASON],
             )
 
+        reasoning: list[str] = [STEP_HEADER]
+
         # Detect conflicts
         conflicts = self._detect_conflicts(intents)
 
@@ -130,7 +198,7 @@ class ConflictResolver:
 
         # Check if items are different (no conflict if different items)
         if self._check_different_items(intents, entities):
-            reasoning.append("Intents apply to different items - no conflict")
+            reasoning.append(DIFFERENT_ITEMS_REASON)
             return ConflictResolutionOutput(
                 resolved_intents=intents,
                 has_conflict=False,
@@ -200,7 +268,7 @@ class ConflictResolver:
 
         # No clear resolution - need clarification
         question, options = self._generate_clarification(intent_a, intent_b)
-        reasoning.append("No clear resolution - requesting clarification")
+        reasoning.append(NEEDS_CLARIFICATION_REASON)
 
         return ConflictResolutionOutput(
             resolved_intents=intents,  # Keep both until clarified
@@ -222,13 +290,9 @@ class ConflictResolver:
 
         for i, intent_a in enumerate(intents):
             for intent_b in intents[i + 1 :]:
-                code_a = intent_a.intent_code
-                code_b = intent_b.intent_code
-
-                # Check both orderings
-                conflict_desc = self.EXCLUSIVE_PAIRS.get(
-                    (code_a, code_b)
-                ) or self.EXCLUSIVE_PAIRS.get((code_b, code_a))
+                conflict_desc = self._EXCLUSIVE_BY_PAIR.get(
+                    frozenset((intent_a.intent_code, intent_b.intent_code))
+                )
 
                 if conflict_desc:
                     conflicts.append((intent_a, intent_b, conflict_desc))
@@ -249,14 +313,7 @@ class ConflictResolver:
                     return ConflictType.POLICY_VIOLATION
 
         # Check for contradictory policy (actions that logically cannot coexist)
-        codes = {intent_a.intent_code, intent_b.intent_code}
-        contradictory_pairs = {
-            frozenset(["ORDER_MODIFY.CANCEL_ORDER", "ORDER_MODIFY.EXPEDITE"]),
-            frozenset(["ORDER_MODIFY.CANCEL_ORDER", "ORDER_MODIFY.CHANGE_ADDRESS"]),
-            frozenset(["ORDER_MODIFY.CANCEL_ORDER", "ORDER_MODIFY.CHANGE_ITEMS"]),
-            frozenset(["ORDER_MODIFY.EXPEDITE", "ORDER_MODIFY.DELAY_SHIPMENT"]),
-        }
-        if frozenset(codes) in contradictory_pairs:
+        if frozenset((intent_a.intent_code, intent_b.intent_code)) in self.CONTRADICTORY_PAIRS:
             return ConflictType.CONTRADICTORY_POLICY
 
         # Default: mutually exclusive
@@ -284,37 +341,29 @@ class ConflictResolver:
         text_lower = text.lower()
 
         # Check for explicit preference patterns with action words
-        preference_patterns = [
-            r"(?:i\s+)?prefer\s+(?:to\s+)?(\w+)",
-            r"(?:i\s+)?(?:want|would like)\s+(?:to\s+)?(?:a\s+)?(\w+)\s+(?:not|instead)",
-            r"(?:just|only)\s+(?:want\s+(?:to\s+)?)?(?:a\s+)?(\w+)",
-            r"(\w+)\s+not\s+(?:a\s+)?(?:refund|return|exchange)",
-        ]
-
-        for pattern in preference_patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in self._PREFERENCE_RES:
+            match = pattern.search(text_lower)
             if match:
-                word = match.group(1)
-                # Map to preference category
-                for pref_type, keywords in self.PREFERENCE_KEYWORDS.items():
-                    if any(kw in word or word in kw for kw in keywords):
-                        return pref_type
+                preference = self._preference_for_word(match.group(1))
+                if preference:
+                    return preference
 
         # Check for negation pattern: "X, not Y" - prefer what's NOT negated
         # "refund, not exchange" -> prefer refund
         # "return for a refund, not exchange" -> prefer refund
-        negation_match = re.search(
-            r"(refund|return|exchange|cancel|expedite)[^,]*,?\s*not\s+(refund|return|exchange|cancel|expedite)",
-            text_lower,
-        )
+        negation_match = self._NEGATION_RE.search(text_lower)
         if negation_match:
-            preferred_word = negation_match.group(1)
-            for pref_type, keywords in self.PREFERENCE_KEYWORDS.items():
-                if any(kw in preferred_word or preferred_word in kw for kw in keywords):
-                    return pref_type
+            return self._preference_for_word(negation_match.group(1))
 
         return None
 
+    def _preference_for_word(self, word: str) -> str | None:
+        """Map a captured action word to its preference category."""
+        for pref_type, keywords in self.PREFERENCE_KEYWORDS.items():
+            if any(kw in word or word in kw for kw in keywords):
+                return pref_type
+        return None
+
     def _apply_preference(
         self,
         intents: list[ResolvedIntent],
@@ -360,13 +409,7 @@ class ConflictResolver:
         # This is a business decision - being lenient with high-value customers
 
         # Don't allow truly contradictory actions even for VIP
-        codes = {intent_a.intent_code, intent_b.intent_code}
-        contradictory_pairs = {
-            frozenset(["ORDER_MODIFY.CANCEL_ORDER", "ORDER_MODIFY.EXPEDITE"]),
-            frozenset(["ORDER_MODIFY.EXPEDITE", "ORDER_MODIFY.DELAY_SHIPMENT"]),
-        }
-
-        if frozenset(codes) in contradictory_pairs:
+        if frozenset((intent_a.intent_code, intent_b.intent_code)) in self.TIER_BLOCKED_PAIRS:
             return False
 
         # VIP/AT_RISK can do return + exchange (we'll handle as sequential)
@@ -2,8 +2,11 @@
 
 import json
 import logging
+import re
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 from intent_engine.models.context import (
@@ -17,7 +20,66 @@ from intent_engine.models.context import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _parse_intent_code(intent_code: str) -> tuple[str, str]:
+    """Split an intent code into (category, intent); codes come from a small vocabulary."""
+    category, _, rest = intent_code.partition(".")
+    return category, rest.partition(".")[0]
+
+
+# Rule stages each intent category needs. Only RETURN_EXCHANGE intents can be
+# auto-approved, so the other core categories skip straight to triage; unknown
+# categories run every stage.
+_ALL_STAGES = frozenset({"return_eligibility", "auto_approval", "escalation", "priority_routing"})
+_TRIAGE_STAGES = frozenset({"escalation", "priority_routing"})
+_CATEGORY_STAGES: dict[str, frozenset[str]] = {
+    "RETURN_EXCHANGE": _ALL_STAGES,
+    "ORDER_STATUS": _TRIAGE_STAGES,
+    "ORDER_MODIFY": _TRIAGE_STAGES,
+    "COMPLAINT": _TRIAGE_STAGES,
+    "PRODUCT_INQUIRY": _TRIAGE_STAGES,
+    "ACCOUNT_BILLING": _TRIAGE_STAGES,
+    "DISCOVERY": _TRIAGE_STAGES,
+    "META": _TRIAGE_STAGES,
+}
+
+# Second dispatch level: the auto-approval rule each intent triggers, if any
+_AUTO_APPROVAL_KINDS: dict[str, str] = {
+    "RETURN_INITIATE": "return",
+    "RETURN_REQUEST": "return",
+    "REFUND_STATUS": "refund",
+    "REFUND_REQUEST": "refund",
+    "EXCHANGE_REQUEST": "replacement",
+    "REPLACEMENT_REQUEST": "replacement",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _EvaluationPlan:
+    """Which optional stages an intent code runs, resolved once per code."""
+
+    intent: str
+    return_eligibility: bool
+    # "return", "refund" or "replacement"; None when no auto-approval rule applies
+    auto_approval: str | None
+
+
+@lru_cache(maxsize=256)
+def _plan_for(intent_code: str) -> _EvaluationPlan:
+    """Specialize evaluation for an intent code; one cache hit replaces parse + dispatch."""
+    category, intent = _parse_intent_code(intent_code)
+    return _EvaluationPlan(
+        intent=intent,
+        return_eligibility=category == "RETURN_EXCHANGE",
+        auto_approval=(
+            _AUTO_APPROVAL_KINDS.get(intent)
+            if "auto_approval" in _CATEGORY_STAGES.get(category, _ALL_STAGES)
+            else None
+        ),
+    )
+
+
+@dataclass(slots=True)
 class PolicyDecision:
     """Result of policy evaluation."""
 
@@ -29,10 +91,14 @@ class PolicyDecision:
     # Escalation
     escalation_required: bool = False
     escalation_reasons: list[str] = field(default_factory=list)
+    # Canonical trigger names ("complaints", "high-value", "frustration") for O(1) checks
+    escalation_tags: frozenset[str] = frozenset()
 
     # Priority routing
     priority_flag: bool = False
     priority_reasons: list[str] = field(default_factory=list)
+    # Canonical trigger names ("vip", "frustration", "high-value")
+    priority_tags: frozenset[str] = frozenset()
 
     # Constraints
     return_eligible: bool = True
@@ -48,6 +114,187 @@ class PolicyDecision:
     evaluated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     rules_applied: list[str] = field(default_factory=list)
 
+    def add_escalation(self, tag: str, reason: str) -> None:
+        """Require escalation, recording a readable reason and its canonical tag."""
+        self.escalation_required = True
+        self.escalation_reasons.append(reason)
+        self.escalation_tags |= {tag}
+
+    def add_priority(self, tag: str, reason: str) -> None:
+        """Flag for priority routing, recording a readable reason and its canonical tag."""
+        self.priority_flag = True
+        self.priority_reasons.append(reason)
+        self.priority_tags |= {tag}
+
+
+@dataclass(frozen=True, slots=True)
+class TierPolicySnapshot:
+    """Thresholds a policy applies to one customer tier."""
+
+    return_window_days: int
+    auto_return_max: float
+    auto_refund_max: float
+    frustration_threshold: float
+
+
+# Keywords shorter than this only take plain inflections ("sue" -> "sues", not "suede")
+_SHORT_KEYWORD_LEN = 4
+
+
+def _keyword_alternative(keyword: str) -> str:
+    """Regex group for one keyword: anchored at a word start, open to inflections."""
+    escaped = re.escape(keyword)
+    if len(keyword) < _SHORT_KEYWORD_LEN:
+        return rf"({escaped})(?:e?[sd])?(?!\w)"
+    return rf"({escaped})\w*"
+
+
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile keywords into one case-insensitive alternation matched from word starts.
+
+    Requiring a word start stops "sue" matching inside "issue", while the open
+    suffix keeps plurals and inflections such as "lawyers" or "fraudulent".
+    """
+    if not keywords:
+        return None
+    alternatives = "|".join(_keyword_alternative(keyword) for keyword in keywords)
+    return re.compile(rf"(?<!\w)(?:{alternatives})", re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class ReturnPolicy:
+    """Compiled ``return_policy`` section."""
+
+    # Lowercased category names for O(1) per-item membership checks
+    final_sale_categories: frozenset[str] = frozenset()
+
+
+@dataclass(frozen=True, slots=True)
+class AutoApprovalPolicy:
+    """Compiled ``auto_approval`` section; per-tier maximums live on the tier snapshots."""
+
+    enabled: bool = True
+    return_excluded_categories: frozenset[str] = frozenset()
+    replacement_enabled: bool = True
+    replacement_max_amount: float = 200
+
+
+@dataclass(frozen=True, slots=True)
+class EscalationPolicy:
+    """Compiled ``escalation`` section."""
+
+    complaint_threshold: int = 3
+    high_value_threshold: float = 500
+    # Base threshold for customers without a tier; tiers adjust it on their snapshots
+    frustration_threshold: float = 0.7
+    # Longest first; group i of keyword_pattern matches keywords[i]
+    keywords: tuple[str, ...] = ()
+    keyword_pattern: re.Pattern[str] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PriorityRoutingPolicy:
+    """Compiled ``priority_routing`` section."""
+
+    enabled: bool = True
+    vip_priority: bool = True
+    high_frustration_priority: bool = True
+    frustration_threshold: float = 0.7
+    high_value_order_threshold: float = 300
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledPolicy:
+    """
+    Typed view of a raw policy dict, built once per policy.
+
+    Rule stages read attributes here instead of drilling through nested
+    dicts with defaults on every evaluation. The raw dict stays the source
+    of truth and is what get_policy() returns.
+    """
+
+    return_policy: ReturnPolicy = field(default_factory=ReturnPolicy)
+    auto_approval: AutoApprovalPolicy = field(default_factory=AutoApprovalPolicy)
+    escalation: EscalationPolicy = field(default_factory=EscalationPolicy)
+    priority_routing: PriorityRoutingPolicy = field(default_factory=PriorityRoutingPolicy)
+    # Resolved once per tier so evaluation does one lookup instead of branching on tier
+    tiers: dict[CustomerTier, TierPolicySnapshot] = field(default_factory=dict)
+
+    @classmethod
+    def from_policy(cls, policy: dict[str, object]) -> "CompiledPolicy":
+        """Compile a raw policy dict, applying the documented defaults."""
+        return_policy = policy.get("return_policy", {})
+        auto_approval = policy.get("auto_approval", {})
+        return_rules = auto_approval.get("return", {})
+        refund_rules = auto_approval.get("refund", {})
+        replacement_rules = auto_approval.get("replacement", {})
+        escalation_rules = policy.get("escalation", {})
+        priority_rules = policy.get("priority_routing", {})
+
+        keywords = tuple(
+            sorted(
+                (kw for kw in escalation_rules.get("auto_escalate_keywords", []) if kw),
+                key=len,
+                reverse=True,
+            )
+        )
+
+        return_max_default = return_rules.get("max_amount_standard", 100)
+        refund_max_default = refund_rules.get("max_amount_standard", 50)
+        return_windows = dict.fromkeys(CustomerTier, return_policy.get("default_window_days", 30))
+        return_windows[CustomerTier.VIP] = return_policy.get("vip_window_days", 60)
+        return_windows[CustomerTier.PREMIUM] = return_policy.get("premium_window_days", 45)
+
+        # VIP: harder to escalate - they get better baseline service
+        # AT_RISK: easier to escalate - retain at-risk customers
+        base_threshold = escalation_rules.get("frustration_score_threshold", 0.7)
+        frustration_thresholds = dict.fromkeys(CustomerTier, base_threshold)
+        frustration_thresholds[CustomerTier.VIP] = min(0.9, base_threshold + 0.1)
+        frustration_thresholds[CustomerTier.AT_RISK] = max(0.4, base_threshold - 0.2)
+
+        return cls(
+            return_policy=ReturnPolicy(
+                final_sale_categories=frozenset(
+                    c.lower() for c in return_policy.get("final_sale_categories", [])
+                ),
+            ),
+            auto_approval=AutoApprovalPolicy(
+                enabled=auto_approval.get("enabled", True),
+                return_excluded_categories=frozenset(
+                    c.lower() for c in return_rules.get("excluded_categories", [])
+                ),
+                replacement_enabled=replacement_rules.get("enabled", True),
+                replacement_max_amount=replacement_rules.get("max_amount", 200),
+            ),
+            escalation=EscalationPolicy(
+                complaint_threshold=escalation_rules.get("complaint_threshold", 3),
+                high_value_threshold=escalation_rules.get("high_value_threshold", 500),
+                frustration_threshold=base_threshold,
+                keywords=keywords,
+                keyword_pattern=_keyword_pattern(keywords),
+            ),
+            priority_routing=PriorityRoutingPolicy(
+                enabled=priority_rules.get("enabled", True),
+                vip_priority=priority_rules.get("vip_priority", True),
+                high_frustration_priority=priority_rules.get("high_frustration_priority", True),
+                frustration_threshold=priority_rules.get("frustration_threshold", 0.7),
+                high_value_order_threshold=priority_rules.get("high_value_order_threshold", 300),
+            ),
+            tiers={
+                tier: TierPolicySnapshot(
+                    return_window_days=return_windows[tier],
+                    auto_return_max=return_rules.get(
+                        f"max_amount_{tier.value}", return_max_default
+                    ),
+                    auto_refund_max=refund_rules.get(
+                        f"max_amount_{tier.value}", refund_max_default
+                    ),
+                    frustration_threshold=frustration_thresholds[tier],
+                )
+                for tier in CustomerTier
+            },
+        )
+
 
 class PolicyEngine:
     """
@@ -85,6 +332,15 @@ class PolicyEngine:
         else:
             self._load_policies()
 
+        # Resolved once so unknown tenants share the default dict without a fallback branch
+        self._fallback_policy: dict[str, object] = self._policies.get("default", {})
+
+        # Keyed by id(); the stored dict keeps the id from being reused while cached
+        self._compiled: dict[int, tuple[dict[str, object], CompiledPolicy]] = {
+            id(policy): (policy, CompiledPolicy.from_policy(policy))
+            for policy in (*self._policies.values(), self._fallback_policy)
+        }
+
     def _load_policies(self) -> None:
         """Load policy configurations from files."""
         if not self.policy_path.exists():
@@ -103,9 +359,14 @@ class PolicyEngine:
 
     def get_policy(self, tenant_id: str) -> dict[str, object]:
         """Get policy for a tenant, falling back to default."""
-        if tenant_id in self._policies:
-            return self._policies[tenant_id]
-        return self._policies.get("default", {})
+        return self._policies.get(tenant_id, self._fallback_policy)
+
+    def _compiled_for(self, policy: dict[str, object]) -> CompiledPolicy:
+        """Get the compiled form of a policy, compiling foreign dicts on the fly."""
+        entry = self._compiled.get(id(policy))
+        if entry is not None and entry[0] is policy:
+            return entry[1]
+        return CompiledPolicy.from_policy(policy)
 
     def evaluate(
         self,
@@ -126,30 +387,78 @@ class PolicyEngine:
         Returns:
             PolicyDecision with approval/escalation/routing decisions.
         """
-        policy = self.get_policy(tenant_id)
+        compiled = self._compiled_for(self.get_policy(tenant_id))
+        return self._evaluate(context, intent_code, compiled, frustration_score)
+
+    def evaluate_many(
+        self,
+        contexts: Sequence[EnrichedContext],
+        intent_codes: Sequence[str],
+        tenant_id: str = "default",
+        frustration_scores: Sequence[float] | None = None,
+    ) -> list[PolicyDecision]:
+        """
+        Evaluate policies for a batch of requests from one tenant.
+
+        The tenant policy is resolved once for the whole batch, which suits
+        offline replay and bulk audits.
+
+        Args:
+            contexts: Enriched contexts, one per request.
+            intent_codes: Resolved intent code for each context.
+            tenant_id: Tenant identifier for policy lookup.
+            frustration_scores: Per-request frustration scores (default 0.0).
+
+        Returns:
+            One PolicyDecision per context, in input order.
+
+        Raises:
+            ValueError: If the input sequences differ in length.
+        """
+        if frustration_scores is None:
+            frustration_scores = [0.0] * len(contexts)
+        compiled = self._compiled_for(self.get_policy(tenant_id))
+        return [
+            self._evaluate(context, intent_code, compiled, frustration_score)
+            for context, intent_code, frustration_score in zip(
+                contexts, intent_codes, frustration_scores, strict=True
+            )
+        ]
+
+    def _evaluate(
+        self,
+        context: EnrichedContext,
+        intent_code: str,
+        compiled: CompiledPolicy,
+        frustration_score: float,
+    ) -> PolicyDecision:
+        """Run the rule stages against an already-resolved policy."""
         decision = PolicyDecision()
 
         # Extract components
         customer = context.customer
         order = context.order
-        category, intent = self._parse_intent_code(intent_code)
+        # Read once; escalation and priority routing both threshold on it
+        order_total = order.total if order else None
+        plan = _plan_for(intent_code)
+        intent = plan.intent
 
         # Evaluate return eligibility
-        if order and category == "RETURN_EXCHANGE":
-            self._evaluate_return_eligibility(decision, order, customer, policy)
+        if order and plan.return_eligibility:
+            self._evaluate_return_eligibility(decision, order, customer, compiled)
             decision.rules_applied.append("return_eligibility")
 
         # Evaluate auto-approval
-        if order and customer:
-            self._evaluate_auto_approval(decision, order, customer, intent, policy)
+        if order and customer and plan.auto_approval:
+            self._evaluate_auto_approval(decision, order, customer, plan.auto_approval, compiled)
             decision.rules_applied.append("auto_approval")
 
         # Evaluate escalation triggers
-        self._evaluate_escalation(decision, context, customer, frustration_score, policy)
+        self._evaluate_escalation(decision, order_total, customer, frustration_score, compiled)
         decision.rules_applied.append("escalation")
 
         # Evaluate priority routing
-        self._evaluate_priority(decision, customer, order, frustration_score, policy)
+        self._evaluate_priority(decision, customer, order_total, frustration_score, compiled)
         decision.rules_applied.append("priority_routing")
 
         # Generate recommendations
@@ -159,21 +468,16 @@ class PolicyEngine:
 
     def _parse_intent_code(self, intent_code: str) -> tuple[str, str]:
         """Parse intent code into category and intent."""
-        parts = intent_code.split(".")
-        category = parts[0] if parts else ""
-        intent = parts[1] if len(parts) > 1 else ""
-        return category, intent
+        return _parse_intent_code(intent_code)
 
     def _evaluate_return_eligibility(
         self,
         decision: PolicyDecision,
         order: OrderContext,
         customer: CustomerProfile | None,
-        policy: dict[str, object],
+        compiled: CompiledPolicy,
     ) -> None:
         """Evaluate return window and eligibility."""
-        return_policy = policy.get("return_policy", {})
-
         # Check explicit eligibility status
         if order.return_eligibility == ReturnEligibility.FINAL_SALE:
             decision.return_eligible = False
@@ -201,11 +505,9 @@ class PolicyEngine:
             return
 
         # Check final sale categories
-        final_sale_categories = return_policy.get("final_sale_categories", [])
+        final_sale_categories = compiled.return_policy.final_sale_categories
         for item in order.items:
-            if item.category and item.category.lower() in [
-                c.lower() for c in final_sale_categories
-            ]:
+            if item.category and item.category.lower() in final_sale_categories:
                 decision.return_eligible = False
                 decision.return_ineligible_reason = f"Category '{item.category}' is final sale"
                 return
@@ -217,31 +519,27 @@ class PolicyEngine:
         decision: PolicyDecision,
         order: OrderContext,
         customer: CustomerProfile,
-        intent: str,
-        policy: dict[str, object],
+        kind: str,
+        compiled: CompiledPolicy,
     ) -> None:
-        """Evaluate auto-approval thresholds."""
-        auto_approval = policy.get("auto_approval", {})
+        """Evaluate the auto-approval threshold for one rule kind."""
+        auto_approval = compiled.auto_approval
 
-        if not auto_approval.get("enabled", True):
+        if not auto_approval.enabled:
             return
 
-        tier = customer.tier.value if customer.tier else "standard"
+        tier_policy = compiled.tiers[customer.tier]
         order_total = order.total
 
         # Return auto-approval
-        if intent in ["RETURN_INITIATE", "RETURN_REQUEST"]:
-            return_rules = auto_approval.get("return", {})
-            max_amount = return_rules.get(
-                f"max_amount_{tier}", return_rules.get("max_amount_standard", 100)
-            )
+        if kind == "return":
+            max_amount = tier_policy.auto_return_max
 
             if order_total <= max_amount and decision.return_eligible:
                 # Check exclusions
-                excluded_categories = return_rules.get("excluded_categories", [])
+                excluded_categories = auto_approval.return_excluded_categories
                 has_excluded = any(
-                    item.category
-                    and item.category.lower() in [c.lower() for c in excluded_categories]
+                    item.category and item.category.lower() in excluded_categories
                     for item in order.items
                 )
 
@@ -249,75 +547,61 @@ class PolicyEngine:
                     decision.auto_approve_return = True
 
         # Refund auto-approval
-        if intent in ["REFUND_STATUS", "REFUND_REQUEST"]:
-            refund_rules = auto_approval.get("refund", {})
-            max_amount = refund_rules.get(
-                f"max_amount_{tier}", refund_rules.get("max_amount_standard", 50)
-            )
+        elif kind == "refund":
+            max_amount = tier_policy.auto_refund_max
 
             if order_total <= max_amount:
                 decision.auto_approve_refund = True
 
         # Replacement auto-approval
-        if intent in ["EXCHANGE_REQUEST", "REPLACEMENT_REQUEST"]:
-            replacement_rules = auto_approval.get("replacement", {})
-            if replacement_rules.get("enabled", True):
-                max_amount = replacement_rules.get("max_amount", 200)
-                if order_total <= max_amount:
+        elif kind == "replacement":
+            if auto_approval.replacement_enabled:
+                if order_total <= auto_approval.replacement_max_amount:
                     decision.auto_approve_replacement = True
 
     def _evaluate_escalation(
         self,
         decision: PolicyDecision,
-        context: EnrichedContext,
+        order_total: float | None,
         customer: CustomerProfile | None,
         frustration_score: float,
-        policy: dict[str, object],
+        compiled: CompiledPolicy,
     ) -> None:
         """Evaluate escalation triggers."""
-        escalation_rules = policy.get("escalation", {})
+        escalation_rules = compiled.escalation
 
         # Check complaint threshold
         if customer:
-            complaint_threshold = escalation_rules.get("complaint_threshold", 3)
+            complaint_threshold = escalation_rules.complaint_threshold
             if customer.complaints_90d >= complaint_threshold:
-                decision.escalation_required = True
-                decision.escalation_reasons.append(
-                    f"Customer has {customer.complaints_90d} complaints in 90 days (threshold: {complaint_threshold})"
+                decision.add_escalation(
+                    "complaints",
+                    f"Customer has {customer.complaints_90d} complaints in 90 days "
+                    f"(threshold: {complaint_threshold})",
                 )
 
         # Check high-value order
-        if context.order:
-            high_value_threshold = escalation_rules.get("high_value_threshold", 500)
-            if context.order.total >= high_value_threshold:
-                decision.escalation_required = True
-                decision.escalation_reasons.append(
-                    f"High-value order: ${context.order.total:.2f} (threshold: ${high_value_threshold:.2f})"
+        if order_total is not None:
+            high_value_threshold = escalation_rules.high_value_threshold
+            if order_total >= high_value_threshold:
+                decision.add_escalation(
+                    "high-value",
+                    f"High-value order: ${order_total:.2f} "
+                    f"(threshold: ${high_value_threshold:.2f})",
                 )
 
         # Check frustration score with tier-aware thresholds
-        base_threshold = escalation_rules.get("frustration_score_threshold", 0.7)
-
-        # Dynamic threshold based on customer tier
-        # VIP: harder to escalate (0.8) - they get better baseline service
-        # AT_RISK: easier to escalate (0.5) - retain at-risk customers
-        # STANDARD/PREMIUM: use base threshold
         if customer:
-            if customer.tier == CustomerTier.VIP:
-                frustration_threshold = min(0.9, base_threshold + 0.1)
-            elif customer.tier == CustomerTier.AT_RISK:
-                frustration_threshold = max(0.4, base_threshold - 0.2)
-            else:
-                frustration_threshold = base_threshold
+            frustration_threshold = compiled.tiers[customer.tier].frustration_threshold
         else:
-            frustration_threshold = base_threshold
+            frustration_threshold = escalation_rules.frustration_threshold
 
         if frustration_score >= frustration_threshold:
-            decision.escalation_required = True
             tier_label = customer.tier.value if customer else "unknown"
-            decision.escalation_reasons.append(
+            decision.add_escalation(
+                "frustration",
                 f"High frustration score: {frustration_score:.2f} "
-                f"(threshold: {frustration_threshold:.2f} for {tier_label} tier)"
+                f"(threshold: {frustration_threshold:.2f} for {tier_label} tier)",
             )
 
         # Check for escalation keywords (would be checked against raw text)
@@ -326,51 +610,48 @@ class PolicyEngine:
     def check_escalation_keywords(
         self, text: str, policy: dict[str, object]
     ) -> list[str]:
-        """Check text for escalation-triggering keywords."""
-        escalation_rules = policy.get("escalation", {})
-        keywords = escalation_rules.get("auto_escalate_keywords", [])
-        text_lower = text.lower()
-
-        found_keywords = []
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                found_keywords.append(keyword)
-
-        return found_keywords
+        """Check text for escalation-triggering keywords, matched from word starts."""
+        escalation = self._compiled_for(policy).escalation
+        if escalation.keyword_pattern is None:
+            return []
+        keywords = escalation.keywords
+        found = dict.fromkeys(
+            keywords[match.lastindex - 1]
+            for match in escalation.keyword_pattern.finditer(text)
+            if match.lastindex
+        )
+        return list(found)
 
     def _evaluate_priority(
         self,
         decision: PolicyDecision,
         customer: CustomerProfile | None,
-        order: OrderContext | None,
+        order_total: float | None,
         frustration_score: float,
-        policy: dict[str, object],
+        compiled: CompiledPolicy,
     ) -> None:
         """Evaluate priority routing."""
-        priority_rules = policy.get("priority_routing", {})
+        priority_rules = compiled.priority_routing
 
-        if not priority_rules.get("enabled", True):
+        if not priority_rules.enabled:
             return
 
         # VIP priority
-        if customer and priority_rules.get("vip_priority", True):
-            if customer.tier == CustomerTier.VIP or customer.is_vip:
-                decision.priority_flag = True
-                decision.priority_reasons.append("VIP customer")
+        if customer and priority_rules.vip_priority:
+            if customer.tier is CustomerTier.VIP or customer.is_vip:
+                decision.add_priority("vip", "VIP customer")
 
         # High frustration priority
-        if priority_rules.get("high_frustration_priority", True):
-            threshold = priority_rules.get("frustration_threshold", 0.7)
+        if priority_rules.high_frustration_priority:
+            threshold = priority_rules.frustration_threshold
             if frustration_score >= threshold:
-                decision.priority_flag = True
-                decision.priority_reasons.append(f"High frustration ({frustration_score:.2f})")
+                decision.add_priority("frustration", f"High frustration ({frustration_score:.2f})")
 
         # High-value order priority
-        if order:
-            threshold = priority_rules.get("high_value_order_threshold", 300)
-            if order.total >= threshold:
-                decision.priority_flag = True
-                decision.priority_reasons.append(f"High-value order (${order.total:.2f})")
+        if order_total is not None:
+            threshold = priority_rules.high_value_order_threshold
+            if order_total >= threshold:
+                decision.add_priority("high-value", f"High-value order (${order_total:.2f})")
 
     def _generate_recommendations(
         self,
@@ -392,7 +673,7 @@ class PolicyEngine:
         elif decision.escalation_required:
             decision.recommended_action = "escalate_to_supervisor"
             decision.suggested_resolution = "Route to supervisor for review"
-        elif not decision.return_eligible and intent in ["RETURN_INITIATE", "RETURN_REQUEST"]:
+        elif not decision.return_eligible and _AUTO_APPROVAL_KINDS.get(intent) == "return":
             decision.recommended_action = "explain_policy"
             decision.suggested_resolution = decision.return_ineligible_reason
         else:
@@ -404,6 +685,7 @@ class PolicyEngine:
         order: OrderContext,
         customer_tier: CustomerTier = CustomerTier.STANDARD,
         tenant_id: str = "default",
+        today: int | None = None,
     ) -> tuple[bool, str | None, int | None]:
         """
         Validate if an order is within return window.
@@ -412,28 +694,24 @@ class PolicyEngine:
             order: Order context.
             customer_tier: Customer tier for extended windows.
             tenant_id: Tenant for policy lookup.
+            today: UTC date ordinal to validate against; pass one when checking
+                many orders in a batch. Defaults to the current UTC date.
 
         Returns:
             Tuple of (is_eligible, reason_if_not, days_remaining).
         """
-        policy = self.get_policy(tenant_id)
-        return_policy = policy.get("return_policy", {})
-
-        # Get window based on tier
-        if customer_tier == CustomerTier.VIP:
-            window_days = return_policy.get("vip_window_days", 60)
-        elif customer_tier == CustomerTier.PREMIUM:
-            window_days = return_policy.get("premium_window_days", 45)
-        else:
-            window_days = return_policy.get("default_window_days", 30)
+        compiled = self._compiled_for(self.get_policy(tenant_id))
+        window_days = compiled.tiers[customer_tier].return_window_days
 
         # Calculate eligibility
         if not order.created_at:
             return True, None, None
 
-        window_end = order.created_at + timedelta(days=window_days)
-        now = datetime.now(timezone.utc)
-        remaining = (window_end - now).days
+        # Whole calendar days between UTC dates, as plain integer ordinals
+        if today is None:
+            today = datetime.now(timezone.utc).toordinal()
+        ordered_on = order.created_at.astimezone(timezone.utc).toordinal()
+        remaining = window_days - (today - ordered_on)
 
         if remaining < 0:
             return False, f"Return window expired {abs(remaining)} days ago", remaining
@@ -64,7 +64,7 @@ class IntentCatalogStore:
             category = intent_code.split(".")[0]
 
             # Generate embeddings for all examples
-            embeddings = self.embedding_extractor.embed_batch(examples)
+            embeddings = self.embedding_extractor.embed_batch_np(examples)
 
             # Prepare records for batch insert
             records = [
@@ -94,7 +94,7 @@ class IntentCatalogStore:
             Number of examples added.
         """
         category = intent_code.split(".")[0]
-        embeddings = self.embedding_extractor.embed_batch(examples)
+        embeddings = self.embedding_extractor.embed_batch_np(examples)
 
         records = [
             (intent_code, category, example, embedding)
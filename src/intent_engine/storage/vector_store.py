@@ -5,6 +5,8 @@ from contextlib import asynccontextmanager
 from dataclasses import dataclass
 
 import asyncpg
+import numpy as np
+from numpy.typing import NDArray
 from pgvector.asyncpg import register_vector
 
 
@@ -110,7 +112,7 @@ class VectorStore:
 
     async def insert_embeddings_batch(
         self,
-        records: list[tuple[str, str, str, list[float]]],
+        records: list[tuple[str, str, str, list[float] | NDArray[np.float32]]],
     ) -> int:
         """
         Insert multiple intent examples in a batch.
@@ -133,7 +135,7 @@ class VectorStore:
 
     async def similarity_search(
         self,
-        embedding: list[float],
+        embedding: list[float] | NDArray[np.float32],
         top_k: int = 5,
         min_similarity: float = 0.0,
     ) -> list[SimilarityMatch]:
@@ -141,7 +143,8 @@ class VectorStore:
         Find the most similar intent examples using cosine similarity.
 
         Args:
-            embedding: The query embedding vector.
+            embedding: The query embedding vector (list or float32 array; pgvector
+                encodes arrays without an intermediate list).
             top_k: Number of results to return.
             min_similarity: Minimum similarity threshold (0-1).
 
@@ -6,7 +6,9 @@ from contextvars import ContextVar
 
 from intent_engine.tenancy.models import TenantConfig
 
-# Context variable for the current tenant
+# Context variable for the current tenant. ContextVar.get is a C-level lookup that is
+# cheaper than a threading.local attribute read, and unlike a thread-local it keeps
+# concurrent requests on one event loop isolated from each other.
 _current_tenant: ContextVar[TenantConfig | None] = ContextVar("current_tenant", default=None)
 
 
@@ -72,6 +74,7 @@ def tenant_context(tenant: TenantConfig) -> Generator[TenantConfig, None, None]:
     try:
         yield tenant
     finally:
+        # reset(token) restores the exact prior state and is cheaper than get() + set(prev)
         _current_tenant.reset(token)
 
 
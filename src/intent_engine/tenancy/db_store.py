@@ -2,6 +2,8 @@
 
 import json
 import logging
+import time
+from collections import OrderedDict
 from typing import Any
 
 import asyncpg
@@ -61,11 +63,27 @@ class DbTenantStore:
 
     Uses the same interface as the in-memory TenantStore:
     get_tenant_by_api_key, get_tenant_by_id, list_tenants, add_tenant.
+
+    API-key lookups run on every authenticated request, so hits are cached per key
+    (LRU with TTL). The TTL bounds how long another process's tenant changes take to
+    show up; local add/remove clears the cache immediately. Misses are not cached.
     """
 
-    def __init__(self, database_url: str) -> None:
+    DEFAULT_API_KEY_CACHE_SIZE = 4096
+    DEFAULT_API_KEY_CACHE_TTL = 30  # seconds
+
+    def __init__(
+        self,
+        database_url: str,
+        api_key_cache_size: int = DEFAULT_API_KEY_CACHE_SIZE,
+        api_key_cache_ttl: float = DEFAULT_API_KEY_CACHE_TTL,
+    ) -> None:
         self._database_url = database_url
         self._pool: asyncpg.Pool | None = None
+        self.api_key_cache_size = api_key_cache_size
+        self.api_key_cache_ttl = api_key_cache_ttl
+        # api_key -> (tenant, expires_at)
+        self._api_key_cache: OrderedDict[str, tuple[TenantConfig, float]] = OrderedDict()
 
     async def connect(self) -> None:
         """Create connection pool and ensure tenants table exists."""
@@ -89,8 +107,20 @@ class DbTenantStore:
             raise RuntimeError("DbTenantStore not connected. Call connect() first.")
         return self._pool
 
+    def clear_api_key_cache(self) -> None:
+        """Drop all cached API-key lookups."""
+        self._api_key_cache.clear()
+
     async def get_tenant_by_api_key(self, api_key: str) -> TenantConfig | None:
         """Get tenant by API key (active only)."""
+        entry = self._api_key_cache.get(api_key)
+        if entry is not None:
+            tenant, expires_at = entry
+            if expires_at >= time.monotonic():
+                self._api_key_cache.move_to_end(api_key)
+                return tenant
+            del self._api_key_cache[api_key]
+
         pool = self._require_pool()
         row = await pool.fetchrow(
             """
@@ -100,7 +130,15 @@ class DbTenantStore:
             """,
             api_key,
         )
-        return _row_to_tenant(row) if row else None
+        if not row:
+            return None
+        tenant = _row_to_tenant(row)
+        if self.api_key_cache_size > 0:
+            self._api_key_cache[api_key] = (tenant, time.monotonic() + self.api_key_cache_ttl)
+            self._api_key_cache.move_to_end(api_key)
+            while len(self._api_key_cache) > self.api_key_cache_size:
+                self._api_key_cache.popitem(last=False)
+        return tenant
 
     async def get_tenant_by_id(self, tenant_id: str) -> TenantConfig | None:
         """Get tenant by tenant_id (active only)."""
@@ -152,6 +190,7 @@ class DbTenantStore:
             tenant.is_active,
             json.dumps(settings),
         )
+        self.clear_api_key_cache()
         logger.info("Tenant upserted: %s", tenant.tenant_id)
 
     async def remove_tenant(self, tenant_id: str) -> bool:
@@ -164,4 +203,5 @@ class DbTenantStore:
             """,
             tenant_id,
         )
+        self.clear_api_key_cache()
         return result == "UPDATE 1"
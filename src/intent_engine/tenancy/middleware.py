@@ -66,6 +66,8 @@ class TenantMiddleware(BaseHTTPMiddleware):
             "/openapi.json",
             "/redoc",
         ]
+        # Resolved once so the per-request check is a single str.startswith call
+        self._exclude_prefixes = tuple(self.exclude_paths)
         self.dev_mode = dev_mode
         self.dev_tenant = dev_tenant or TenantConfig(
             tenant_id="dev-tenant",
@@ -155,10 +157,7 @@ class TenantMiddleware(BaseHTTPMiddleware):
 
     def _should_exclude(self, path: str) -> bool:
         """Check if path should be excluded from tenant auth."""
-        for exclude in self.exclude_paths:
-            if path.startswith(exclude):
-                return True
-        return False
+        return path.startswith(self._exclude_prefixes)
 
     async def _get_tenant(self, request: Request) -> TenantConfig | None:
         """
@@ -175,16 +174,8 @@ class TenantMiddleware(BaseHTTPMiddleware):
         Returns:
             TenantConfig if valid, None otherwise.
         """
-        api_key = None
-
-        # Check Authorization header
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            api_key = auth_header[7:]
-
-        # Check X-API-Key header
-        if not api_key:
-            api_key = request.headers.get("X-API-Key")
+        # Check Authorization and X-API-Key headers
+        api_key = self._api_key_from_headers(request.scope["headers"])
 
         # Check query parameter
         if not api_key:
@@ -195,8 +186,10 @@ class TenantMiddleware(BaseHTTPMiddleware):
 
         # Dev mode: return dev tenant for any key
         if self.dev_mode:
-            # Update dev tenant's API key to match
-            self.dev_tenant.api_key = api_key
+            # Update dev tenant's API key to match; skip the pydantic __setattr__
+            # when the same client keeps sending the same key
+            if self.dev_tenant.api_key != api_key:
+                self.dev_tenant.api_key = api_key
             return self.dev_tenant
 
         # Look up tenant by API key
@@ -205,6 +198,33 @@ class TenantMiddleware(BaseHTTPMiddleware):
 
         return None
 
+    @staticmethod
+    def _api_key_from_headers(raw_headers: list[tuple[bytes, bytes]]) -> str | None:
+        """
+        Extract the API key from raw ASGI headers in a single pass.
+
+        Reads scope["headers"] directly (names are already lowercase) instead of
+        building Starlette's Headers view and probing it once per header name.
+        A non-empty "Bearer" Authorization wins over X-API-Key; the first
+        occurrence of each header counts, as with Headers.get.
+        """
+        authorization: bytes | None = None
+        x_api_key: bytes | None = None
+        for name, value in raw_headers:
+            if name == b"authorization":
+                if authorization is None:
+                    authorization = value
+            elif name == b"x-api-key" and x_api_key is None:
+                x_api_key = value
+
+        if authorization is not None and authorization.startswith(b"Bearer "):
+            bearer = authorization[7:]
+            if bearer:
+                return bearer.decode("latin-1")
+        if x_api_key:
+            return x_api_key.decode("latin-1")
+        return None
+
     async def _lookup_tenant(self, api_key: str) -> TenantConfig | None:
         """
         Look up tenant by API key.
@@ -238,10 +258,22 @@ class TenantStore:
 
     def __init__(self) -> None:
         self._tenants: dict[str, TenantConfig] = {}
+        # Secondary index: tenant_id -> api_key, so ID lookups and removal skip the scan
+        self._api_keys: dict[str, str] = {}
 
     def add_tenant(self, tenant: TenantConfig) -> None:
-        """Add a tenant to the store."""
+        """Add a tenant to the store, replacing any previous key for the same tenant.
+
+        If the API key already belongs to a different tenant, that tenant loses it.
+        """
+        previous_key = self._api_keys.get(tenant.tenant_id)
+        if previous_key is not None and previous_key != tenant.api_key:
+            del self._tenants[previous_key]
+        existing = self._tenants.get(tenant.api_key)
+        if existing is not None and existing.tenant_id != tenant.tenant_id:
+            self._api_keys.pop(existing.tenant_id, None)
         self._tenants[tenant.api_key] = tenant
+        self._api_keys[tenant.tenant_id] = tenant.api_key
 
     def get_tenant_by_api_key(self, api_key: str) -> TenantConfig | None:
         """Get tenant by API key."""
@@ -249,18 +281,16 @@ class TenantStore:
 
     def get_tenant_by_id(self, tenant_id: str) -> TenantConfig | None:
         """Get tenant by tenant ID."""
-        for tenant in self._tenants.values():
-            if tenant.tenant_id == tenant_id:
-                return tenant
-        return None
+        api_key = self._api_keys.get(tenant_id)
+        return self._tenants.get(api_key) if api_key is not None else None
 
     def remove_tenant(self, tenant_id: str) -> bool:
         """Remove a tenant from the store."""
-        for api_key, tenant in list(self._tenants.items()):
-            if tenant.tenant_id == tenant_id:
-                del self._tenants[api_key]
-                return True
-        return False
+        api_key = self._api_keys.pop(tenant_id, None)
+        if api_key is None:
+            return False
+        del self._tenants[api_key]
+        return True
 
     def list_tenants(self) -> list[TenantConfig]:
         """List all tenants."""
@@ -1,5 +1,6 @@
 """Tenant models and configuration."""
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -44,6 +45,22 @@ TIER_RATE_LIMITS: dict[TenantTier, dict[str, int]] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class _TierLimits:
+    """Resolved tier defaults, read by attribute on the per-request path."""
+
+    requests_per_minute: int
+    burst_size: int
+    max_batch_size: int
+    max_websocket_connections: int
+
+
+# Typed view of TIER_RATE_LIMITS: getters do one enum-keyed probe plus an attribute read
+_TIER_LIMITS: dict[TenantTier, _TierLimits] = {
+    tier: _TierLimits(**limits) for tier, limits in TIER_RATE_LIMITS.items()
+}
+
+
 class TenantConfig(BaseModel):
     """Configuration for a tenant."""
 
@@ -81,25 +98,25 @@ class TenantConfig(BaseModel):
         """Get the rate limit for this tenant."""
         if self.requests_per_minute is not None:
             return self.requests_per_minute
-        return TIER_RATE_LIMITS[self.tier]["requests_per_minute"]
+        return _TIER_LIMITS[self.tier].requests_per_minute
 
     def get_burst_size(self) -> int:
         """Get the burst size for this tenant."""
         if self.burst_size is not None:
             return self.burst_size
-        return TIER_RATE_LIMITS[self.tier]["burst_size"]
+        return _TIER_LIMITS[self.tier].burst_size
 
     def get_max_batch_size(self) -> int:
         """Get the maximum batch size for this tenant."""
         if self.max_batch_size is not None:
             return self.max_batch_size
-        return TIER_RATE_LIMITS[self.tier]["max_batch_size"]
+        return _TIER_LIMITS[self.tier].max_batch_size
 
     def get_max_websocket_connections(self) -> int:
         """Get the maximum WebSocket connections for this tenant."""
         if self.max_websocket_connections is not None:
             return self.max_websocket_connections
-        return TIER_RATE_LIMITS[self.tier]["max_websocket_connections"]
+        return _TIER_LIMITS[self.tier].max_websocket_connections
 
     model_config = {
         "json_schema_extra": {
@@ -57,13 +57,6 @@ def database_url() -> str:
     )
 
 
-@pytest.fixture(scope="module")
-def event_loop():
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.mark.asyncio
 async def test_db_tenant_store_connect_add_lookup(database_url: str) -> None:
     """DbTenantStore: connect, add tenant, get by api_key and by id, list."""
@@ -7,6 +7,7 @@ Imports are delayed below to avoid pulling in the full app (and spacy) before mo
 import importlib.util
 import os
 import sys
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -75,7 +76,7 @@ class TestWebSocketEndpoint:
         """Create a mock intent engine."""
         engine = MagicMock()
         engine.resolve_text = AsyncMock(
-            return_value=MagicMock(
+            return_value=SimpleNamespace(
                 model_dump=lambda: {
                     "request_id": "test",
                     "resolved_intents": [],
@@ -0,0 +1,8 @@
+"""Unit test collection settings."""
+
+import sys
+
+# spaCy/sentence-transformers don't import on Python 3.14+; run these with just test-docker
+collect_ignore: list[str] = []
+if sys.version_info >= (3, 14):
+    collect_ignore += ["test_engine.py"]
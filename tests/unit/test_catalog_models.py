@@ -0,0 +1,49 @@
+"""Unit tests for catalog Pydantic models."""
+
+from intent_engine.models.catalog import CatalogProduct, InventoryInfo
+
+
+class TestCatalogModels:
+    """Tests for catalog Pydantic models."""
+
+    def test_catalog_product_minimal(self) -> None:
+        """CatalogProduct with required fields only."""
+        p = CatalogProduct(
+            product_id="p1",
+            name="Widget",
+            price=29.99,
+        )
+        assert p.product_id == "p1"
+        assert p.name == "Widget"
+        assert p.price == 29.99
+        assert p.currency == "USD"
+        assert p.is_in_stock is True
+        assert p.sku is None
+
+    def test_catalog_product_full(self) -> None:
+        """CatalogProduct with optional fields."""
+        p = CatalogProduct(
+            product_id="p1",
+            name="Widget",
+            price=29.99,
+            sku="WIDGET-01",
+            category="Gadgets",
+            is_in_stock=True,
+            inventory_quantity=42,
+            image_url="https://example.com/img.jpg",
+        )
+        assert p.sku == "WIDGET-01"
+        assert p.category == "Gadgets"
+        assert p.inventory_quantity == 42
+
+    def test_inventory_info(self) -> None:
+        """InventoryInfo model."""
+        inv = InventoryInfo(
+            product_id="p1",
+            sku="SKU-01",
+            quantity_available=10,
+            is_in_stock=True,
+        )
+        assert inv.product_id == "p1"
+        assert inv.quantity_available == 10
+        assert inv.is_in_stock is True
@@ -0,0 +1,321 @@
+"""Unit tests for catalog providers and provider selection from settings."""
+
+import sys
+from dataclasses import dataclass, replace
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+if sys.version_info >= (3, 14):
+    pytest.skip(
+        "spaCy/import chain not compatible with Python 3.14+",
+        allow_module_level=True,
+    )
+
+from intent_engine.agents.catalog_agent import (
+    close_catalog_providers,
+    get_catalog_provider_from_settings,
+)
+from intent_engine.integrations.adobe_commerce.catalog import (
+    AdobeCommerceOptimizerCatalogProvider,
+)
+from intent_engine.integrations.shopify.catalog import ShopifyCatalogProvider
+
+
+@dataclass(frozen=True, slots=True)
+class _Settings:
+    """Typed stand-in for the catalog-related Settings fields."""
+
+    shopify_store_domain: str = ""
+    shopify_access_token: str = ""
+    adobe_commerce_optimizer_tenant_id: str = ""
+    adobe_commerce_optimizer_catalog_view_id: str = ""
+    adobe_commerce_optimizer_locale: str = "en_US"
+    adobe_commerce_optimizer_region: str = "na1"
+    adobe_commerce_optimizer_environment: str = "sandbox"
+    adobe_commerce_optimizer_price_book_id: str = ""
+
+
+class TestGetCatalogProviderFromSettings:
+    """Tests for get_catalog_provider_from_settings."""
+
+    @pytest.fixture(autouse=True)
+    async def _clear_provider_cache(self):
+        yield
+        await close_catalog_providers()
+
+    def test_returns_none_when_no_config(self) -> None:
+        """When neither Shopify nor Adobe Optimizer is configured, returns None."""
+        provider = get_catalog_provider_from_settings(settings=_Settings())
+        assert provider is None
+
+    def test_returns_shopify_when_configured(self) -> None:
+        """When Shopify is configured, returns ShopifyCatalogProvider."""
+        settings = _Settings(
+            shopify_store_domain="store.myshopify.com", shopify_access_token="token"
+        )
+        provider = get_catalog_provider_from_settings(settings=settings)
+        assert provider is not None
+        assert provider.platform_name == "shopify"
+
+    def test_reuses_provider_for_same_settings(self) -> None:
+        """Repeated calls with the same credentials return the cached provider."""
+        settings = _Settings(
+            shopify_store_domain="store.myshopify.com", shopify_access_token="token"
+        )
+        first = get_catalog_provider_from_settings(settings=settings)
+        assert get_catalog_provider_from_settings(settings=settings) is first
+        rotated = replace(settings, shopify_access_token="rotated-token")
+        assert get_catalog_provider_from_settings(settings=rotated) is not first
+
+    def test_returns_adobe_optimizer_when_configured_no_shopify(self) -> None:
+        """When only Adobe Optimizer is configured, returns Adobe provider."""
+        settings = _Settings(
+            adobe_commerce_optimizer_tenant_id="tenant-123",
+            adobe_commerce_optimizer_catalog_view_id="view-456",
+        )
+        provider = get_catalog_provider_from_settings(settings=settings)
+        assert provider is not None
+        assert provider.platform_name == "adobe_commerce"
+
+
+class TestShopifyCatalogProvider:
+    """Tests for ShopifyCatalogProvider with mocked HTTP."""
+
+    @pytest.mark.asyncio
+    async def test_search_products_returns_mapped_catalog_products(self) -> None:
+        """search_products maps Shopify API response to CatalogProduct list."""
+        provider = ShopifyCatalogProvider(
+            store_domain="store.myshopify.com",
+            access_token="token",
+        )
+        mock_response = {
+            "products": [
+                {
+                    "id": 12345,
+                    "title": "Blue Widget",
+                    "body_html": "<p>Description</p>",
+                    "product_type": "Gadgets",
+                    "variants": [
+                        {
+                            "id": 67890,
+                            "price": "29.99",
+                            "inventory_quantity": 5,
+                            "sku": "WID-BLU",
+                        }
+                    ],
+                }
+            ]
+        }
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=mock_response)
+
+        # Real client + mock transport so _request (URL building, status check, JSON decode) runs
+        provider._client = httpx.AsyncClient(
+            base_url=provider.base_url,
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            products = await provider.search_products("widget", limit=20)
+        finally:
+            await provider.close()
+        assert len(products) == 1
+        p = products[0]
+        assert p.product_id == "12345"
+        assert p.name == "Blue Widget"
+        assert p.price == 29.99
+        assert p.sku == "WID-BLU"
+        assert p.category == "Gadgets"
+        assert p.is_in_stock is True
+        assert p.inventory_quantity == 5
+        assert len(requests) == 1
+        assert requests[0].url.path == "/admin/api/2024-01/products.json"
+        assert requests[0].url.params["title"] == "widget"
+        assert requests[0].url.params["fields"] == provider.PRODUCT_FIELDS
+
+    @pytest.mark.asyncio
+    async def test_search_products_empty_when_no_results(self) -> None:
+        """search_products returns empty list when API returns no products."""
+        provider = ShopifyCatalogProvider(
+            store_domain="store.myshopify.com",
+            access_token="token",
+        )
+        with patch.object(provider, "_request", new_callable=AsyncMock) as mock_req:
+            mock_req.return_value = {"products": []}
+            products = await provider.search_products("nonexistent")
+        assert products == []
+
+    @pytest.mark.asyncio
+    async def test_get_product_by_id(self) -> None:
+        """get_product by product_id returns mapped CatalogProduct."""
+        provider = ShopifyCatalogProvider(
+            store_domain="store.myshopify.com",
+            access_token="token",
+        )
+        mock_product = {
+            "id": 999,
+            "title": "Single Item",
+            "body_html": None,
+            "variants": [{"price": "19.99", "inventory_quantity": 0, "sku": "SINGLE"}],
+        }
+        with patch.object(provider, "_request", new_callable=AsyncMock) as mock_req:
+            mock_req.return_value = {"product": mock_product}
+            p = await provider.get_product(product_id="999")
+        assert p is not None
+        assert p.product_id == "999"
+        assert p.name == "Single Item"
+        assert p.price == 19.99
+        assert p.is_in_stock is False
+
+    @pytest.mark.asyncio
+    async def test_get_product_returns_none_on_404(self) -> None:
+        """A 404 from the Admin API maps to None rather than raising."""
+        provider = ShopifyCatalogProvider(
+            store_domain="store.myshopify.com",
+            access_token="token",
+        )
+        provider._client = httpx.AsyncClient(
+            base_url=provider.base_url,
+            transport=httpx.MockTransport(lambda request: httpx.Response(404, json={})),
+        )
+        try:
+            p = await provider.get_product(product_id="404")
+        finally:
+            await provider.close()
+        assert p is None
+
+    @pytest.mark.asyncio
+    async def test_get_product_by_sku_uses_single_listing(self) -> None:
+        """SKU lookup parses the match from one full-field listing request."""
+        provider = ShopifyCatalogProvider(
+            store_domain="store.myshopify.com",
+            access_token="token",
+        )
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "products": [
+                        {"id": 1, "title": "Other Item", "variants": [{"sku": "OTHER"}]},
+                        {
+                            "id": 2,
+                            "title": "Wanted Item",
+                            "variants": [
+                                {"price": "5.00", "inventory_quantity": 1, "sku": "WANTED"}
+                            ],
+                        },
+                    ]
+                },
+            )
+
+        provider._client = httpx.AsyncClient(
+            base_url=provider.base_url,
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            p = await provider.get_product(sku="WANTED")
+        finally:
+            await provider.close()
+        assert p is not None
+        assert p.product_id == "2"
+        assert p.name == "Wanted Item"
+        assert len(requests) == 1
+        assert requests[0].url.path == "/admin/api/2024-01/products.json"
+        assert requests[0].url.params["fields"] == provider.PRODUCT_FIELDS
+
+    @pytest.mark.asyncio
+    async def test_get_inventory_from_product(self) -> None:
+        """get_inventory returns InventoryInfo from product data."""
+        provider = ShopifyCatalogProvider(
+            store_domain="store.myshopify.com",
+            access_token="token",
+        )
+        mock_product = {
+            "id": 100,
+            "title": "Item",
+            "body_html": None,
+            "variants": [{"id": 200, "price": "10", "inventory_quantity": 3, "sku": "SKU-X"}],
+        }
+        with patch.object(provider, "_request", new_callable=AsyncMock) as mock_req:
+            mock_req.return_value = {"product": mock_product}
+            inv = await provider.get_inventory(product_id="100")
+        assert inv is not None
+        assert inv.product_id == "100"
+        assert inv.sku == "SKU-X"
+        assert inv.quantity_available == 3
+        assert inv.is_in_stock is True
+
+
+class TestAdobeCommerceOptimizerCatalogProvider:
+    """Tests for AdobeCommerceOptimizerCatalogProvider with mocked GraphQL."""
+
+    @pytest.mark.asyncio
+    async def test_search_products_returns_mapped_catalog_products(self) -> None:
+        """search_products maps GraphQL productSearch to CatalogProduct list."""
+        provider = AdobeCommerceOptimizerCatalogProvider(
+            tenant_id="tenant-1",
+            catalog_view_id="view-1",
+        )
+        mock_data = {
+            "productSearch": {
+                "items": [
+                    {
+                        "productView": {
+                            "id": "p-abc",
+                            "sku": "ADOBE-SKU-1",
+                            "name": "Adobe Widget",
+                            "inStock": True,
+                            "url": "https://store.com/widget",
+                            "price": {
+                                "final": {"amount": {"value": 39.99, "currency": "USD"}},
+                                "regular": {"amount": {"value": 49.99, "currency": "USD"}},
+                            },
+                        }
+                    }
+                ]
+            }
+        }
+        with patch.object(provider, "_graphql", new_callable=AsyncMock) as mock_graphql:
+            mock_graphql.return_value = mock_data
+            products = await provider.search_products("widget", limit=20)
+        assert len(products) == 1
+        p = products[0]
+        assert p.product_id == "p-abc"
+        assert p.name == "Adobe Widget"
+        assert p.sku == "ADOBE-SKU-1"
+        assert p.price == 39.99
+        assert p.compare_at_price == 49.99
+        assert p.is_in_stock is True
+        assert p.url == "https://store.com/widget"
+
+    @pytest.mark.asyncio
+    async def test_get_product_by_sku(self) -> None:
+        """get_product by SKU returns mapped CatalogProduct."""
+        provider = AdobeCommerceOptimizerCatalogProvider(
+            tenant_id="tenant-1",
+            catalog_view_id="view-1",
+        )
+        mock_product = {
+            "id": "p-xyz",
+            "sku": "LOOKUP-SKU",
+            "name": "Lookup Product",
+            "inStock": False,
+            "price": {
+                "final": {"amount": {"value": 15.0, "currency": "USD"}},
+            },
+        }
+        with patch.object(provider, "_graphql", new_callable=AsyncMock) as mock_graphql:
+            mock_graphql.return_value = {"products": [mock_product]}
+            p = await provider.get_product(sku="LOOKUP-SKU")
+        assert p is not None
+        assert p.product_id == "p-xyz"
+        assert p.sku == "LOOKUP-SKU"
+        assert p.price == 15.0
+        assert p.is_in_stock is False
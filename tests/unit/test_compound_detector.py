@@ -2,14 +2,14 @@
 
 import pytest
 
-from intent_engine.matchers.compound_detector import CompoundDetector
+from intent_engine.matchers.compound_detector import CompoundDetector, get_compound_detector
 from intent_engine.models.response import MatchResult
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def detector() -> CompoundDetector:
-    """Create a compound detector instance."""
-    return CompoundDetector()
+    """Shared compound detector (spaCy model loads once per session)."""
+    return get_compound_detector()
 
 
 class TestCompoundDetector:
@@ -20,6 +20,13 @@ class TestCompoundDetector:
         result = detector.detect("Where is my order?")
         assert result.is_compound is False
 
+    def test_short_message_skips_sentence_segmentation(self) -> None:
+        """Test that short single-sentence messages do not need spaCy."""
+        detector = CompoundDetector()
+        result = detector.detect("Where is my order?")
+        assert result.sentence_segments == ["Where is my order?"]
+        assert detector._nlp is None
+
     def test_compound_with_and(self, detector: CompoundDetector) -> None:
         """Test detection of compound with 'and also'."""
         result = detector.detect("I want to return this and also get a refund")
@@ -1,6 +1,7 @@
 """Tests for conflict resolver."""
 
 import pytest
+from pydantic import ValidationError
 
 from intent_engine.models.conflict import (
     ConflictType,
@@ -12,9 +13,9 @@ from intent_engine.models.intent import IntentConfidence, ResolvedIntent
 from intent_engine.reasoners.conflict_resolver import ConflictResolver
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def resolver() -> ConflictResolver:
-    """Create a conflict resolver."""
+    """Conflict resolver shared across the module (it holds no per-call state)."""
     return ConflictResolver()
 
 
@@ -52,6 +53,32 @@ def make_entity(
     )
 
 
+# Frequently used conflicting pairs; intents are frozen, so instances can be shared.
+# Tests take a fresh list with list(PAIR) since resolution may filter it.
+RETURN_EXCHANGE_PAIR = (
+    make_intent("RETURN_EXCHANGE", "RETURN_INITIATE"),
+    make_intent("RETURN_EXCHANGE", "EXCHANGE_REQUEST"),
+)
+CANCEL_EXPEDITE_PAIR = (
+    make_intent("ORDER_MODIFY", "CANCEL_ORDER"),
+    make_intent("ORDER_MODIFY", "EXPEDITE"),
+)
+
+
+class TestModelImmutability:
+    """Intents and entities are frozen so they can be shared safely."""
+
+    def test_intent_and_entity_are_frozen(self) -> None:
+        """Assigning to a field raises instead of mutating a shared instance."""
+        intent = make_intent("ORDER_STATUS", "WISMO")
+        entity = make_entity(EntityType.ORDER_ID, "12345")
+
+        with pytest.raises(ValidationError):
+            intent.intent = "DELIVERY_ESTIMATE"
+        with pytest.raises(ValidationError):
+            entity.value = "67890"
+
+
 class TestNoConflict:
     """Tests for cases with no conflict."""
 
@@ -66,6 +93,15 @@ class TestNoConflict:
         assert result.resolved_intents[0].intent == "WISMO"
         assert "Single intent" in result.reasoning[1]
 
+    def test_resolve_sync_matches_async(self, resolver: ConflictResolver) -> None:
+        """resolve_sync can be called without an event loop."""
+        intents = list(RETURN_EXCHANGE_PAIR)
+
+        result = resolver.resolve_sync(intents=intents, entities=[], text="return or exchange")
+
+        assert result.has_conflict is True
+        assert result.reasoning[0] == "Step 9: Conflict resolution"
+
     async def test_complementary_intents_no_conflict(self, resolver: ConflictResolver) -> None:
         """WISMO + DELIVERY_ESTIMATE are complementary, no conflict."""
         intents = [
@@ -80,10 +116,7 @@ class TestNoConflict:
 
     async def test_different_items_no_conflict(self, resolver: ConflictResolver) -> None:
         """Return item A, exchange item B - no conflict if different items."""
-        intents = [
-            make_intent("RETURN_EXCHANGE", "RETURN_INITIATE"),
-            make_intent("RETURN_EXCHANGE", "EXCHANGE_REQUEST"),
-        ]
+        intents = list(RETURN_EXCHANGE_PAIR)
         entities = [
             make_entity(EntityType.PRODUCT_SKU, "SKU-001", "blue shirt"),
             make_entity(EntityType.PRODUCT_SKU, "SKU-002", "red pants"),
@@ -104,10 +137,7 @@ class TestConflictWithPreference:
 
     async def test_prefer_exchange(self, resolver: ConflictResolver) -> None:
         """'Exchange not return' should resolve to exchange only."""
-        intents = [
-            make_intent("RETURN_EXCHANGE", "RETURN_INITIATE"),
-            make_intent("RETURN_EXCHANGE", "EXCHANGE_REQUEST"),
-        ]
+        intents = list(RETURN_EXCHANGE_PAIR)
 
         result = await resolver.resolve(
             intents=intents,
@@ -122,10 +152,7 @@ class TestConflictWithPreference:
 
     async def test_prefer_refund(self, resolver: ConflictResolver) -> None:
         """'Just want a refund' should resolve to return only."""
-        intents = [
-            make_intent("RETURN_EXCHANGE", "RETURN_INITIATE"),
-            make_intent("RETURN_EXCHANGE", "EXCHANGE_REQUEST"),
-        ]
+        intents = list(RETURN_EXCHANGE_PAIR)
 
         result = await resolver.resolve(
             intents=intents,
@@ -144,10 +171,7 @@ class TestConflictNeedsClairification:
 
     async def test_return_and_exchange_ambiguous(self, resolver: ConflictResolver) -> None:
         """'Return AND exchange' with no preference should request clarification."""
-        intents = [
-            make_intent("RETURN_EXCHANGE", "RETURN_INITIATE"),
-            make_intent("RETURN_EXCHANGE", "EXCHANGE_REQUEST"),
-        ]
+        intents = list(RETURN_EXCHANGE_PAIR)
 
         result = await resolver.resolve(
             intents=intents, entities=[], text="I want a return and an exchange"
@@ -164,10 +188,7 @@ class TestConflictNeedsClairification:
 
     async def test_cancel_and_expedite_clarification(self, resolver: ConflictResolver) -> None:
         """Cancel + Expedite should request clarification."""
-        intents = [
-            make_intent("ORDER_MODIFY", "CANCEL_ORDER"),
-            make_intent("ORDER_MODIFY", "EXPEDITE"),
-        ]
+        intents = list(CANCEL_EXPEDITE_PAIR)
 
         result = await resolver.resolve(
             intents=intents, entities=[], text="cancel the order but also ship it faster"
@@ -184,10 +205,7 @@ class TestPolicyViolation:
 
     async def test_return_after_window_expired(self, resolver: ConflictResolver) -> None:
         """Return after window expired should be policy violation."""
-        intents = [
-            make_intent("RETURN_EXCHANGE", "RETURN_INITIATE"),
-            make_intent("RETURN_EXCHANGE", "EXCHANGE_REQUEST"),
-        ]
+        intents = list(RETURN_EXCHANGE_PAIR)
         context = EnrichedContext(
             order=OrderContext(
                 order_id="123",
@@ -217,10 +235,7 @@ class TestVIPLeniency:
 
     async def test_vip_can_have_both(self, resolver: ConflictResolver) -> None:
         """VIP customers may get both actions approved."""
-        intents = [
-            make_intent("RETURN_EXCHANGE", "RETURN_INITIATE"),
-            make_intent("RETURN_EXCHANGE", "EXCHANGE_REQUEST"),
-        ]
+        intents = list(RETURN_EXCHANGE_PAIR)
 
         result = await resolver.resolve(
             intents=intents,
@@ -236,10 +251,7 @@ class TestVIPLeniency:
 
     async def test_at_risk_customer_leniency(self, resolver: ConflictResolver) -> None:
         """AT_RISK customers get similar leniency."""
-        intents = [
-            make_intent("RETURN_EXCHANGE", "RETURN_INITIATE"),
-            make_intent("RETURN_EXCHANGE", "EXCHANGE_REQUEST"),
-        ]
+        intents = list(RETURN_EXCHANGE_PAIR)
 
         result = await resolver.resolve(
             intents=intents,
@@ -253,10 +265,7 @@ class TestVIPLeniency:
 
     async def test_vip_cannot_cancel_and_expedite(self, resolver: ConflictResolver) -> None:
         """Even VIP cannot do contradictory cancel + expedite."""
-        intents = [
-            make_intent("ORDER_MODIFY", "CANCEL_ORDER"),
-            make_intent("ORDER_MODIFY", "EXPEDITE"),
-        ]
+        intents = list(CANCEL_EXPEDITE_PAIR)
 
         result = await resolver.resolve(
             intents=intents,
@@ -296,10 +305,7 @@ class TestHighFrustration:
         self, resolver: ConflictResolver
     ) -> None:
         """Normal frustration should use business priority rules."""
-        intents = [
-            make_intent("RETURN_EXCHANGE", "RETURN_INITIATE"),
-            make_intent("RETURN_EXCHANGE", "EXCHANGE_REQUEST"),
-        ]
+        intents = list(RETURN_EXCHANGE_PAIR)
 
         result = await resolver.resolve(
             intents=intents,
@@ -346,16 +352,27 @@ class TestContradictoryActions:
         assert result.has_conflict is True
         assert result.conflict_type == ConflictType.CONTRADICTORY_POLICY
 
+    async def test_pair_detected_in_either_order(self, resolver: ConflictResolver) -> None:
+        """Exclusive pairs are matched regardless of intent order."""
+        intents = [
+            make_intent("ORDER_MODIFY", "DELAY_SHIPMENT"),
+            make_intent("ORDER_MODIFY", "EXPEDITE"),
+        ]
+
+        result = await resolver.resolve(
+            intents=intents, entities=[], text="delay it, or maybe expedite"
+        )
+
+        assert result.has_conflict is True
+        assert result.conflict_description == "Cannot expedite and delay the same shipment"
+
 
 class TestClarificationGeneration:
     """Tests for clarification question generation."""
 
     async def test_clarification_question_format(self, resolver: ConflictResolver) -> None:
         """Clarification question should be well-formed."""
-        intents = [
-            make_intent("RETURN_EXCHANGE", "RETURN_INITIATE"),
-            make_intent("RETURN_EXCHANGE", "EXCHANGE_REQUEST"),
-        ]
+        intents = list(RETURN_EXCHANGE_PAIR)
 
         # Force clarification by not having VIP/high frustration/preference
         result = await resolver.resolve(
@@ -387,10 +404,7 @@ class TestReasoningTrace:
 
     async def test_conflict_reasoning_detailed(self, resolver: ConflictResolver) -> None:
         """Conflict reasoning should include detection and resolution details."""
-        intents = [
-            make_intent("RETURN_EXCHANGE", "RETURN_INITIATE"),
-            make_intent("RETURN_EXCHANGE", "EXCHANGE_REQUEST"),
-        ]
+        intents = list(RETURN_EXCHANGE_PAIR)
 
         result = await resolver.resolve(
             intents=intents,
@@ -0,0 +1,109 @@
+"""Unit tests for DbTenantStore API-key caching (pool is faked; no database needed)."""
+
+from typing import Any
+
+import pytest
+
+from intent_engine.tenancy.db_store import DbTenantStore
+from intent_engine.tenancy.models import TenantConfig, TenantTier
+
+_ROW = {
+    "tenant_id": "db-tenant",
+    "name": "DB Tenant",
+    "api_key": "db-key",
+    "tier": "professional",
+    "is_active": True,
+    "settings": "{}",
+}
+
+
+class _FakePool:
+    """Records fetchrow/execute calls and serves rows keyed by the first query arg."""
+
+    def __init__(self, rows: dict[str, dict[str, Any]]) -> None:
+        self.rows = rows
+        self.fetchrow_calls = 0
+
+    async def fetchrow(self, query: str, key: str) -> dict[str, Any] | None:
+        self.fetchrow_calls += 1
+        return self.rows.get(key)
+
+    async def execute(self, query: str, *args: Any) -> str:
+        return "UPDATE 1"
+
+
+def _store(pool: _FakePool, **kwargs: Any) -> DbTenantStore:
+    store = DbTenantStore(database_url="postgresql://unused", **kwargs)
+    store._pool = pool  # type: ignore[assignment]
+    return store
+
+
+class TestApiKeyCache:
+    """Tests for the per-key tenant cache on get_tenant_by_api_key."""
+
+    async def test_hit_is_served_from_cache(self):
+        """Repeated lookups for a known key reuse the cached tenant."""
+        pool = _FakePool({"db-key": _ROW})
+        store = _store(pool)
+
+        first = await store.get_tenant_by_api_key("db-key")
+        second = await store.get_tenant_by_api_key("db-key")
+
+        assert first is not None
+        assert first.tier == TenantTier.PROFESSIONAL
+        assert second is first
+        assert pool.fetchrow_calls == 1
+
+    async def test_miss_is_not_cached(self):
+        """Unknown keys go to the database every time."""
+        pool = _FakePool({})
+        store = _store(pool)
+
+        assert await store.get_tenant_by_api_key("unknown") is None
+        pool.rows["unknown"] = _ROW
+        assert await store.get_tenant_by_api_key("unknown") is not None
+        assert pool.fetchrow_calls == 2
+
+    async def test_expired_entry_is_refetched(self):
+        """Entries past their TTL are fetched again."""
+        pool = _FakePool({"db-key": _ROW})
+        store = _store(pool, api_key_cache_ttl=-1)
+
+        await store.get_tenant_by_api_key("db-key")
+        await store.get_tenant_by_api_key("db-key")
+
+        assert pool.fetchrow_calls == 2
+
+    async def test_lru_eviction_bounds_size(self):
+        """The least recently used key is evicted at capacity."""
+        pool = _FakePool({"key-a": _ROW, "key-b": _ROW})
+        store = _store(pool, api_key_cache_size=1)
+
+        await store.get_tenant_by_api_key("key-a")
+        await store.get_tenant_by_api_key("key-b")
+        await store.get_tenant_by_api_key("key-a")
+
+        assert pool.fetchrow_calls == 3
+        assert list(store._api_key_cache) == ["key-a"]
+
+    @pytest.mark.parametrize("mutation", ["add_tenant", "remove_tenant"])
+    async def test_mutations_clear_cache(self, mutation):
+        """Local tenant writes invalidate cached lookups."""
+        pool = _FakePool({"db-key": _ROW})
+        store = _store(pool)
+        await store.get_tenant_by_api_key("db-key")
+
+        if mutation == "add_tenant":
+            await store.add_tenant(
+                TenantConfig(
+                    tenant_id="db-tenant",
+                    name="DB Tenant",
+                    tier=TenantTier.FREE,
+                    api_key="db-key",
+                )
+            )
+        else:
+            await store.remove_tenant("db-tenant")
+        await store.get_tenant_by_api_key("db-key")
+
+        assert pool.fetchrow_calls == 2
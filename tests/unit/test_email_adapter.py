@@ -6,9 +6,9 @@ from intent_engine.ingestion.email import EmailAdapter
 from intent_engine.models.request import InputChannel
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def adapter() -> EmailAdapter:
-    """Create an email adapter instance."""
+    """Email adapter shared across the module (it holds no per-call state)."""
     return EmailAdapter()
 
 
@@ -32,6 +32,10 @@ class TestEmailAdapterValidation:
         }
         assert adapter.validate(raw_input) is True
 
+    def test_invalid_non_string_mime_email(self, adapter: EmailAdapter) -> None:
+        """Test validation fails when raw_email is not a string."""
+        assert adapter.validate({"raw_email": b"From: a@b.com", "tenant_id": "t"}) is False
+
     def test_invalid_missing_body(self, adapter: EmailAdapter) -> None:
         """Test validation fails without body."""
         raw_input = {
@@ -207,6 +211,18 @@ Previous message content."""
         assert "New content" in result
         assert "Quoted line" not in result
 
+    def test_extract_stops_at_first_boundary(self, adapter: EmailAdapter) -> None:
+        """Test everything after the first quote boundary is dropped."""
+        body = """Latest reply
+
+From: Support <help@store.com>
+Older reply
+
+> On Mon, Jan 15, 2024, Customer wrote:
+>> Original question"""
+        result = adapter._extract_latest_message(body)
+        assert result.strip() == "Latest reply"
+
     def test_extract_plain_message(self, adapter: EmailAdapter) -> None:
         """Test plain message without quotes is preserved."""
         body = "Just a simple message without any quotes."
@@ -238,6 +254,15 @@ class TestHtmlToText:
         assert "Text" in result
         assert "color" not in result
 
+    def test_skips_head_and_decodes_entities(self, adapter: EmailAdapter) -> None:
+        """Test head content is dropped and character references are decoded."""
+        html = (
+            "<html><head><title>Newsletter</title></head>"
+            "<body><p>Fish &amp; chips</p><!-- tracking --><br>Thanks</body></html>"
+        )
+        result = adapter._html_to_text(html)
+        assert result == "Fish & chips\nThanks"
+
 
 class TestMimeEmailParsing:
     """Tests for MIME email parsing."""
@@ -275,6 +300,39 @@ Thanks for the help."""
         assert parsed["in_reply_to"] == "<original@mail.com>"
         assert len(parsed["references"]) == 2
 
+    def test_parse_encoded_subject_and_date(self, adapter: EmailAdapter) -> None:
+        """Test RFC 2047 subjects are decoded and the Date header is parsed."""
+        raw_email = """From: =?utf-8?q?Ren=C3=A9e?= <renee@example.com>
+Subject: =?utf-8?q?Commande_retard=C3=A9e?=
+Date: Mon, 15 Jan 2024 10:30:00 +0000
+
+Bonjour"""
+
+        parsed = adapter._parse_mime_email(raw_email)
+
+        assert parsed["from_name"] == "Renée"
+        assert parsed["subject"] == "Commande retardée"
+        assert parsed["timestamp"].year == 2024
+        assert parsed["references"] == []
+        assert parsed["message_id"] is None
+
+    def test_parse_raw_non_ascii_headers(self, adapter: EmailAdapter) -> None:
+        """Unencoded non-ASCII headers keep their text and stay UTF-8 encodable."""
+        raw_email = """From: Renée Dupont <renee@example.com>
+Subject: Commande retardée
+Date: Mon, 15 Jan 2024 10:30:00 +0000
+
+Where is my order?"""
+
+        parsed = adapter._parse_mime_email(raw_email)
+
+        assert parsed["from_name"] == "Renée Dupont"
+        assert parsed["from_email"] == "renee@example.com"
+        assert parsed["subject"] == "Commande retardée"
+        assert "Where is my order?" in parsed["body"]
+        parsed["from_name"].encode("utf-8")
+        parsed["subject"].encode("utf-8")
+
 
 class TestRawTextBuilding:
     """Tests for combining subject and body."""
@@ -320,3 +378,8 @@ class TestOrderIdExtraction:
         """Test no extraction when no order IDs."""
         order_ids = adapter.extract_order_ids("I have a general question")
         assert len(order_ids) == 0
+
+    def test_extract_dedupes_in_order(self, adapter: EmailAdapter) -> None:
+        """Test repeated IDs collapse to one entry, keeping first-seen order."""
+        order_ids = adapter.extract_order_ids("#5555, ORDER_123456, #5555 and ord-98765")
+        assert order_ids == ["5555", "ORDER_123456", "ord-98765"]
@@ -1,14 +1,15 @@
 """Tests for embedding extraction."""
 
+import numpy as np
 import pytest
 
 # Import directly to avoid loading spaCy via __init__
 from intent_engine.extractors.embedding import EmbeddingExtractor
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def extractor() -> EmbeddingExtractor:
-    """Create an embedding extractor instance."""
+    """Embedding extractor shared across the module (model loads once)."""
     return EmbeddingExtractor()
 
 
@@ -20,7 +21,38 @@ class TestEmbeddingExtractor:
         embedding = extractor.embed("Where is my order?")
         assert isinstance(embedding, list)
         assert len(embedding) == 384  # MiniLM dimension
-        assert all(isinstance(x, float) for x in embedding)
+        assert isinstance(embedding[0], float)
+
+    def test_embed_normalized_returns_float32_array(self, extractor: EmbeddingExtractor) -> None:
+        """Test the array path used internally for matching and storage."""
+        embedding = extractor.embed_normalized("Where is my order?")
+        assert embedding.dtype == np.float32
+        assert embedding.shape == (384,)
+        assert float(np.linalg.norm(embedding)) == pytest.approx(1.0, abs=1e-4)
+
+    def test_embed_reuses_cached_embedding(
+        self, extractor: EmbeddingExtractor, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test repeated texts are served from the cache without re-encoding."""
+        first = extractor.embed("Where is my order?")
+        monkeypatch.setattr(extractor, "_model", None)  # a cache miss would reload the model
+        second = extractor.embed("Where is my order?")
+        assert second == first
+        assert extractor._model is None
+        second[0] = 42.0
+        assert extractor.embed("Where is my order?") == first
+        extractor.clear_cache()
+        assert extractor._cache == {}
+
+    def test_embed_normalized_cached_array_is_read_only(
+        self, extractor: EmbeddingExtractor
+    ) -> None:
+        """Test in-place writes to the shared cached array are rejected."""
+        embedding = extractor.embed_normalized("Where is my order?")
+        assert not embedding.flags.writeable
+        with pytest.raises(ValueError):
+            embedding[0] = 42.0
+        assert extractor.embed_normalized("Where is my order?") is embedding
 
     def test_embed_batch(self, extractor: EmbeddingExtractor) -> None:
         """Test batch embedding."""
@@ -29,6 +61,14 @@ class TestEmbeddingExtractor:
         assert len(embeddings) == 3
         assert all(len(e) == 384 for e in embeddings)
 
+    def test_embed_batch_np_matches_single_embed(self, extractor: EmbeddingExtractor) -> None:
+        """Test batched array embedding agrees with per-text embedding."""
+        texts = ["Where is my order?", "Cancel my order"]
+        matrix = extractor.embed_batch_np(texts)
+        assert matrix.shape == (2, 384)
+        assert matrix.dtype == np.float32
+        assert np.allclose(matrix[0], extractor.embed(texts[0]), atol=1e-5)
+
     def test_similar_texts_high_similarity(self, extractor: EmbeddingExtractor) -> None:
         """Test that similar texts have high similarity."""
         emb1 = extractor.embed("Where is my order?")
@@ -50,8 +90,23 @@ class TestEmbeddingExtractor:
         """Test embedding_dim property."""
         assert extractor.embedding_dim == 384
 
+    def test_embedding_dim_does_not_load_model(self) -> None:
+        """Test embedding_dim for a known model leaves the model unloaded."""
+        fresh = EmbeddingExtractor()
+        assert fresh.embedding_dim == 384
+        assert fresh._model is None
+
     def test_similarity_self(self, extractor: EmbeddingExtractor) -> None:
         """Test that same text has similarity ~1.0."""
         emb = extractor.embed("Where is my order?")
         similarity = extractor.similarity(emb, emb)
         assert similarity > 0.99
+
+    def test_similarity_accepts_arrays(self, extractor: EmbeddingExtractor) -> None:
+        """Test similarity on ndarray embeddings matches the list-based result."""
+        vec1 = extractor.embed_normalized("Where is my order?")
+        vec2 = extractor.embed_normalized("Track my order please")
+        assert vec1.dtype == np.float32
+        assert extractor.similarity(vec1, vec2) == pytest.approx(
+            extractor.similarity(vec1.tolist(), vec2.tolist()), abs=1e-6
+        )
@@ -1,73 +1,60 @@
 """Unit tests for IntentEngine with mocked EngineComponents."""
 
-import sys
-from unittest.mock import AsyncMock, MagicMock
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-# Skip on Python 3.14: spacy/sentence_transformers not compatible; run with just test-docker
-pytestmark = pytest.mark.skipif(
-    sys.version_info >= (3, 14),
-    reason="spacy/sentence_transformers not compatible with Python 3.14; use just test-docker",
+from intent_engine.engine import EngineComponents, IntentEngine
+from intent_engine.extractors.embedding import EmbeddingExtractor
+from intent_engine.extractors.entity_extractor import EntityExtractor
+from intent_engine.matchers.compound_detector import CompoundDetectionResult, CompoundDetector
+from intent_engine.matchers.similarity import IntentMatcher, MatchDecision, MatchingResult
+from intent_engine.models.entity import EntityType, ExtractedEntity, ExtractionResult
+from intent_engine.models.intent import IntentConfidence, ResolvedIntent
+from intent_engine.models.request import InputChannel, IntentRequest
+from intent_engine.models.response import MatchResult
+from intent_engine.reasoners.conflict_resolver import ConflictResolver
+from intent_engine.reasoners.decomposer import DecompositionOutput, IntentDecomposer
+from intent_engine.storage.vector_store import VectorStore
+
+# Built once: the engine never mutates these, so every test can share them
+_ORDER_ID_ENTITY = ExtractedEntity(
+    entity_type=EntityType.ORDER_ID,
+    value="12345",
+    raw_span="#12345",
+    start_pos=0,
+    end_pos=5,
+    confidence=0.99,
 )
-
-if sys.version_info < (3, 14):
-    from intent_engine.engine import EngineComponents, IntentEngine
-    from intent_engine.matchers.similarity import MatchDecision, MatchingResult
-    from intent_engine.models.entity import EntityType, ExtractedEntity, ExtractionResult
-    from intent_engine.models.intent import IntentConfidence, ResolvedIntent
-    from intent_engine.models.request import InputChannel, IntentRequest
-    from intent_engine.models.response import MatchResult
-    from intent_engine.reasoners.decomposer import DecompositionOutput
-else:
-    # Dummies so collection succeeds when skipped
-    EngineComponents = IntentEngine = MatchDecision = MatchingResult = None
-    ExtractionResult = ExtractedEntity = EntityType = None
-    IntentConfidence = ResolvedIntent = InputChannel = IntentRequest = None
-    MatchResult = DecompositionOutput = None
-
-
-def _make_components(
-    *,
-    match_decision: MatchDecision | None = None,
-    top_similarity: float = 0.92,
-    is_compound: bool = False,
-    decomposer: object | None = None,
-    top_matches: list | None = None,
-) -> EngineComponents:
-    """Build EngineComponents with mocks for engine.resolve() tests."""
-    if match_decision is None:
-        match_decision = MatchDecision.FAST_PATH
-    extraction_result = ExtractionResult(
-        entities=[
-            ExtractedEntity(
-                entity_type=EntityType.ORDER_ID,
-                value="12345",
-                raw_span="#12345",
-                start_pos=0,
-                end_pos=5,
-                confidence=0.99,
-            )
-        ],
-        embedding=[0.1] * 384,
+_EMBEDDING = [0.1] * 384
+_COMPOUND_RESULTS = {
+    flag: CompoundDetectionResult(
+        is_compound=flag, signals=[], sentence_segments=[], confidence=0.8 if flag else 0.0
     )
+    for flag in (False, True)
+}
 
-    entity_extractor = MagicMock()
-    entity_extractor.extract.return_value = extraction_result
-
-    embedding_extractor = MagicMock()
-    embedding_extractor.embed.return_value = [0.1] * 384
 
-    vector_store = MagicMock()
-
-    if top_matches is None:
-        top_matches = [
+@cache
+def _matching_result(
+    decision: MatchDecision, top_similarity: float, has_matches: bool
+) -> MatchingResult:
+    """Canned matcher output, built once per (decision, similarity, has_matches)."""
+    top_matches = (
+        [
             MatchResult(
                 intent_code="ORDER_STATUS.WISMO",
                 similarity=top_similarity,
                 matched_example="where is my order",
             )
         ]
+        if has_matches
+        else []
+    )
     resolved_intent = (
         ResolvedIntent(
             category="ORDER_STATUS",
@@ -76,25 +63,48 @@ def _make_components(
             confidence_tier=IntentConfidence.HIGH,
             evidence=["where is my order"],
         )
-        if match_decision == MatchDecision.FAST_PATH and top_matches
+        if decision == MatchDecision.FAST_PATH and has_matches
         else None
     )
-
-    match_result = MatchingResult(
-        decision=match_decision,
+    return MatchingResult(
+        decision=decision,
         top_matches=top_matches,
         resolved_intent=resolved_intent,
     )
 
-    intent_matcher = MagicMock()
-    intent_matcher.match = AsyncMock(return_value=match_result)
 
-    compound_result = MagicMock()
-    compound_result.is_compound = is_compound
-    compound_result.signals = []
+def _make_components(
+    *,
+    match_decision: MatchDecision | None = None,
+    top_similarity: float = 0.92,
+    is_compound: bool = False,
+    decomposer: object | None = None,
+    no_matches: bool = False,
+) -> EngineComponents:
+    """Build EngineComponents with spec'd stubs for engine.resolve() tests.
+
+    spec_set stubs reject attributes the real classes lack, so API drift fails fast.
+    """
+    if match_decision is None:
+        match_decision = MatchDecision.FAST_PATH
+    # Fresh per call: the engine assigns the query embedding onto the extraction result
+    extraction_result = ExtractionResult(entities=[_ORDER_ID_ENTITY], embedding=_EMBEDDING)
+
+    entity_extractor = Mock(spec_set=EntityExtractor)
+    entity_extractor.extract = Mock(return_value=extraction_result)
+
+    embedding_extractor = Mock(spec_set=EmbeddingExtractor)
+    embedding_extractor.embed = Mock(return_value=_EMBEDDING)
+
+    vector_store = Mock(spec_set=VectorStore)
+
+    intent_matcher = Mock(spec_set=IntentMatcher)
+    intent_matcher.match = AsyncMock(
+        return_value=_matching_result(match_decision, top_similarity, not no_matches)
+    )
 
-    compound_detector = MagicMock()
-    compound_detector.detect.return_value = compound_result
+    compound_detector = Mock(spec_set=CompoundDetector)
+    compound_detector.detect = Mock(return_value=_COMPOUND_RESULTS[is_compound])
 
     return EngineComponents(
         entity_extractor=entity_extractor,
@@ -106,13 +116,13 @@ def _make_components(
         sentiment_analyzer=None,
         context_enricher=None,
         policy_engine=None,
-        conflict_resolver=MagicMock(),
+        conflict_resolver=Mock(spec_set=ConflictResolver),
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_request() -> IntentRequest:
-    """Minimal intent request for tests."""
+    """Minimal intent request shared by the module (resolve() only reads it)."""
     return IntentRequest(
         request_id="test-req",
         tenant_id="test-tenant",
@@ -121,55 +131,108 @@ def sample_request() -> IntentRequest:
     )
 
 
-@pytest.mark.asyncio
-async def test_resolve_fast_path(sample_request: IntentRequest) -> None:
-    """Engine returns fast path result when match is high confidence and not compound."""
-    components = _make_components(
-        match_decision=MatchDecision.FAST_PATH,
-        top_similarity=0.92,
-        is_compound=False,
-    )
-    engine = IntentEngine(components=components)
-    await engine.initialize()
-
-    result = await engine.resolve(sample_request)
-
-    assert result.path_taken == "fast_path"
-    assert len(result.resolved_intents) == 1
-    assert result.resolved_intents[0].category == "ORDER_STATUS"
-    assert result.resolved_intents[0].intent == "WISMO"
-    assert result.is_compound is False
-    assert result.entities
-    assert result.entities[0].entity_type == EntityType.ORDER_ID
-    assert result.entities[0].value == "12345"
-
-
-@pytest.mark.asyncio
-async def test_resolve_fast_path_fallback_when_no_decomposer(
+@pytest.fixture(scope="module")
+def engine_factory() -> Callable[..., Awaitable[IntentEngine]]:
+    """Build and initialize one engine per distinct _make_components configuration.
+
+    Repeat requests for the same configuration reuse the cached engine with its
+    matcher call history reset.
+    """
+    engines: dict[tuple[tuple[str, Any], ...], IntentEngine] = {}
+
+    async def factory(**kwargs: Any) -> IntentEngine:
+        key = tuple(sorted(kwargs.items()))
+        engine = engines.get(key)
+        if engine is None:
+            engine = IntentEngine(components=_make_components(**kwargs))
+            await engine.initialize()
+            engines[key] = engine
+        else:
+            engine.components.intent_matcher.match.reset_mock()
+        return engine
+
+    return factory
+
+
+@dataclass(frozen=True)
+class ResolveCase:
+    """One routing scenario for engine.resolve() with a mocked matcher."""
+
+    decision: str  # MatchDecision member name
+    top_similarity: float
+    expected_path: str
+    is_compound: bool = False
+    no_matches: bool = False
+    expected_intent: str | None = "WISMO"
+    expected_requires_human: bool | None = None
+    handoff_reason_contains: str | None = None
+    expects_order_entity: bool = False
+
+
+RESOLVE_CASES = {
+    # High-confidence, single intent: resolved straight from the matcher
+    "fast_path": ResolveCase("FAST_PATH", 0.92, "fast_path", expects_order_entity=True),
+    # Reasoning path needed but no decomposer: best match, flagged for a human
+    "fallback_without_decomposer": ResolveCase(
+        "REASONING_PATH",
+        0.75,
+        "fast_path_fallback",
+        expected_requires_human=True,
+        handoff_reason_contains="LLM",
+    ),
+    # Compound signal forces the reasoning path even with high similarity
+    "compound_forces_reasoning": ResolveCase(
+        "FAST_PATH", 0.90, "fast_path_fallback", is_compound=True
+    ),
+    # Empty catalog matches and no decomposer
+    "no_match": ResolveCase(
+        "REASONING_PATH",
+        0.0,
+        "no_match",
+        no_matches=True,
+        expected_intent=None,
+        expected_requires_human=True,
+        handoff_reason_contains="No matching intent",
+    ),
+}
+
+
+@pytest.mark.parametrize("case", RESOLVE_CASES.values(), ids=RESOLVE_CASES.keys())
+async def test_resolve_routing(
+    engine_factory: Callable[..., Awaitable[IntentEngine]],
     sample_request: IntentRequest,
+    case: ResolveCase,
 ) -> None:
-    """When reasoning path is needed but decomposer is None, engine uses best match fallback."""
-    components = _make_components(
-        match_decision=MatchDecision.REASONING_PATH,
-        top_similarity=0.75,
-        is_compound=False,
-        decomposer=None,
+    """Engine picks the expected path for each matcher/compound scenario."""
+    engine = await engine_factory(
+        match_decision=MatchDecision[case.decision],
+        top_similarity=case.top_similarity,
+        is_compound=case.is_compound,
+        no_matches=case.no_matches,
     )
-    engine = IntentEngine(components=components)
-    await engine.initialize()
 
     result = await engine.resolve(sample_request)
 
-    assert result.path_taken == "fast_path_fallback"
-    assert len(result.resolved_intents) == 1
-    assert result.resolved_intents[0].category == "ORDER_STATUS"
-    assert result.resolved_intents[0].intent == "WISMO"
-    assert result.requires_human is True
-    assert "LLM" in (result.human_handoff_reason or "")
+    assert result.path_taken == case.expected_path
+    assert result.is_compound is case.is_compound
+    if case.expected_intent is None:
+        assert result.resolved_intents == []
+    else:
+        assert len(result.resolved_intents) == 1
+        assert result.resolved_intents[0].category == "ORDER_STATUS"
+        assert result.resolved_intents[0].intent == case.expected_intent
+    if case.expected_requires_human is not None:
+        assert result.requires_human is case.expected_requires_human
+    if case.handoff_reason_contains:
+        assert case.handoff_reason_contains in (result.human_handoff_reason or "")
+    if case.expects_order_entity:
+        assert result.entities
+        assert result.entities[0].entity_type == EntityType.ORDER_ID
+        assert result.entities[0].value == "12345"
 
 
-@pytest.mark.asyncio
 async def test_resolve_reasoning_path_with_decomposer(
+    engine_factory: Callable[..., Awaitable[IntentEngine]],
     sample_request: IntentRequest,
 ) -> None:
     """When reasoning path and decomposer is set, engine uses LLM decomposition."""
@@ -189,17 +252,15 @@ async def test_resolve_reasoning_path_with_decomposer(
         clarification_question=None,
         reasoning_trace=["Step 1: Decomposed"],
     )
-    mock_decomposer = MagicMock()
+    mock_decomposer = Mock(spec_set=IntentDecomposer)
     mock_decomposer.decompose = AsyncMock(return_value=decomposition)
 
-    components = _make_components(
+    engine = await engine_factory(
         match_decision=MatchDecision.REASONING_PATH,
         top_similarity=0.72,
         is_compound=False,
         decomposer=mock_decomposer,
     )
-    engine = IntentEngine(components=components)
-    await engine.initialize()
 
     result = await engine.resolve(sample_request)
 
@@ -209,37 +270,15 @@ async def test_resolve_reasoning_path_with_decomposer(
     mock_decomposer.decompose.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_resolve_compound_detected_uses_reasoning_path(
-    sample_request: IntentRequest,
+async def test_resolve_text_convenience_method(
+    engine_factory: Callable[..., Awaitable[IntentEngine]],
 ) -> None:
-    """Compound intent detection forces reasoning path even with high similarity."""
-    components = _make_components(
-        match_decision=MatchDecision.FAST_PATH,
-        top_similarity=0.90,
-        is_compound=True,  # compound signal
-        decomposer=None,
-    )
-    engine = IntentEngine(components=components)
-    await engine.initialize()
-
-    result = await engine.resolve(sample_request)
-
-    # Should go to reasoning path; with no decomposer we get fallback
-    assert result.path_taken == "fast_path_fallback"
-    assert result.is_compound is True
-
-
-@pytest.mark.asyncio
-async def test_resolve_text_convenience_method() -> None:
     """resolve_text() builds IntentRequest and returns same shape as resolve()."""
-    components = _make_components(
+    engine = await engine_factory(
         match_decision=MatchDecision.FAST_PATH,
         top_similarity=0.91,
         is_compound=False,
     )
-    engine = IntentEngine(components=components)
-    await engine.initialize()
 
     result = await engine.resolve_text(
         "Where is my order?",
@@ -250,26 +289,3 @@ async def test_resolve_text_convenience_method() -> None:
     assert result.path_taken == "fast_path"
     assert result.request_id == "inline-1"
     assert result.resolved_intents[0].intent == "WISMO"
-
-
-@pytest.mark.asyncio
-async def test_resolve_no_match_when_empty_matches_and_no_decomposer(
-    sample_request: IntentRequest,
-) -> None:
-    """When matcher returns no matches and no decomposer, engine returns no_match result."""
-    components = _make_components(
-        match_decision=MatchDecision.REASONING_PATH,
-        top_similarity=0.0,
-        is_compound=False,
-        decomposer=None,
-        top_matches=[],  # No catalog matches
-    )
-    engine = IntentEngine(components=components)
-    await engine.initialize()
-
-    result = await engine.resolve(sample_request)
-
-    assert result.path_taken == "no_match"
-    assert len(result.resolved_intents) == 0
-    assert result.requires_human is True
-    assert "No matching intent" in (result.human_handoff_reason or "")
@@ -1,24 +1,18 @@
 """Tests for entity extraction."""
 
-import sys
-
 import pytest
 
-# Skip entire module on Python 3.14+ due to spaCy incompatibility
-if sys.version_info >= (3, 14):
-    pytest.skip(
-        "spaCy not compatible with Python 3.14+ (uses Pydantic v1)",
-        allow_module_level=True,
-    )
-
 from intent_engine.extractors.entity_extractor import EntityExtractor
 from intent_engine.models.entity import EntityType
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def extractor() -> EntityExtractor:
-    """Create an entity extractor instance."""
-    return EntityExtractor()
+    """Pattern-only entity extractor shared across the module.
+
+    Every entity type probed here is regex/keyword based, so spaCy is never loaded.
+    """
+    return EntityExtractor(patterns_only=True)
 
 
 class TestOrderIdExtraction:
@@ -27,27 +21,27 @@ class TestOrderIdExtraction:
     def test_extract_order_id_with_hash(self, extractor: EntityExtractor) -> None:
         """Test extracting order ID with # prefix."""
         result = extractor.extract("Where is my order #12345?")
-        order_ids = [e for e in result.entities if e.entity_type == EntityType.ORDER_ID]
+        order_ids = result.entities_by_type.get(EntityType.ORDER_ID, ())
         assert len(order_ids) == 1
         assert order_ids[0].value == "12345"
 
     def test_extract_order_id_ord_format(self, extractor: EntityExtractor) -> None:
         """Test extracting order ID in ORD-XXXXX format."""
         result = extractor.extract("Track order ORD-98765 please")
-        order_ids = [e for e in result.entities if e.entity_type == EntityType.ORDER_ID]
+        order_ids = result.entities_by_type.get(EntityType.ORDER_ID, ())
         assert len(order_ids) >= 1
         assert any("98765" in oid.value for oid in order_ids)
 
     def test_extract_multiple_order_ids(self, extractor: EntityExtractor) -> None:
         """Test extracting multiple order IDs."""
         result = extractor.extract("Check orders #11111 and #22222")
-        order_ids = [e for e in result.entities if e.entity_type == EntityType.ORDER_ID]
+        order_ids = result.entities_by_type.get(EntityType.ORDER_ID, ())
         assert len(order_ids) == 2
 
     def test_no_order_id(self, extractor: EntityExtractor) -> None:
         """Test when no order ID is present."""
         result = extractor.extract("Where is my order?")
-        order_ids = [e for e in result.entities if e.entity_type == EntityType.ORDER_ID]
+        order_ids = result.entities_by_type.get(EntityType.ORDER_ID, ())
         assert len(order_ids) == 0
 
 
@@ -57,7 +51,7 @@ class TestTrackingNumberExtraction:
     def test_extract_ups_tracking(self, extractor: EntityExtractor) -> None:
         """Test extracting UPS tracking number."""
         result = extractor.extract("Tracking: 1Z999AA10123456784")
-        tracking = [e for e in result.entities if e.entity_type == EntityType.TRACKING_NUMBER]
+        tracking = result.entities_by_type.get(EntityType.TRACKING_NUMBER, ())
         assert len(tracking) >= 1
 
 
@@ -67,14 +61,14 @@ class TestSizeExtraction:
     def test_extract_letter_size(self, extractor: EntityExtractor) -> None:
         """Test extracting letter sizes (S, M, L, etc)."""
         result = extractor.extract("I need size L please")
-        sizes = [e for e in result.entities if e.entity_type == EntityType.SIZE]
+        sizes = result.entities_by_type.get(EntityType.SIZE, ())
         assert len(sizes) == 1
         assert sizes[0].value.upper() == "L"
 
     def test_extract_word_size(self, extractor: EntityExtractor) -> None:
         """Test extracting word sizes (small, medium, large)."""
         result = extractor.extract("I want the medium one")
-        sizes = [e for e in result.entities if e.entity_type == EntityType.SIZE]
+        sizes = result.entities_by_type.get(EntityType.SIZE, ())
         assert len(sizes) == 1
 
 
@@ -84,7 +78,7 @@ class TestColorExtraction:
     def test_extract_color(self, extractor: EntityExtractor) -> None:
         """Test extracting colors."""
         result = extractor.extract("I want the blue one instead")
-        colors = [e for e in result.entities if e.entity_type == EntityType.COLOR]
+        colors = result.entities_by_type.get(EntityType.COLOR, ())
         assert len(colors) == 1
         assert colors[0].value.lower() == "blue"
 
@@ -95,19 +89,19 @@ class TestDeadlineExtraction:
     def test_extract_by_day(self, extractor: EntityExtractor) -> None:
         """Test extracting deadline with day name."""
         result = extractor.extract("I need this by Friday")
-        deadlines = [e for e in result.entities if e.entity_type == EntityType.DEADLINE]
+        deadlines = result.entities_by_type.get(EntityType.DEADLINE, ())
         assert len(deadlines) >= 1
 
     def test_extract_within_days(self, extractor: EntityExtractor) -> None:
         """Test extracting deadline with 'within X days'."""
         result = extractor.extract("Deliver within 3 days")
-        deadlines = [e for e in result.entities if e.entity_type == EntityType.DEADLINE]
+        deadlines = result.entities_by_type.get(EntityType.DEADLINE, ())
         assert len(deadlines) >= 1
 
     def test_extract_urgent(self, extractor: EntityExtractor) -> None:
         """Test extracting urgent deadline."""
         result = extractor.extract("This is urgent!")
-        deadlines = [e for e in result.entities if e.entity_type == EntityType.DEADLINE]
+        deadlines = result.entities_by_type.get(EntityType.DEADLINE, ())
         assert len(deadlines) >= 1
 
 
@@ -117,17 +111,33 @@ class TestReasonExtraction:
     def test_extract_damaged_reason(self, extractor: EntityExtractor) -> None:
         """Test extracting damaged reason."""
         result = extractor.extract("The item is damaged")
-        reasons = [e for e in result.entities if e.entity_type == EntityType.REASON]
+        reasons = result.entities_by_type.get(EntityType.REASON, ())
         assert len(reasons) >= 1
         assert any("damaged" in r.value for r in reasons)
 
     def test_extract_wrong_size_reason(self, extractor: EntityExtractor) -> None:
         """Test extracting wrong size reason."""
         result = extractor.extract("It doesn't fit, wrong size")
-        reasons = [e for e in result.entities if e.entity_type == EntityType.REASON]
+        reasons = result.entities_by_type.get(EntityType.REASON, ())
         assert len(reasons) >= 1
 
 
+class TestCarrierAndBrandExtraction:
+    """Tests for carrier and brand extraction."""
+
+    def test_extract_carriers_normalized(self, extractor: EntityExtractor) -> None:
+        """Test carrier aliases map to canonical carrier names."""
+        result = extractor.extract("Sent by postal service, not Federal Express")
+        carriers = {e.value for e in result.entities_by_type.get(EntityType.CARRIER, ())}
+        assert carriers == {"USPS", "FedEx"}
+
+    def test_extract_brands_from_both_lists(self, extractor: EntityExtractor) -> None:
+        """Test brands from either brand pattern are found in one pass."""
+        result = extractor.extract("My Nike shoes and Xbox controller")
+        brands = {e.value for e in result.entities_by_type.get(EntityType.BRAND_NAME, ())}
+        assert brands == {"Nike", "Xbox"}
+
+
 class TestConvenienceMethods:
     """Tests for convenience methods."""
 
@@ -135,3 +145,10 @@ class TestConvenienceMethods:
         """Test the extract_order_ids convenience method."""
         order_ids = extractor.extract_order_ids("Check order #12345 and ORD-67890")
         assert len(order_ids) >= 2
+
+    def test_patterns_only_never_loads_spacy(self) -> None:
+        """Test patterns-only mode extracts without touching the spaCy model."""
+        extractor = EntityExtractor(patterns_only=True)
+        result = extractor.extract("Where is order #12345?")
+        assert EntityType.ORDER_ID in result.entities_by_type
+        assert extractor._nlp is None
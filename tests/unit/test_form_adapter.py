@@ -6,9 +6,9 @@ from intent_engine.ingestion.form import FormAdapter
 from intent_engine.models.request import InputChannel
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def adapter() -> FormAdapter:
-    """Create a form adapter instance."""
+    """Form adapter shared across the module (it holds no per-call state)."""
     return FormAdapter()
 
 
@@ -170,51 +170,41 @@ class TestFormAdapterNormalization:
             await adapter.normalize(raw_input)
 
 
-class TestFieldClassification:
-    """Tests for form field classification."""
-
-    def test_classify_order_id_variants(self, adapter: FormAdapter) -> None:
-        """Test classification of order ID field variants."""
-        fields = {
-            "order_number": "123",
-            "orderId": "456",
-            "order_ref": "789",
-        }
-        classified = adapter._classify_fields(fields)
+# (input fields, expected subset of the classified mapping)
+CLASSIFY_CASES = {
+    "order_number": ({"order_number": "123"}, {"order_id": "123"}),
+    "orderId_camel_case": ({"orderId": "456"}, {"order_id": "456"}),
+    "order_ref": ({"order_ref": "789"}, {"order_id": "789"}),
+    "email_address": (
+        {"email_address": "test@example.com"},
+        {"customer_email": "test@example.com"},
+    ),
+    **{
+        f"message_as_{name}": ({name: "Test content"}, {"message": "Test content"})
+        for name in ("message", "body", "description", "details", "inquiry")
+    },
+    "unknown_field_prefixed": (
+        {"custom_field": "custom_value"},
+        {"raw_custom_field": "custom_value"},
+    ),
+    "normalizes_field_names": (
+        {"Order-Number": "123", "email address": "test@test.com"},
+        {"order_id": "123", "customer_email": "test@test.com"},
+    ),
+}
 
-        # All should map to order_id
-        assert classified.get("order_id") is not None
 
-    def test_classify_email_variants(self, adapter: FormAdapter) -> None:
-        """Test classification of email field variants."""
-        fields = {
-            "email_address": "test@example.com",
-        }
-        classified = adapter._classify_fields(fields)
-        assert classified["customer_email"] == "test@example.com"
-
-    def test_classify_message_variants(self, adapter: FormAdapter) -> None:
-        """Test classification of message field variants."""
-        for field_name in ["message", "body", "description", "details", "inquiry"]:
-            fields = {field_name: "Test content"}
-            classified = adapter._classify_fields(fields)
-            assert classified.get("message") == "Test content"
-
-    def test_classify_unknown_field(self, adapter: FormAdapter) -> None:
-        """Test unknown fields are prefixed with raw_."""
-        fields = {"custom_field": "custom_value"}
-        classified = adapter._classify_fields(fields)
-        assert classified["raw_custom_field"] == "custom_value"
+class TestFieldClassification:
+    """Tests for form field classification."""
 
-    def test_classify_normalizes_field_names(self, adapter: FormAdapter) -> None:
-        """Test field name normalization."""
-        fields = {
-            "Order-Number": "123",
-            "email address": "test@test.com",
-        }
-        classified = adapter._classify_fields(fields)
-        assert classified.get("order_id") == "123"
-        assert classified.get("customer_email") == "test@test.com"
+    @pytest.mark.parametrize(
+        ("fields", "expected"), CLASSIFY_CASES.values(), ids=CLASSIFY_CASES.keys()
+    )
+    def test_classify_fields(
+        self, adapter: FormAdapter, fields: dict[str, str], expected: dict[str, str]
+    ) -> None:
+        """Test field name variants map to their semantic type."""
+        assert expected.items() <= adapter._classify_fields(fields).items()
 
     def test_classify_empty_values_skipped(self, adapter: FormAdapter) -> None:
         """Test empty values are not classified."""
@@ -225,6 +215,14 @@ class TestFieldClassification:
         classified = adapter._classify_fields(fields)
         assert "subject" not in classified
 
+    def test_classify_caches_keys_not_values(self, adapter: FormAdapter) -> None:
+        """Test repeated field names hit the key cache while values stay per-call."""
+        adapter._classify_fields({"Order-Number": "111"})
+        hits = FormAdapter._classified_key.cache_info().hits
+        classified = adapter._classify_fields({"Order-Number": "222"})
+        assert classified == {"order_id": "222"}
+        assert FormAdapter._classified_key.cache_info().hits == hits + 1
+
 
 class TestRawTextBuilding:
     """Tests for raw_text construction."""
@@ -1,4 +1,8 @@
-"""Tests for policy engine."""
+"""Tests for policy engine.
+
+Shared fixtures are module-scoped: the engine, policy and context models are
+only read by these tests; evaluate() writes to the PolicyDecision it returns.
+"""
 
 from datetime import datetime, timedelta, timezone
 
@@ -12,10 +16,42 @@ from intent_engine.models.context import (
     ProductContext,
     ReturnEligibility,
 )
-from intent_engine.reasoners.policy_engine import PolicyDecision, PolicyEngine
-
+from intent_engine.reasoners.policy_engine import (
+    AutoApprovalPolicy,
+    CompiledPolicy,
+    EscalationPolicy,
+    PolicyDecision,
+    PolicyEngine,
+    PriorityRoutingPolicy,
+    ReturnPolicy,
+)
 
-@pytest.fixture
+# Mirrors escalation.auto_escalate_keywords in data/policies/default.json
+SHIPPED_ESCALATION_KEYWORDS = [
+    "lawyer",
+    "attorney",
+    "sue",
+    "suing",
+    "lawsuit",
+    "bbb",
+    "better business bureau",
+    "attorney general",
+    "fraud",
+    "scam",
+]
+
+INFLECTED_KEYWORD_CASES: dict[str, tuple[str, list[str]]] = {
+    "lawyers": ("My lawyers will hear from you", ["lawyer"]),
+    "attorneys": ("I am contacting attorneys", ["attorney"]),
+    "fraudulent": ("This charge is fraudulent", ["fraud"]),
+    "scammed": ("I got scammed", ["scam"]),
+    "suing": ("I am suing you", ["suing"]),
+    "sued": ("I sued the last store that did this", ["sue"]),
+    "issue_is_not_sue": ("There is an issue with my suede boots", []),
+}
+
+
+@pytest.fixture(scope="module")
 def default_policy() -> dict:
     """Create a default test policy."""
     return {
@@ -61,13 +97,13 @@ def default_policy() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def engine(default_policy: dict) -> PolicyEngine:
     """Create a policy engine with default policy."""
     return PolicyEngine(default_policy=default_policy)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def standard_customer() -> CustomerProfile:
     """Create a standard tier customer."""
     return CustomerProfile(
@@ -80,7 +116,7 @@ def standard_customer() -> CustomerProfile:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def vip_customer() -> CustomerProfile:
     """Create a VIP tier customer."""
     return CustomerProfile(
@@ -94,7 +130,20 @@ def vip_customer() -> CustomerProfile:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def at_risk_customer() -> CustomerProfile:
+    """Create an at-risk tier customer."""
+    return CustomerProfile(
+        customer_id="cust-atrisk",
+        email="atrisk@example.com",
+        tier=CustomerTier.AT_RISK,
+        lifetime_value=100.0,
+        total_orders=2,
+        complaints_90d=2,
+    )
+
+
+@pytest.fixture(scope="module")
 def recent_order() -> OrderContext:
     """Create a recent order within return window."""
     return OrderContext(
@@ -120,7 +169,7 @@ def recent_order() -> OrderContext:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def expired_order() -> OrderContext:
     """Create an order with expired return window."""
     return OrderContext(
@@ -152,6 +201,32 @@ class TestPolicyEngineBasic:
         policy = engine.get_policy("unknown-tenant")
         assert policy["tenant_id"] == "default"
 
+    def test_get_policy_fallback_is_shared(self, engine: PolicyEngine) -> None:
+        """Unknown tenants resolve to the same default dict, not a copy."""
+        assert engine.get_policy("tenant-a") is engine.get_policy("default")
+        assert engine.get_policy("tenant-b") is engine.get_policy("tenant-a")
+
+    def test_compiled_policy_defaults(self) -> None:
+        """An empty policy compiles to the same defaults the sections declare."""
+        compiled = CompiledPolicy.from_policy({})
+
+        assert compiled.return_policy == ReturnPolicy()
+        assert compiled.auto_approval == AutoApprovalPolicy()
+        assert compiled.escalation == EscalationPolicy()
+        assert compiled.priority_routing == PriorityRoutingPolicy()
+        assert compiled.tiers[CustomerTier.STANDARD].return_window_days == 30
+
+    def test_compiled_tier_snapshots(self, engine: PolicyEngine, default_policy: dict) -> None:
+        """Each tier resolves to one snapshot of its thresholds."""
+        tiers = engine._compiled_for(default_policy).tiers
+
+        vip = tiers[CustomerTier.VIP]
+        assert (vip.return_window_days, vip.auto_return_max, vip.auto_refund_max) == (60, 500, 250)
+        assert vip.frustration_threshold == pytest.approx(0.8)
+        at_risk = tiers[CustomerTier.AT_RISK]
+        assert (at_risk.return_window_days, at_risk.auto_return_max) == (30, 100)
+        assert at_risk.frustration_threshold == pytest.approx(0.5)
+
     def test_parse_intent_code(self, engine: PolicyEngine) -> None:
         """Test intent code parsing."""
         category, intent = engine._parse_intent_code("RETURN_EXCHANGE.RETURN_INITIATE")
@@ -164,6 +239,12 @@ class TestPolicyEngineBasic:
         assert category == "WISMO"
         assert intent == ""
 
+    def test_parse_intent_code_extra_segments(self, engine: PolicyEngine) -> None:
+        """Segments past the intent are ignored."""
+        category, intent = engine._parse_intent_code("RETURN_EXCHANGE.RETURN_INITIATE.v2")
+        assert category == "RETURN_EXCHANGE"
+        assert intent == "RETURN_INITIATE"
+
 
 class TestReturnEligibility:
     """Tests for return window validation."""
@@ -194,8 +275,9 @@ class TestReturnEligibility:
         assert decision.return_eligible is False
         assert "expired" in decision.return_ineligible_reason.lower()
 
+    @pytest.mark.parametrize("category", ["swimwear", "Swimwear"])
     def test_ineligible_final_sale(
-        self, engine: PolicyEngine, standard_customer: CustomerProfile
+        self, engine: PolicyEngine, standard_customer: CustomerProfile, category: str
     ) -> None:
         """Test return is ineligible for final sale items."""
         order = OrderContext(
@@ -212,7 +294,7 @@ class TestReturnEligibility:
                     sku="SKU-SWIM",
                     name="Swimsuit",
                     price=50.00,
-                    category="swimwear",
+                    category=category,
                 )
             ],
             is_within_return_window=True,
@@ -393,6 +475,7 @@ class TestEscalation:
 
         assert decision.escalation_required is True
         assert any("complaints" in r.lower() for r in decision.escalation_reasons)
+        assert decision.escalation_tags == {"complaints"}
 
     def test_escalate_high_value_order(
         self, engine: PolicyEngine, standard_customer: CustomerProfile
@@ -413,6 +496,7 @@ class TestEscalation:
 
         assert decision.escalation_required is True
         assert any("high-value" in r.lower() for r in decision.escalation_reasons)
+        assert "high-value" in decision.escalation_tags
 
     def test_escalate_high_frustration(
         self,
@@ -430,6 +514,7 @@ class TestEscalation:
 
         assert decision.escalation_required is True
         assert any("frustration" in r.lower() for r in decision.escalation_reasons)
+        assert "frustration" in decision.escalation_tags
 
     def test_no_escalation_normal_case(
         self,
@@ -451,6 +536,34 @@ class TestEscalation:
         assert "lawyer" in keywords
         assert "sue" in keywords
 
+    def test_check_escalation_keywords_foreign_policy(self, engine: PolicyEngine) -> None:
+        """Policies the engine did not load are matched case-insensitively too."""
+        policy = {"escalation": {"auto_escalate_keywords": ["Chargeback", "BBB"]}}
+        keywords = engine.check_escalation_keywords("Filing a CHARGEBACK today", policy)
+
+        assert keywords == ["Chargeback"]
+
+    def test_check_escalation_keywords_whole_words_only(
+        self, engine: PolicyEngine, default_policy: dict
+    ) -> None:
+        """Keywords embedded in longer words do not trigger escalation."""
+        text = "There is an issue with my pursuit of a refund"
+        assert engine.check_escalation_keywords(text, default_policy) == []
+
+    @pytest.mark.parametrize(
+        ("text", "expected"), INFLECTED_KEYWORD_CASES.values(), ids=INFLECTED_KEYWORD_CASES.keys()
+    )
+    def test_check_escalation_keywords_inflected(
+        self, engine: PolicyEngine, text: str, expected: list[str]
+    ) -> None:
+        """Plurals and inflections of shipped keywords still escalate."""
+        policy = {"escalation": {"auto_escalate_keywords": SHIPPED_ESCALATION_KEYWORDS}}
+        assert engine.check_escalation_keywords(text, policy) == expected
+
+    def test_check_escalation_keywords_none_configured(self, engine: PolicyEngine) -> None:
+        """Policies without keywords never match."""
+        assert engine.check_escalation_keywords("I will sue you!", {}) == []
+
 
 class TestPriorityRouting:
     """Tests for priority routing."""
@@ -462,6 +575,7 @@ class TestPriorityRouting:
 
         assert decision.priority_flag is True
         assert any("vip" in r.lower() for r in decision.priority_reasons)
+        assert "vip" in decision.priority_tags
 
     def test_frustration_priority(
         self,
@@ -475,6 +589,7 @@ class TestPriorityRouting:
 
         assert decision.priority_flag is True
         assert any("frustration" in r.lower() for r in decision.priority_reasons)
+        assert "frustration" in decision.priority_tags
 
     def test_high_value_order_priority(
         self, engine: PolicyEngine, standard_customer: CustomerProfile
@@ -495,6 +610,7 @@ class TestPriorityRouting:
 
         assert decision.priority_flag is True
         assert any("high-value" in r.lower() for r in decision.priority_reasons)
+        assert "high-value" in decision.priority_tags
 
     def test_no_priority_normal_case(
         self,
@@ -589,6 +705,29 @@ class TestReturnWindowValidation:
         assert std_eligible is False
         assert vip_eligible is True
 
+    @pytest.mark.parametrize(
+        ("tier", "eligible"),
+        [(CustomerTier.PREMIUM, True), (CustomerTier.NEW, False), (CustomerTier.AT_RISK, False)],
+    )
+    def test_validate_window_per_tier(
+        self, engine: PolicyEngine, tier: CustomerTier, eligible: bool
+    ) -> None:
+        """Premium gets 45 days; other non-VIP tiers fall back to the 30-day default."""
+        order = OrderContext(
+            order_id="ORD-TIER-WIN",
+            order_number="TIER-WIN",
+            total=100.00,
+            subtotal=100.00,
+            status="delivered",
+            fulfillment_status="fulfilled",
+            customer_email="customer@example.com",
+            created_at=datetime.now(timezone.utc) - timedelta(days=40),
+        )
+
+        is_eligible, _, _ = engine.validate_return_window(order, tier)
+
+        assert is_eligible is eligible
+
     def test_validate_expired_window(self, engine: PolicyEngine) -> None:
         """Test expired window."""
         order = OrderContext(
@@ -608,6 +747,62 @@ class TestReturnWindowValidation:
         assert "expired" in reason.lower()
         assert days is not None and days < 0
 
+    def test_validate_window_counts_calendar_days(self, engine: PolicyEngine) -> None:
+        """Remaining days are whole UTC calendar days from an explicit date ordinal."""
+        order = OrderContext(
+            order_id="ORD-ORD",
+            order_number="ORD",
+            total=100.00,
+            subtotal=100.00,
+            status="delivered",
+            fulfillment_status="fulfilled",
+            customer_email="customer@example.com",
+            created_at=datetime(2024, 1, 1, 23, 59, tzinfo=timezone.utc),
+        )
+        today = datetime(2024, 1, 31, tzinfo=timezone.utc).toordinal()
+
+        assert engine.validate_return_window(order, today=today) == (True, None, 0)
+        is_eligible, reason, days = engine.validate_return_window(order, today=today + 1)
+        assert is_eligible is False
+        assert days == -1
+        assert reason == "Return window expired 1 days ago"
+
+
+class TestEvaluateMany:
+    """Tests for batch evaluation."""
+
+    def test_matches_single_evaluation(
+        self,
+        engine: PolicyEngine,
+        standard_customer: CustomerProfile,
+        vip_customer: CustomerProfile,
+        recent_order: OrderContext,
+    ) -> None:
+        """Each batch decision equals the one evaluate() returns."""
+        contexts = [
+            EnrichedContext(customer=standard_customer, order=recent_order),
+            EnrichedContext(customer=vip_customer),
+        ]
+        codes = ["RETURN_EXCHANGE.RETURN_INITIATE", "COMPLAINT.GENERAL"]
+        scores = [0.0, 0.95]
+
+        decisions = engine.evaluate_many(contexts, codes, frustration_scores=scores)
+
+        for decision, context, code, score in zip(decisions, contexts, codes, scores, strict=True):
+            single = engine.evaluate(context, code, frustration_score=score)
+            assert decision.recommended_action == single.recommended_action
+            assert decision.escalation_reasons == single.escalation_reasons
+            assert decision.rules_applied == single.rules_applied
+
+    def test_rejects_mismatched_lengths(
+        self, engine: PolicyEngine, standard_customer: CustomerProfile
+    ) -> None:
+        """Contexts and intent codes must pair up one-to-one."""
+        contexts = [EnrichedContext(customer=standard_customer)]
+
+        with pytest.raises(ValueError):
+            engine.evaluate_many(contexts, ["ORDER_STATUS.WISMO", "COMPLAINT.GENERAL"])
+
 
 class TestPolicyDecision:
     """Tests for PolicyDecision structure."""
@@ -622,6 +817,15 @@ class TestPolicyDecision:
         assert decision.priority_flag is False
         assert decision.return_eligible is True
         assert decision.rules_applied == []
+        assert decision.escalation_tags == frozenset()
+        assert decision.priority_tags == frozenset()
+
+    def test_decision_uses_slots(self) -> None:
+        """Decisions are slotted; unknown attributes are rejected."""
+        decision = PolicyDecision()
+        assert not hasattr(decision, "__dict__")
+        with pytest.raises(AttributeError):
+            decision.unknown_field = True  # type: ignore[attr-defined]
 
     def test_decision_includes_timestamp(
         self,
@@ -651,22 +855,34 @@ class TestPolicyDecision:
         assert "escalation" in decision.rules_applied
         assert "priority_routing" in decision.rules_applied
 
+    def test_non_return_intent_skips_return_stages(
+        self,
+        engine: PolicyEngine,
+        standard_customer: CustomerProfile,
+        recent_order: OrderContext,
+    ) -> None:
+        """Categories that cannot be auto-approved only run the triage stages."""
+        context = EnrichedContext(customer=standard_customer, order=recent_order)
+        decision = engine.evaluate(context, "ORDER_STATUS.WISMO")
+
+        assert decision.rules_applied == ["escalation", "priority_routing"]
+
+    def test_intent_without_approval_rule_skips_auto_approval(
+        self,
+        engine: PolicyEngine,
+        standard_customer: CustomerProfile,
+        recent_order: OrderContext,
+    ) -> None:
+        """Return intents with no auto-approval rule still check eligibility only."""
+        context = EnrichedContext(customer=standard_customer, order=recent_order)
+        decision = engine.evaluate(context, "RETURN_EXCHANGE.RETURN_STATUS")
+
+        assert decision.rules_applied == ["return_eligibility", "escalation", "priority_routing"]
+
 
 class TestTierAwareFrustrationThresholds:
     """Tests for tier-aware frustration thresholds (Phase 2)."""
 
-    @pytest.fixture
-    def at_risk_customer(self) -> CustomerProfile:
-        """Create an at-risk tier customer."""
-        return CustomerProfile(
-            customer_id="cust-atrisk",
-            email="atrisk@example.com",
-            tier=CustomerTier.AT_RISK,
-            lifetime_value=100.0,
-            total_orders=2,
-            complaints_90d=2,
-        )
-
     def test_vip_higher_frustration_threshold(
         self,
         engine: PolicyEngine,
@@ -1,11 +1,37 @@
 """Unit tests for Redis rate limiter."""
 
-from unittest.mock import AsyncMock
+from typing import Any
 
 import pytest
 
 from intent_engine.tenancy.rate_limiter import RateLimiter, RateLimitExceeded
 
+# Lua script results as (allowed, remaining tokens, retry wait in seconds)
+_ALLOW_1 = (1, 19.0, 0)
+_ALLOW_CUSTOM = (1, 49.0, 0)
+_ALLOW_MULTI = (1, 15.0, 0)
+_DENY = (0, 0.0, 2.5)
+
+
+class _FakeRedis:
+    """Minimal async Redis stand-in covering the calls RateLimiter makes."""
+
+    def __init__(self) -> None:
+        self.eval_return: tuple[int, float, float] | None = None
+        self.get_return: str | None = None
+        self.last_eval: tuple[tuple[Any, ...], dict[str, Any]] | None = None
+        self.delete_calls: list[tuple[str, ...]] = []
+
+    async def eval(self, *args: Any, **kwargs: Any) -> tuple[int, float, float] | None:
+        self.last_eval = (args, kwargs)
+        return self.eval_return
+
+    async def get(self, key: str) -> str | None:
+        return self.get_return
+
+    async def delete(self, *keys: str) -> None:
+        self.delete_calls.append(keys)
+
 
 class TestRateLimitExceeded:
     """Tests for RateLimitExceeded exception."""
@@ -21,24 +47,24 @@ class TestRateLimitExceeded:
         assert exc.tenant_id == "test-tenant"
         assert exc.limit == 100
         assert exc.retry_after == 5.5
-        assert "test-tenant" in str(exc)
-        assert "100" in str(exc)
+        assert str(exc) == (
+            "Rate limit exceeded for tenant test-tenant. Limit: 100/min. Retry after: 5.50s"
+        )
 
 
 class TestRateLimiter:
     """Tests for RateLimiter class."""
 
     @pytest.fixture
-    def mock_redis(self):
-        """Create a mock Redis client."""
-        redis = AsyncMock()
-        return redis
+    def fake_redis(self):
+        """Create a fake Redis client."""
+        return _FakeRedis()
 
     @pytest.fixture
-    def rate_limiter(self, mock_redis):
-        """Create a rate limiter with mock Redis."""
+    def rate_limiter(self, fake_redis):
+        """Create a rate limiter with fake Redis."""
         return RateLimiter(
-            redis_client=mock_redis,
+            redis_client=fake_redis,
             default_rate=100,
             default_burst=20,
         )
@@ -48,11 +74,10 @@ class TestRateLimiter:
         assert rate_limiter._key_tokens("tenant-1") == "rate_limit:tenant-1:tokens"
         assert rate_limiter._key_last_update("tenant-1") == "rate_limit:tenant-1:last_update"
 
-    @pytest.mark.asyncio
-    async def test_check_rate_limit_allowed(self, rate_limiter, mock_redis):
+    async def test_check_rate_limit_allowed(self, rate_limiter, fake_redis):
         """Test rate limit check when allowed."""
-        # Mock Lua script returning allowed
-        mock_redis.eval.return_value = [1, 19.0, 0]  # allowed=True, remaining=19, wait=0
+        # Lua script reports the request allowed
+        fake_redis.eval_return = _ALLOW_1
 
         result = await rate_limiter.check_rate_limit("tenant-1")
 
@@ -60,11 +85,10 @@ class TestRateLimiter:
         assert result["remaining"] == 19
         assert result["limit"] == 100
 
-    @pytest.mark.asyncio
-    async def test_check_rate_limit_exceeded(self, rate_limiter, mock_redis):
+    async def test_check_rate_limit_exceeded(self, rate_limiter, fake_redis):
         """Test rate limit check when exceeded."""
-        # Mock Lua script returning not allowed
-        mock_redis.eval.return_value = [0, 0.0, 2.5]  # allowed=False, remaining=0, wait=2.5
+        # Lua script reports the bucket exhausted
+        fake_redis.eval_return = _DENY
 
         with pytest.raises(RateLimitExceeded) as exc_info:
             await rate_limiter.check_rate_limit("tenant-1")
@@ -72,10 +96,9 @@ class TestRateLimiter:
         assert exc_info.value.tenant_id == "tenant-1"
         assert exc_info.value.retry_after == 2.5
 
-    @pytest.mark.asyncio
-    async def test_check_rate_limit_custom_rate(self, rate_limiter, mock_redis):
+    async def test_check_rate_limit_custom_rate(self, rate_limiter, fake_redis):
         """Test rate limit check with custom rate."""
-        mock_redis.eval.return_value = [1, 49.0, 0]
+        fake_redis.eval_return = _ALLOW_CUSTOM
 
         result = await rate_limiter.check_rate_limit(
             "tenant-1",
@@ -86,10 +109,9 @@ class TestRateLimiter:
         assert result["allowed"] is True
         assert result["limit"] == 50
 
-    @pytest.mark.asyncio
-    async def test_check_rate_limit_multiple_tokens(self, rate_limiter, mock_redis):
+    async def test_check_rate_limit_multiple_tokens(self, rate_limiter, fake_redis):
         """Test rate limit check consuming multiple tokens."""
-        mock_redis.eval.return_value = [1, 15.0, 0]
+        fake_redis.eval_return = _ALLOW_MULTI
 
         result = await rate_limiter.check_rate_limit(
             "tenant-1",
@@ -97,14 +119,14 @@ class TestRateLimiter:
         )
 
         assert result["allowed"] is True
-        # Verify tokens_required was passed to Lua script
-        call_args = mock_redis.eval.call_args
-        assert "5" in str(call_args)
+        # eval(script, numkeys, *KEYS, rate_per_sec, burst, tokens_required, now)
+        assert fake_redis.last_eval is not None
+        args, _ = fake_redis.last_eval
+        assert args[6] == "5"
 
-    @pytest.mark.asyncio
-    async def test_get_usage(self, rate_limiter, mock_redis):
+    async def test_get_usage(self, rate_limiter, fake_redis):
         """Test getting current usage."""
-        mock_redis.get.return_value = "15.5"
+        fake_redis.get_return = "15.5"
 
         usage = await rate_limiter.get_usage("tenant-1")
 
@@ -112,49 +134,30 @@ class TestRateLimiter:
         assert usage["remaining_tokens"] == 15
         assert usage["max_tokens"] == 20
 
-    @pytest.mark.asyncio
-    async def test_get_usage_no_data(self, rate_limiter, mock_redis):
+    async def test_get_usage_no_data(self, rate_limiter, fake_redis):
         """Test getting usage when no data exists."""
-        mock_redis.get.return_value = None
+        fake_redis.get_return = None
 
         usage = await rate_limiter.get_usage("new-tenant")
 
         assert usage["remaining_tokens"] == 20  # Default burst
 
-    @pytest.mark.asyncio
-    async def test_reset(self, rate_limiter, mock_redis):
+    async def test_reset(self, rate_limiter, fake_redis):
         """Test resetting rate limit."""
         await rate_limiter.reset("tenant-1")
 
-        mock_redis.delete.assert_called_once_with(
-            "rate_limit:tenant-1:tokens",
-            "rate_limit:tenant-1:last_update",
-        )
+        assert fake_redis.delete_calls == [
+            ("rate_limit:tenant-1:tokens", "rate_limit:tenant-1:last_update"),
+        ]
 
 
 class TestRateLimiterIntegration:
     """Integration-style tests for rate limiter behavior."""
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_lua_script_logic(self):
-        """Test that the Lua script logic is correct."""
-        # This test validates the expected behavior of the rate limiter
-        # without actually running Redis
-
-        # Scenario: Fresh bucket with 20 burst capacity
-        # Rate: 100/min = 1.67/sec
-        # Request 1 token -> Should be allowed, remaining ~19
-
-        # Scenario: Exhausted bucket
-        # Request 1 token -> Should be denied, retry after > 0
-
-        # The actual Lua script runs atomically in Redis
-        # These tests verify we call it with correct parameters
-        pass
-
-    @pytest.mark.asyncio
-    async def test_concurrent_requests(self):
-        """Test that concurrent requests don't cause race conditions."""
-        # In a real test, we'd spin up Redis and test concurrent access
-        # The token bucket with Lua script ensures atomicity
-        pass
+    @pytest.mark.skip(reason="requires live Redis to run the Lua token bucket")
+    def test_rate_limit_lua_script_logic(self):
+        """Fresh bucket allows and decrements; an exhausted bucket denies with retry_after > 0."""
+
+    @pytest.mark.skip(reason="requires live Redis to exercise concurrent access")
+    def test_concurrent_requests(self):
+        """Concurrent requests never overdraw the bucket (the Lua script runs atomically)."""
@@ -0,0 +1,272 @@
+"""Unit tests for the lifecycle router."""
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+if sys.version_info >= (3, 14):
+    pytest.skip(
+        "spaCy/import chain not compatible with Python 3.14+",
+        allow_module_level=True,
+    )
+
+from intent_engine.agents.models import AgentResponse, CustomerMessage
+from intent_engine.agents.pre_purchase_agent import PrePurchaseOutput
+from intent_engine.agents.router import PRE_PURCHASE_CATEGORIES, LifecycleRouter
+from intent_engine.models.intent import IntentConfidence, ResolvedIntent
+from intent_engine.models.response import ReasoningResult
+
+
+class TestLifecycleRouterCategories:
+    """Tests for router pre-purchase category set."""
+
+    def test_pre_purchase_categories_include_product_and_discovery(self) -> None:
+        """PRODUCT_INQUIRY and DISCOVERY route to pre-purchase."""
+        assert "PRODUCT_INQUIRY" in PRE_PURCHASE_CATEGORIES
+        assert "DISCOVERY" in PRE_PURCHASE_CATEGORIES
+        assert "ORDER_STATUS" not in PRE_PURCHASE_CATEGORIES
+
+
+class TestLifecycleRouter:
+    """Tests for LifecycleRouter routing behavior."""
+
+    @pytest.fixture
+    def mock_engine(self) -> MagicMock:
+        engine = MagicMock()
+        engine.resolve = AsyncMock()
+        return engine
+
+    @pytest.fixture
+    def mock_customer_service_agent(self) -> MagicMock:
+        agent = MagicMock()
+        agent.process_message = AsyncMock()
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_routes_to_post_purchase_for_order_status(
+        self,
+        mock_engine: MagicMock,
+        mock_customer_service_agent: MagicMock,
+    ) -> None:
+        """When primary intent is ORDER_STATUS, router calls customer service agent."""
+        mock_engine.resolve.return_value = ReasoningResult(
+            request_id="req-1",
+            resolved_intents=[
+                ResolvedIntent(
+                    category="ORDER_STATUS",
+                    intent="WISMO",
+                    confidence=0.92,
+                    confidence_tier=IntentConfidence.HIGH,
+                    evidence=["where is my order"],
+                )
+            ],
+            is_compound=False,
+            entities=[],
+            confidence_summary=0.92,
+            path_taken="fast_path",
+        )
+        mock_customer_service_agent.process_message.return_value = AgentResponse(
+            message_id="msg-1",
+            response_text="Your order is in transit.",
+            confidence=0.92,
+            processing_time_ms=100,
+        )
+
+        mock_pre_purchase_agent = MagicMock()
+        mock_pre_purchase_agent.run = AsyncMock()
+        with patch(
+            "intent_engine.agents.router.get_pre_purchase_agent",
+            return_value=mock_pre_purchase_agent,
+        ):
+            router = LifecycleRouter(
+                intent_engine=mock_engine,
+                customer_service_agent=mock_customer_service_agent,
+                catalog_provider=None,
+            )
+        message = CustomerMessage(message_id="msg-1", text="Where is my order?")
+        response = await router.process_message(message)
+
+        assert response.response_text == "Your order is in transit."
+        mock_customer_service_agent.process_message.assert_called_once_with(message)
+
+    @pytest.mark.asyncio
+    async def test_repeated_message_reuses_cached_route(
+        self,
+        mock_engine: MagicMock,
+        mock_customer_service_agent: MagicMock,
+    ) -> None:
+        """The same (normalized) message text is only classified once."""
+        mock_engine.resolve.return_value = ReasoningResult(
+            request_id="req-1",
+            resolved_intents=[
+                ResolvedIntent(
+                    category="ORDER_STATUS",
+                    intent="WISMO",
+                    confidence=0.92,
+                    confidence_tier=IntentConfidence.HIGH,
+                    evidence=["where is my order"],
+                )
+            ],
+            is_compound=False,
+            entities=[],
+            confidence_summary=0.92,
+            path_taken="fast_path",
+        )
+        mock_customer_service_agent.process_message.return_value = AgentResponse(
+            message_id="msg-1",
+            response_text="Your order is in transit.",
+        )
+
+        with patch("intent_engine.agents.router.get_pre_purchase_agent"):
+            router = LifecycleRouter(
+                intent_engine=mock_engine,
+                customer_service_agent=mock_customer_service_agent,
+                catalog_provider=None,
+            )
+        await router.process_message(CustomerMessage(message_id="msg-1", text="Where is my order?"))
+        await router.process_message(
+            CustomerMessage(message_id="msg-2", text="  where is   my order? ")
+        )
+
+        assert mock_engine.resolve.call_count == 1
+        assert mock_customer_service_agent.process_message.call_count == 2
+
+        router.clear_route_cache()
+        await router.process_message(CustomerMessage(message_id="msg-3", text="Where is my order?"))
+        assert mock_engine.resolve.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_copied_message_with_new_text_is_reclassified(
+        self,
+        mock_engine: MagicMock,
+        mock_customer_service_agent: MagicMock,
+    ) -> None:
+        """A message copied with different text does not reuse the original's route."""
+        mock_engine.resolve.return_value = ReasoningResult(
+            request_id="req-1",
+            resolved_intents=[],
+            is_compound=False,
+            entities=[],
+            confidence_summary=0.0,
+            path_taken="fast_path",
+        )
+        mock_customer_service_agent.process_message.return_value = AgentResponse(
+            message_id="msg-1",
+            response_text="How can I help?",
+        )
+
+        with patch("intent_engine.agents.router.get_pre_purchase_agent"):
+            router = LifecycleRouter(
+                intent_engine=mock_engine,
+                customer_service_agent=mock_customer_service_agent,
+                catalog_provider=None,
+            )
+        message = CustomerMessage(message_id="msg-1", text="Where is my order?")
+        await router.process_message(message)
+        await router.process_message(message.model_copy(update={"text": "Show me running shoes"}))
+
+        assert mock_engine.resolve.call_count == 2
+        second_request = mock_engine.resolve.call_args.args[0]
+        assert second_request.raw_text == "Show me running shoes"
+
+    @pytest.mark.asyncio
+    async def test_routes_to_pre_purchase_for_product_inquiry(
+        self,
+        mock_engine: MagicMock,
+        mock_customer_service_agent: MagicMock,
+    ) -> None:
+        """When primary intent is PRODUCT_INQUIRY, router calls pre-purchase agent."""
+        mock_engine.resolve.return_value = ReasoningResult(
+            request_id="req-1",
+            resolved_intents=[
+                ResolvedIntent(
+                    category="PRODUCT_INQUIRY",
+                    intent="STOCK",
+                    confidence=0.88,
+                    confidence_tier=IntentConfidence.HIGH,
+                    evidence=["in stock"],
+                )
+            ],
+            is_compound=False,
+            entities=[],
+            confidence_summary=0.88,
+            path_taken="fast_path",
+        )
+
+        mock_pre_purchase_output = PrePurchaseOutput(
+            response_text="We have that item in stock.",
+            products=[],
+            primary_intent="PRODUCT_INQUIRY.STOCK",
+            confidence=0.88,
+        )
+        mock_pre_purchase_agent = MagicMock()
+        mock_pre_purchase_agent.run = AsyncMock(
+            return_value=SimpleNamespace(output=mock_pre_purchase_output)
+        )
+
+        with patch(
+            "intent_engine.agents.router.get_pre_purchase_agent",
+            return_value=mock_pre_purchase_agent,
+        ):
+            router = LifecycleRouter(
+                intent_engine=mock_engine,
+                customer_service_agent=mock_customer_service_agent,
+                catalog_provider=None,
+            )
+        message = CustomerMessage(message_id="msg-1", text="Is the blue widget in stock?")
+        response = await router.process_message(message)
+
+        assert response.response_text == "We have that item in stock."
+        assert response.confidence == 0.88
+        mock_pre_purchase_agent.run.assert_called_once()
+        mock_customer_service_agent.process_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_post_purchase_if_pre_purchase_raises(
+        self,
+        mock_engine: MagicMock,
+        mock_customer_service_agent: MagicMock,
+    ) -> None:
+        """When pre-purchase agent raises, router falls back to customer service agent."""
+        mock_engine.resolve.return_value = ReasoningResult(
+            request_id="req-1",
+            resolved_intents=[
+                ResolvedIntent(
+                    category="PRODUCT_INQUIRY",
+                    intent="STOCK",
+                    confidence=0.88,
+                    confidence_tier=IntentConfidence.HIGH,
+                    evidence=[],
+                )
+            ],
+            is_compound=False,
+            entities=[],
+            confidence_summary=0.88,
+            path_taken="fast_path",
+        )
+        mock_customer_service_agent.process_message.return_value = AgentResponse(
+            message_id="msg-1",
+            response_text="Let me help with that.",
+            confidence=0.5,
+            processing_time_ms=50,
+        )
+
+        mock_pre_purchase_agent = MagicMock()
+        mock_pre_purchase_agent.run = AsyncMock(side_effect=RuntimeError("Catalog unavailable"))
+
+        with patch(
+            "intent_engine.agents.router.get_pre_purchase_agent",
+            return_value=mock_pre_purchase_agent,
+        ):
+            router = LifecycleRouter(
+                intent_engine=mock_engine,
+                customer_service_agent=mock_customer_service_agent,
+                catalog_provider=None,
+            )
+        message = CustomerMessage(message_id="msg-1", text="Is the widget in stock?")
+        response = await router.process_message(message)
+
+        assert response.response_text == "Let me help with that."
+        mock_customer_service_agent.process_message.assert_called_once_with(message)
@@ -6,12 +6,13 @@ from intent_engine.extractors.sentiment import (
     ConversationSentimentTracker,
     SentimentAnalyzer,
     SentimentResult,
+    _required_literal,
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def analyzer() -> SentimentAnalyzer:
-    """Create a sentiment analyzer (rules-only for fast tests)."""
+    """Create a sentiment analyzer once (rules-only for fast tests); analyze() is read-only."""
     return SentimentAnalyzer(use_transformer=False)
 
 
@@ -170,6 +171,12 @@ class TestCapsDetection:
         result = analyzer.analyze("HELP")
         assert "excessive_caps" not in result.signals
 
+    def test_caps_ratio_counts_letters_only(self, analyzer: SentimentAnalyzer) -> None:
+        """Test the caps ratio ignores non-letters for ASCII and non-ASCII text alike."""
+        assert analyzer._caps_ratio("ABcd 12!") == 0.5
+        assert analyzer._caps_ratio("ÄBcö 12!") == 0.5
+        assert analyzer._caps_ratio("123 !?") == 0.0
+
 
 class TestPositiveAdjustments:
     """Tests for positive indicator adjustments."""
@@ -211,6 +218,14 @@ class TestSignals:
         result = analyzer.analyze("This is absolutely unacceptable! I'm furious!")
         assert "priority_flag" in result.signals
 
+    def test_overlapping_patterns_all_register(self, analyzer: SentimentAnalyzer) -> None:
+        """Test patterns matching at the same offset each count (no single-alternation scan)."""
+        result = analyzer.analyze("I'm frustrated.")
+        assert result.signals.count("frustration:frustrated") == 2
+        # "great," is both a positive word and a sarcasm marker
+        sarcastic = analyzer.analyze("Great, it broke.")
+        assert any(s.startswith("sarcasm_pattern:") for s in sarcastic.signals)
+
 
 class TestSentimentResult:
     """Tests for SentimentResult structure."""
@@ -224,6 +239,8 @@ class TestSentimentResult:
         assert hasattr(result, "frustration_score")
         assert hasattr(result, "priority_flag")
         assert hasattr(result, "signals")
+        # Slotted: one result per analyzed message, so no per-instance __dict__
+        assert not hasattr(result, "__dict__")
 
     def test_scores_in_range(self, analyzer: SentimentAnalyzer) -> None:
         """Test scores are within expected ranges."""
@@ -278,6 +295,26 @@ class TestLegalThreatDetection:
         assert result.frustration_score >= 0.7
 
 
+class TestRequiredLiteral:
+    """Tests for the literal prefilter derived from lexicon patterns."""
+
+    def test_leading_literal_is_lowercased(self) -> None:
+        """Test the plain characters after a leading word boundary are extracted."""
+        assert _required_literal(r"\bASAP\b") == "asap"
+        assert _required_literal(r"\burgent(ly)?\b") == "urgent"
+        assert _required_literal(r"\bwithin (\d+) (hour|day)s?\b") == "within "
+
+    def test_optional_last_character_dropped(self) -> None:
+        """Test a quantifier that can drop the last character excludes it."""
+        assert _required_literal(r"\bdays?\b") == "day"
+        assert _required_literal(r"!{2,}") == ""
+
+    def test_no_literal_when_matches_need_not_share_one(self) -> None:
+        """Test leading groups and top-level alternations yield no literal."""
+        assert _required_literal(r"\b(very |really )?upset\b") == ""
+        assert _required_literal(r"\bsorry\b|\bapolog") == ""
+
+
 class TestEdgeCases:
     """Edge case tests."""
 
@@ -286,6 +323,13 @@ class TestEdgeCases:
         result = analyzer.analyze("")
         assert result.sentiment_score == 0
 
+    def test_whitespace_only(self, analyzer: SentimentAnalyzer) -> None:
+        """Test whitespace-only input scores as empty."""
+        result = analyzer.analyze("  \n\t ")
+        assert result.frustration_score == 0
+        assert result.signals == []
+        assert analyzer._get_rule_based_sentiment("   ") == 0
+
     def test_very_long_text(self, analyzer: SentimentAnalyzer) -> None:
         """Test very long text is handled."""
         long_text = "I have a question. " * 1000
@@ -364,6 +408,7 @@ class TestConversationSentimentTracker:
         tracker.add_message("Where is my order?")
         conv = tracker.get_conversation_sentiment()
         assert conv.message_count == 1
+        assert not hasattr(conv, "__dict__")
 
     def test_rising_frustration_trajectory(self, tracker: ConversationSentimentTracker) -> None:
         """Test detection of rising frustration."""
@@ -377,6 +422,17 @@ class TestConversationSentimentTracker:
         # Should detect rising trend
         assert conv.frustration_trajectory in ["rising", "constant"]
 
+    def test_add_messages_matches_one_at_a_time(
+        self, analyzer: SentimentAnalyzer, tracker: ConversationSentimentTracker
+    ) -> None:
+        """Test batch ingestion gives the same results and aggregates as add_message."""
+        messages = ["Where is my order?", "Still waiting.", "This is unacceptable!"]
+        one_by_one = ConversationSentimentTracker(analyzer)
+        expected = [one_by_one.add_message(m) for m in messages]
+
+        assert tracker.add_messages(messages) == expected
+        assert tracker.get_conversation_sentiment() == one_by_one.get_conversation_sentiment()
+
     def test_peak_frustration(self, tracker: ConversationSentimentTracker) -> None:
         """Test peak frustration tracking."""
         tracker.add_message("Normal question.")
@@ -387,6 +443,19 @@ class TestConversationSentimentTracker:
         # Peak should be from the angry message
         assert conv.peak_frustration >= 0.5
 
+    def test_running_aggregates_match_history(self, tracker: ConversationSentimentTracker) -> None:
+        """Test running aggregates agree with the per-message scores, including after reset."""
+        tracker.add_message("Please escalate this issue.")
+        tracker.reset()
+        messages = ["Normal question.", "I'm so angry!", "Still waiting.", "Thanks anyway."]
+        scores = [tracker.add_message(m).frustration_score for m in messages]
+
+        conv = tracker.get_conversation_sentiment()
+        assert conv.sentiment_history == scores
+        assert conv.average_frustration == pytest.approx(sum(scores) / len(scores))
+        assert conv.peak_frustration == max(scores)
+        assert conv.escalation_pattern is False
+
     def test_escalation_pattern_detection(self, tracker: ConversationSentimentTracker) -> None:
         """Test escalation pattern detection."""
         has_pattern, signals = tracker.detect_escalation_pattern("I've called 5 times about this!")
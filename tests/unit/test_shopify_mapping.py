@@ -203,6 +203,10 @@ class TestShopifyParseDatetime:
         assert result.year == 2024
         assert result.tzinfo is not None
 
+    def test_repeated_timestamp_reuses_result(self):
+        """The same timestamp string parses once and returns the cached datetime."""
+        assert parse_datetime("2024-01-15T12:30:00Z") is parse_datetime("2024-01-15T12:30:00Z")
+
     def test_none_returns_none(self):
         """None input returns None."""
         assert parse_datetime(None) is None
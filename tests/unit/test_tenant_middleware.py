@@ -1,5 +1,7 @@
 """Unit tests for tenant middleware."""
 
+import asyncio
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -12,7 +14,7 @@ from intent_engine.tenancy.context import (
     tenant_context,
 )
 from intent_engine.tenancy.middleware import TenantMiddleware, TenantStore
-from intent_engine.tenancy.models import TenantConfig, TenantTier
+from intent_engine.tenancy.models import TIER_RATE_LIMITS, TenantConfig, TenantTier
 
 
 class TestTenantContext:
@@ -57,6 +59,43 @@ class TestTenantContext:
         # Context should be cleared after
         assert get_current_tenant() is None
 
+    def test_nested_tenant_context_restores_outer(self):
+        """Leaving an inner tenant_context restores the outer tenant, not None."""
+        outer = TenantConfig(
+            tenant_id="outer", name="Outer", tier=TenantTier.STARTER, api_key="outer-key"
+        )
+        inner = outer.model_copy(update={"tenant_id": "inner", "api_key": "inner-key"})
+
+        with tenant_context(outer):
+            with tenant_context(inner):
+                assert get_current_tenant_id() == "inner"
+            assert get_current_tenant_id() == "outer"
+
+        assert get_current_tenant() is None
+
+    async def test_concurrent_tasks_see_their_own_tenant(self):
+        """Each task keeps its own tenant even while interleaving on one loop."""
+        both_set = asyncio.Event()
+        ready: list[str] = []
+
+        async def handle(tenant_id: str) -> str | None:
+            set_tenant_context(
+                TenantConfig(
+                    tenant_id=tenant_id,
+                    name=tenant_id,
+                    tier=TenantTier.STARTER,
+                    api_key=f"{tenant_id}-key",
+                )
+            )
+            ready.append(tenant_id)
+            if len(ready) == 2:
+                both_set.set()
+            await both_set.wait()
+            return get_current_tenant_id()
+
+        assert await asyncio.gather(handle("task-a"), handle("task-b")) == ["task-a", "task-b"]
+        assert get_current_tenant() is None
+
 
 class TestTenantStore:
     """Tests for TenantStore."""
@@ -113,6 +152,44 @@ class TestTenantStore:
         assert result is True
         assert store.get_tenant_by_id("remove-test") is None
 
+    def test_re_add_replaces_previous_api_key(self):
+        """Re-adding a tenant with a rotated key drops the old key."""
+        store = TenantStore()
+        original = TenantConfig(
+            tenant_id="rotate",
+            name="Rotate",
+            tier=TenantTier.FREE,
+            api_key="old-key",
+        )
+        rotated = original.model_copy(update={"api_key": "new-key"})
+
+        store.add_tenant(original)
+        store.add_tenant(rotated)
+
+        assert store.get_tenant_by_api_key("old-key") is None
+        assert store.get_tenant_by_id("rotate") == rotated
+        assert store.list_tenants() == [rotated]
+
+    def test_reassigned_api_key_drops_previous_owner(self):
+        """Giving a key to another tenant unlinks the tenant that held it."""
+        store = TenantStore()
+        first = TenantConfig(
+            tenant_id="owner-a",
+            name="Owner A",
+            tier=TenantTier.FREE,
+            api_key="shared-key",
+        )
+        second = first.model_copy(update={"tenant_id": "owner-b", "name": "Owner B"})
+
+        store.add_tenant(first)
+        store.add_tenant(second)
+
+        assert store.get_tenant_by_id("owner-a") is None
+        assert store.remove_tenant("owner-a") is False
+        assert store.get_tenant_by_id("owner-b") == second
+        assert store.get_tenant_by_api_key("shared-key") == second
+        assert store.list_tenants() == [second]
+
     def test_list_tenants(self):
         """Test listing all tenants."""
         store = TenantStore()
@@ -159,6 +236,17 @@ class TestTenantConfig:
         assert free_tenant.get_burst_size() < enterprise_tenant.get_burst_size()
         assert free_tenant.get_max_batch_size() < enterprise_tenant.get_max_batch_size()
 
+    @pytest.mark.parametrize("tier", list(TenantTier), ids=lambda tier: tier.value)
+    def test_getters_match_tier_table(self, tier):
+        """Tier defaults resolve to the published TIER_RATE_LIMITS values."""
+        tenant = TenantConfig(tenant_id="tiered", name="Tiered", tier=tier, api_key="tier-key")
+        limits = TIER_RATE_LIMITS[tier]
+
+        assert tenant.get_rate_limit() == limits["requests_per_minute"]
+        assert tenant.get_burst_size() == limits["burst_size"]
+        assert tenant.get_max_batch_size() == limits["max_batch_size"]
+        assert tenant.get_max_websocket_connections() == limits["max_websocket_connections"]
+
     def test_custom_rate_limit_override(self):
         """Test custom rate limit overrides tier defaults."""
         tenant = TenantConfig(
@@ -192,6 +280,25 @@ class TestTenantConfig:
         assert inactive_tenant.is_active is False
 
 
+HEADER_CASES: dict[str, tuple[list[tuple[bytes, bytes]], str | None]] = {
+    "bearer": ([(b"authorization", b"Bearer key-1")], "key-1"),
+    "x_api_key": ([(b"x-api-key", b"key-2")], "key-2"),
+    "bearer_wins": ([(b"x-api-key", b"key-2"), (b"authorization", b"Bearer key-1")], "key-1"),
+    "basic_falls_back": ([(b"authorization", b"Basic abc"), (b"x-api-key", b"key-2")], "key-2"),
+    "empty_bearer_falls_back": ([(b"authorization", b"Bearer "), (b"x-api-key", b"k2")], "k2"),
+    "first_occurrence": ([(b"x-api-key", b"key-2"), (b"x-api-key", b"key-3")], "key-2"),
+    "missing": ([(b"accept", b"*/*")], None),
+}
+
+
+@pytest.mark.parametrize(
+    ("raw_headers", "expected"), HEADER_CASES.values(), ids=HEADER_CASES.keys()
+)
+def test_api_key_from_headers(raw_headers, expected):
+    """API key extraction from raw ASGI headers keeps header precedence."""
+    assert TenantMiddleware._api_key_from_headers(raw_headers) == expected
+
+
 class TestTenantMiddleware:
     """Tests for TenantMiddleware."""
 
@@ -232,6 +339,26 @@ class TestTenantMiddleware:
         response = client.get("/health")
         assert response.status_code == 200
 
+    def test_excluded_path_skips_header_parse(self):
+        """Excluded paths never reach the tenant lookup, even with a key attached."""
+        app = FastAPI()
+        lookups: list[str] = []
+
+        @app.get("/health")
+        async def health():
+            return {"status": "ok"}
+
+        app.add_middleware(
+            TenantMiddleware,
+            tenant_lookup=lookups.append,
+            exclude_paths=["/health"],
+        )
+
+        client = TestClient(app)
+        response = client.get("/health", headers={"Authorization": "Bearer valid-api-key"})
+        assert response.status_code == 200
+        assert lookups == []
+
     def test_missing_api_key(self, app_with_middleware):
         """Test request without API key is rejected."""
         client = TestClient(app_with_middleware)
@@ -256,3 +383,26 @@ class TestTenantMiddleware:
         client = TestClient(app_with_middleware)
         response = client.get("/test", headers={"X-API-Key": "valid-api-key"})
         assert response.status_code == 200
+
+    def test_dev_mode_accepts_any_key(self):
+        """Dev mode maps every key to the dev tenant and tracks the latest key."""
+        app = FastAPI()
+
+        @app.get("/test")
+        async def test_endpoint():
+            return {"ok": True}
+
+        dev_tenant = TenantConfig(
+            tenant_id="dev-tenant",
+            name="Development",
+            tier=TenantTier.ENTERPRISE,
+            api_key="dev-api-key",
+        )
+        app.add_middleware(TenantMiddleware, dev_mode=True, dev_tenant=dev_tenant)
+
+        client = TestClient(app)
+        for key in ("first-key", "first-key", "second-key"):
+            response = client.get("/test", headers={"X-API-Key": key})
+            assert response.status_code == 200
+            assert response.headers["X-Tenant-Id"] == "dev-tenant"
+        assert dev_tenant.api_key == "second-key"
@@ -1,28 +1,35 @@
-"""Unit tests for WebSocket connection manager.
+"""Unit tests for WebSocket connection manager."""
 
-Imports are delayed after mocking spacy to avoid import chain issues.
-"""
-# ruff: noqa: E402
-
-import sys
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-# Mock spacy before any imports that might trigger it
-sys.modules["spacy"] = MagicMock()
-
+from intent_engine.api.websocket import ConnectionManager, StreamingReasoningCallback
 from intent_engine.api.ws_models import (
     STEP_DESCRIPTIONS,
+    JobUpdatePayload,
     ReasoningStep,
     WSMessage,
     WSMessageType,
 )
 from intent_engine.tenancy.models import TenantConfig, TenantTier
 
-# Import after mocking to avoid spacy import chain
-with patch.dict(sys.modules, {"spacy": MagicMock()}):
-    from intent_engine.api.websocket import ConnectionManager, StreamingReasoningCallback
+
+class _FakeWebSocket:
+    """Minimal WebSocket stand-in; cheaper than AsyncMock's call recording."""
+
+    def __init__(self) -> None:
+        self.accepted = False
+        self.sent: list[str] = []
+
+    async def accept(self) -> None:
+        self.accepted = True
+
+    async def send_text(self, data: str) -> None:
+        self.sent.append(data)
 
 
 class TestConnectionManager:
@@ -47,12 +54,12 @@ class TestConnectionManager:
     @pytest.mark.asyncio
     async def test_connect(self, manager, tenant):
         """Test accepting a new connection."""
-        mock_ws = AsyncMock()
+        mock_ws = _FakeWebSocket()
 
         connection_id = await manager.connect(mock_ws, tenant)
 
         assert connection_id is not None
-        mock_ws.accept.assert_called_once()
+        assert mock_ws.accepted is True
         assert manager.get_connection_count("ws-test") == 1
 
     @pytest.mark.asyncio
@@ -61,9 +68,9 @@ class TestConnectionManager:
         # Set a low limit
         tenant.max_websocket_connections = 2
 
-        mock_ws1 = AsyncMock()
-        mock_ws2 = AsyncMock()
-        mock_ws3 = AsyncMock()
+        mock_ws1 = _FakeWebSocket()
+        mock_ws2 = _FakeWebSocket()
+        mock_ws3 = _FakeWebSocket()
 
         await manager.connect(mock_ws1, tenant)
         await manager.connect(mock_ws2, tenant)
@@ -74,7 +81,7 @@ class TestConnectionManager:
     @pytest.mark.asyncio
     async def test_disconnect(self, manager, tenant):
         """Test disconnecting a connection."""
-        mock_ws = AsyncMock()
+        mock_ws = _FakeWebSocket()
         connection_id = await manager.connect(mock_ws, tenant)
 
         assert manager.get_connection_count("ws-test") == 1
@@ -99,6 +106,18 @@ class TestConnectionManager:
         assert result is True
         mock_ws.send_text.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_send_after_disconnect(self, manager, tenant):
+        """A disconnected connection ID no longer routes to its socket."""
+        mock_ws = _FakeWebSocket()
+        connection_id = await manager.connect(mock_ws, tenant)
+        await manager.disconnect(connection_id)
+
+        result = await manager.send_to_connection(connection_id, WSMessage(type=WSMessageType.PONG))
+
+        assert result is False
+        assert mock_ws.sent == []
+
     @pytest.mark.asyncio
     async def test_send_to_invalid_connection(self, manager):
         """Test sending to non-existent connection."""
@@ -111,8 +130,8 @@ class TestConnectionManager:
     @pytest.mark.asyncio
     async def test_broadcast_to_tenant(self, manager, tenant):
         """Test broadcasting to all tenant connections."""
-        mock_ws1 = AsyncMock()
-        mock_ws2 = AsyncMock()
+        mock_ws1 = _FakeWebSocket()
+        mock_ws2 = _FakeWebSocket()
 
         await manager.connect(mock_ws1, tenant)
         await manager.connect(mock_ws2, tenant)
@@ -125,13 +144,39 @@ class TestConnectionManager:
         sent = await manager.broadcast_to_tenant("ws-test", message)
 
         assert sent == 2
-        mock_ws1.send_text.assert_called_once()
-        mock_ws2.send_text.assert_called_once()
+        assert mock_ws1.sent == [message.model_dump_json()]
+        assert len(mock_ws2.sent) == 1
+        # Encoded once: every recipient gets the same string object
+        assert mock_ws1.sent[0] is mock_ws2.sent[0]
+
+    @pytest.mark.asyncio
+    async def test_broadcast_sends_concurrently(self, manager, tenant):
+        """A slow client doesn't hold back the others, and failures aren't counted."""
+        released = asyncio.Event()
+
+        async def wait_for_release(_payload):
+            await released.wait()
+
+        async def release(_payload):
+            released.set()
+
+        slow_ws, fast_ws, broken_ws = AsyncMock(), AsyncMock(), AsyncMock()
+        slow_ws.send_text.side_effect = wait_for_release
+        fast_ws.send_text.side_effect = release
+        broken_ws.send_text.side_effect = RuntimeError("socket closed")
+        for ws in (slow_ws, fast_ws, broken_ws):
+            await manager.connect(ws, tenant)
+
+        message = WSMessage(type=WSMessageType.JOB_UPDATE, payload={"job_id": "1"})
+        # Sequential sends would block on slow_ws forever
+        sent = await asyncio.wait_for(manager.broadcast_to_tenant("ws-test", message), 1.0)
+
+        assert sent == 2
 
     @pytest.mark.asyncio
     async def test_job_subscription(self, manager, tenant):
         """Test subscribing to job updates."""
-        mock_ws = AsyncMock()
+        mock_ws = _FakeWebSocket()
         connection_id = await manager.connect(mock_ws, tenant)
 
         await manager.subscribe_to_job(connection_id, "job-123")
@@ -144,12 +189,12 @@ class TestConnectionManager:
         )
 
         assert sent == 1
-        mock_ws.send_text.assert_called()
+        assert len(mock_ws.sent) == 1
 
     @pytest.mark.asyncio
     async def test_job_unsubscription(self, manager, tenant):
         """Test unsubscribing from job updates."""
-        mock_ws = AsyncMock()
+        mock_ws = _FakeWebSocket()
         connection_id = await manager.connect(mock_ws, tenant)
 
         await manager.subscribe_to_job(connection_id, "job-123")
@@ -163,7 +208,7 @@ class TestConnectionManager:
     @pytest.mark.asyncio
     async def test_disconnect_clears_subscriptions(self, manager, tenant):
         """Test that disconnect clears job subscriptions."""
-        mock_ws = AsyncMock()
+        mock_ws = _FakeWebSocket()
         connection_id = await manager.connect(mock_ws, tenant)
 
         await manager.subscribe_to_job(connection_id, "job-456")
@@ -174,6 +219,22 @@ class TestConnectionManager:
 
         assert sent == 0
 
+    @pytest.mark.asyncio
+    async def test_disconnect_keeps_other_subscriptions(self, manager, tenant):
+        """Disconnect drops only the leaving connection's subscriptions."""
+        leaving_id = await manager.connect(_FakeWebSocket(), tenant)
+        staying_ws = _FakeWebSocket()
+        staying_id = await manager.connect(staying_ws, tenant)
+
+        await manager.subscribe_to_job(leaving_id, "job-1")
+        await manager.subscribe_to_job(leaving_id, "job-2")
+        await manager.subscribe_to_job(staying_id, "job-1")
+        await manager.disconnect(leaving_id)
+
+        assert await manager.notify_job_subscribers("job-1", status="running") == 1
+        assert await manager.notify_job_subscribers("job-2", status="running") == 0
+        assert len(staying_ws.sent) == 1
+
 
 class TestStreamingReasoningCallback:
     """Tests for StreamingReasoningCallback."""
@@ -217,6 +278,11 @@ class TestWSModels:
         for step in ReasoningStep:
             assert step in STEP_DESCRIPTIONS, f"Missing description for {step}"
 
+    def test_step_descriptions_read_only(self):
+        """The shared description table can't be mutated at runtime."""
+        with pytest.raises(TypeError):
+            STEP_DESCRIPTIONS[ReasoningStep.COMPLETE] = "changed"  # type: ignore[index]
+
     def test_ws_message_serialization(self):
         """Test WebSocket message serialization."""
         message = WSMessage(
@@ -229,6 +295,22 @@ class TestWSModels:
         assert "test-123" in json_str
         assert "result" in json_str
 
+    def test_ws_message_wire_format(self):
+        """The encoded frame keeps enum values, nested payloads and ISO-8601 UTC stamps."""
+        message = WSMessage(
+            type=WSMessageType.JOB_UPDATE,
+            request_id="req-1",
+            payload=JobUpdatePayload(job_id="job-1", status="running", progress=0.5).model_dump(),
+            timestamp=datetime(2024, 1, 1, tzinfo=UTC),
+        )
+
+        assert json.loads(message.model_dump_json()) == {
+            "type": "job_update",
+            "request_id": "req-1",
+            "payload": {"job_id": "job-1", "status": "running", "progress": 0.5, "message": None},
+            "timestamp": "2024-01-01T00:00:00Z",
+        }
+
     def test_ws_message_type_values(self):
         """Test WebSocket message type values."""
         assert WSMessageType.RESOLVE.value == "resolve"
@@ -1,5 +1,6 @@
 """Unit tests for WooCommerce connector."""
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, patch
 
 import httpx
@@ -8,6 +9,7 @@ import pytest
 from intent_engine.integrations.base import FulfillmentStatus, OrderStatus
 from intent_engine.integrations.woocommerce.connector import WooCommerceConnector
 from intent_engine.integrations.woocommerce.mapping import (
+    TRACKING_URL_TEMPLATES,
     get_carrier_name,
     get_tracking_url,
     map_fulfillment_status,
@@ -66,6 +68,23 @@ class TestWooCommerceStatusMapping:
         """Test fulfillment status for pending orders."""
         assert map_fulfillment_status("pending") == FulfillmentStatus.UNFULFILLED
 
+    def test_map_completed_status_with_in_transit(self):
+        """Shipment status is matched case-insensitively; unknown values stay shipped."""
+        assert (
+            map_order_status("wc-completed", has_tracking=True, shipment_status="In Transit")
+            == OrderStatus.IN_TRANSIT
+        )
+        assert (
+            map_order_status("completed", has_tracking=True, shipment_status="label_created")
+            == OrderStatus.SHIPPED
+        )
+
+    def test_map_unknown_statuses_use_defaults(self):
+        """Unknown statuses fall back to processing / unfulfilled."""
+        assert map_order_status("wc-custom-status") == OrderStatus.PROCESSING
+        assert map_fulfillment_status("wc-refunded") == FulfillmentStatus.FULFILLED
+        assert map_fulfillment_status("wc-custom-status") == FulfillmentStatus.UNFULFILLED
+
 
 class TestWooCommerceCarrierMapping:
     """Tests for carrier name and tracking URL mapping."""
@@ -88,6 +107,12 @@ class TestWooCommerceCarrierMapping:
         assert "1Z999AA10123456784" in url
         assert "ups.com" in url
 
+    @pytest.mark.parametrize("carrier", TRACKING_URL_TEMPLATES.keys())
+    def test_get_tracking_url_matches_template(self, carrier):
+        """Pre-split URL parts reproduce the published template for every carrier."""
+        expected = TRACKING_URL_TEMPLATES[carrier].format(tracking_number="TN123")
+        assert get_tracking_url(f" {carrier.upper()} ", "TN123") == expected
+
     def test_get_tracking_url_unknown(self):
         """Test unknown carrier returns None."""
         assert get_tracking_url("unknown_carrier", "12345") is None
@@ -114,6 +139,33 @@ class TestWooCommerceConnector:
         """Test base URL generation."""
         assert connector.base_url == "https://test-store.com/wp-json/wc/v3"
 
+    @pytest.mark.asyncio
+    async def test_requests_carry_basic_auth(self, connector):
+        """The precomputed header matches httpx's own Basic Auth encoding."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"environment": {}})
+
+        expected = httpx.BasicAuth("ck_test", "cs_test")
+        expected_request = next(expected.auth_flow(httpx.Request("GET", connector.base_url)))
+        # Reuse the default headers the real client is built with, over a mock transport
+        headers = connector.client.headers
+        await connector.close()
+        connector._client = httpx.AsyncClient(
+            base_url=connector.base_url,
+            headers=headers,
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            assert await connector.health_check() is True
+        finally:
+            await connector.close()
+
+        assert seen[0].headers["Authorization"] == expected_request.headers["Authorization"]
+        assert seen[0].url == "https://test-store.com/wp-json/wc/v3/system_status"
+
     @pytest.mark.asyncio
     async def test_get_order(self, connector):
         """Test fetching an order."""
@@ -175,6 +227,12 @@ class TestWooCommerceConnector:
         assert dt.month == 1
         assert dt.day == 15
 
+    def test_parse_datetime_utc_suffix(self, connector):
+        """A trailing Z parses as UTC, and repeated stamps reuse the cached datetime."""
+        dt = connector._parse_datetime("2024-01-15T10:30:00Z")
+        assert dt == datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
+        assert connector._parse_datetime("2024-01-15T10:30:00Z") is dt
+
     def test_parse_datetime_none(self, connector):
         """Test datetime parsing with None."""
         assert connector._parse_datetime(None) is None
@@ -204,3 +262,23 @@ class TestWooCommerceConnector:
         assert len(tracking) == 1
         assert tracking[0].carrier == "UPS"
         assert tracking[0].tracking_number == "1Z999AA10123456784"
+
+    def test_extract_tracking_from_meta_index(self, connector):
+        """A prebuilt meta index gives the same tracking as scanning meta_data."""
+        order_data = {
+            "meta_data": [
+                {"key": "_order_number", "value": "WC-1001"},
+                {
+                    "key": "_wc_shipment_tracking_items",
+                    "value": [{"tracking_provider": "usps", "tracking_number": "9400"}],
+                },
+            ]
+        }
+
+        meta_index = connector._meta_index(order_data)
+        assert meta_index["_order_number"] == "WC-1001"
+
+        tracking = connector._extract_tracking(order_data, meta_index)
+        assert tracking == connector._extract_tracking(order_data)
+        assert tracking[0].carrier == "USPS"
+        assert tracking[0].tracking_url.endswith("tLabels=9400")